@@ -1,10 +1,17 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
+from flask_jwt_extended import JWTManager, jwt_required, get_jwt_identity
 from config.database import db, init_db
+from models.user_model import User
 from routes.auth_routes import auth_bp
 from routes.job_routes import job_bp
 from routes.resume_routes import resume_bp
+from services.parse_queue import parse_queue
+from services.parse_cache import parse_cache
+from services.nlp_models import nlp_registry
+from services.pdf_backends import get_backend_stats
+from services.prefork import memory_stats
+from services.skill_similarity import similarity_cache
 import os
 
 def create_app():
@@ -17,28 +24,56 @@ def create_app():
     app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'jwt-secret-change-in-production')
     app.config['UPLOAD_FOLDER'] = os.path.join(os.getcwd(), 'uploads')
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    app.config['PARSE_WORKERS'] = int(os.getenv('PARSE_WORKERS', '2'))  # 0 = parse on the dispatcher thread
+    app.config['PARSE_BUFFER_BYTES'] = int(os.getenv('PARSE_BUFFER_BYTES', str(64 * 1024 * 1024)))  # Queued upload bytes kept in memory
+    app.config['PARSE_CACHE_SIZE'] = int(os.getenv('PARSE_CACHE_SIZE', '256'))  # In-memory parsed resumes
+    app.config['DB_CREATE_ON_STARTUP'] = os.getenv('DB_CREATE_ON_STARTUP', 'true').lower() == 'true'  # false: run create_db.py once per deploy
     
     # Initialize extensions
     CORS(app)
     JWTManager(app)
     db.init_app(app)
+    parse_queue.init_app(app)
+    parse_cache.init_app(app)
     
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(job_bp, url_prefix='/api/jobs')
     app.register_blueprint(resume_bp, url_prefix='/api/resumes')
     
-    # Create database tables
-    with app.app_context():
-        init_db()
+    # Create database tables (skipped in production, where create_db.py does it once)
+    if app.config['DB_CREATE_ON_STARTUP']:
+        with app.app_context():
+            init_db()
     
     # Health check endpoint
     @app.route('/api/health')
     def health_check():
         return jsonify({'status': 'OK', 'message': 'Resume Parser API is running'})
     
+    # Per-process counters for dashboards (worker processes keep their own)
+    @app.route('/api/metrics')
+    @jwt_required()
+    def metrics():
+        # Exposes process ids and memory layout, so HR users only
+        user = db.session.get(User, int(get_jwt_identity()))
+        if not user or user.role != 'HR':
+            return jsonify({'error': 'Only HR users can view metrics'}), 403
+        
+        return jsonify({
+            'skill_similarity_cache': similarity_cache.stats(),
+            'pdf_backends': get_backend_stats(),
+            'nlp_pipelines': nlp_registry.stats(),
+            'process_memory': memory_stats(),
+            'parse_worker_memory': parse_queue.worker_memory()
+        })
+    
     return app
 
 if __name__ == '__main__':
     app = create_app()
+    # Only the reloader's child serves requests; start the parse queue there so
+    # resumes left queued or parsing by a previous run are recovered at startup
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        parse_queue.start()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Check and time ResumeParser text extraction on the fixture corpus
+
+Every extractor is run over tests/fixtures/resume_texts.json and compared
+with the recorded output in tests/fixtures/resume_extraction_expected.json,
+then timed over several rounds.
+
+Usage:
+    python benchmark_parser.py --rounds 20
+    python benchmark_parser.py --record   # after an intended output change
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.resume_parser import resume_parser
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'fixtures')
+CORPUS_PATH = os.path.join(FIXTURES, 'resume_texts.json')
+EXPECTED_PATH = os.path.join(FIXTURES, 'resume_extraction_expected.json')
+
+EXTRACTORS = {
+    'name': resume_parser.extract_name,
+    'contact_info': resume_parser.extract_contact_info,
+    'skills': resume_parser.extract_skills,
+    'experience': lambda text: list(resume_parser.extract_experience(text)),
+    'education': resume_parser.extract_education,
+    'projects': resume_parser.extract_projects,
+}
+
+def extract_all(text):
+    """Output of every extractor for one resume, JSON-comparable"""
+    return {field: extractor(text) for field, extractor in EXTRACTORS.items()}
+
+def load_corpus():
+    with open(CORPUS_PATH) as corpus_file:
+        return json.load(corpus_file)
+
+def check(corpus):
+    """Number of resumes whose extraction differs from the recorded output"""
+    with open(EXPECTED_PATH) as expected_file:
+        expected = json.load(expected_file)
+    mismatches = 0
+    for index, (text, recorded) in enumerate(zip(corpus, expected)):
+        actual = json.loads(json.dumps(extract_all(text)))
+        for field in EXTRACTORS:
+            if actual[field] != recorded[field]:
+                mismatches += 1
+                print(f"  resume {index}: {field} differs")
+                break
+    return mismatches
+
+def benchmark(corpus, rounds):
+    """Mean milliseconds per resume for each extractor"""
+    timings = {}
+    for field, extractor in EXTRACTORS.items():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for text in corpus:
+                extractor(text)
+        timings[field] = (time.perf_counter() - start) * 1000 / (rounds * len(corpus))
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=20, help='passes over the corpus per extractor')
+    parser.add_argument('--record', action='store_true', help='overwrite the expected output with the current one')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    if args.record:
+        with open(EXPECTED_PATH, 'w') as expected_file:
+            json.dump([extract_all(text) for text in corpus], expected_file, indent=1, sort_keys=True)
+        print(f"Recorded extraction output for {len(corpus)} resumes")
+        return
+
+    mismatches = check(corpus)
+    print(f"Equivalence: {len(corpus) - mismatches}/{len(corpus)} resumes match the recorded output")
+
+    timings = benchmark(corpus, args.rounds)
+    for field, ms in timings.items():
+        print(f"  {ms:8.3f} ms/resume  {field}")
+    print(f"  {sum(timings.values()):8.3f} ms/resume  total")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,11 @@ def init_db():
     from models.user_model import User
     from models.job_model import JobDescription
     from models.resume_model import Resume
+    from models.parse_cache_model import ParsedResumeCache
     
     db.create_all()
+    
+    # Full-text index over resumes, not a SQLAlchemy model
+    from services.resume_search import create_search_table
+    create_search_table()
     print("Database initialized successfully!")
\ No newline at end of file
@@ -1,17 +1,22 @@
 #!/usr/bin/env python3
 """Create database tables"""
 
+import os
+
+# Tables are created explicitly below, not as a side effect of create_app()
+os.environ['DB_CREATE_ON_STARTUP'] = 'false'
+
 from app import create_app
-from config.database import db
+from config.database import init_db
 
 def create_database():
     """Create all database tables"""
     app = create_app()
     
     with app.app_context():
-        # Create all tables
-        db.create_all()
+        # Create all tables and the resume search index
+        init_db()
         print("Database tables created successfully!")
 
 if __name__ == '__main__':
-    create_database()
\ No newline at end of file
+    create_database()
@@ -0,0 +1,43 @@
+"""Gunicorn settings for production
+
+Usage:
+    gunicorn -c gunicorn.conf.py
+
+The app is created and warmed up once in the master process, then forked, so
+workers share the spaCy pipeline, skills taxonomy and compiled regexes
+copy-on-write instead of each building their own. Compare private_kb and
+shared_kb under "process_memory" in /api/metrics to see what a worker costs.
+
+Resume parsing does not run in these workers. Each worker starts its own
+pool of PARSE_WORKERS parse processes (services/parse_queue.py), forked from
+a fork server that the worker launches as a fresh interpreter. The fork server
+preloads the parser, so a worker's parse processes share it with each other
+but inherit nothing from the master; "parse_worker_memory" in /api/metrics
+reports what they cost.
+"""
+
+import os
+
+wsgi_app = 'app:create_app()'
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', '4'))
+preload_app = True
+
+
+def when_ready(server):
+    """Warm up in the master, after the app is loaded and before any worker forks"""
+    from services.prefork import warm_up
+    warm_up()
+
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the master; each worker opens its own.
+
+    Then start the worker's parse queue, which re-queues resumes a previous
+    run left queued or parsing instead of waiting for the next upload.
+    """
+    from config.database import db
+    from services.parse_queue import parse_queue
+    with server.app.wsgi().app_context():
+        db.engine.dispose(close=False)
+    parse_queue.start()
@@ -4,6 +4,7 @@ Database migration script to add job analytics fields
 from config.database import db
 from models.job_model import JobDescription
 from sqlalchemy import text
+from sqlalchemy.orm import load_only
 
 def upgrade_job_analytics():
     """Add analytics fields to existing database"""
@@ -37,8 +38,11 @@ def upgrade_job_analytics():
             
             connection.commit()
         
-        # Update existing jobs with default values
-        jobs = JobDescription.query.all()
+        # Update existing jobs with default values.
+        # Only these columns: the model also maps columns added by later migrations
+        jobs = JobDescription.query.options(load_only(
+            JobDescription.created_at, JobDescription.updated_at, JobDescription.view_count
+        )).all()
         for job in jobs:
             if not hasattr(job, 'updated_at') or job.updated_at is None:
                 job.updated_at = job.created_at
@@ -0,0 +1,44 @@
+"""
+Database migration script to add compiled match profiles to job descriptions
+"""
+from config.database import db
+from models.job_model import JobDescription
+from services.job_profile import build_job_profile
+from sqlalchemy import text
+import json
+
+def upgrade_job_match_profile():
+    """Add match_profile column and compile profiles for existing jobs"""
+    try:
+        with db.engine.connect() as connection:
+            result = connection.execute(text("PRAGMA table_info(job_descriptions)"))
+            columns = [row[1] for row in result.fetchall()]
+            
+            if 'match_profile' not in columns:
+                connection.execute(text("ALTER TABLE job_descriptions ADD COLUMN match_profile TEXT"))
+                connection.commit()
+                print("Successfully added match_profile column")
+            else:
+                print("match_profile column already exists")
+        
+        jobs = JobDescription.query.all()
+        for job in jobs:
+            profile = build_job_profile(job)
+            # Explicit updated_at keeps the column's onupdate from touching it
+            JobDescription.query.filter_by(id=job.id).update(
+                {'match_profile': json.dumps(profile.to_dict()), 'updated_at': job.updated_at},
+                synchronize_session=False
+            )
+        
+        db.session.commit()
+        print(f"Successfully compiled match profiles for {len(jobs)} jobs")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        db.session.rollback()
+
+if __name__ == "__main__":
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        upgrade_job_match_profile()
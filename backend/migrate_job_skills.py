@@ -4,6 +4,7 @@ Database migration script to add skills_preferred column and update existing dat
 from config.database import db
 from models.job_model import JobDescription
 from sqlalchemy import text
+from sqlalchemy.orm import load_only
 
 def upgrade_job_model():
     """Add skills_preferred column to existing database"""
@@ -21,8 +22,11 @@ def upgrade_job_model():
             else:
                 print("skills_preferred column already exists")
         
-        # Update existing jobs to split skills between required and preferred
-        jobs = JobDescription.query.all()
+        # Update existing jobs to split skills between required and preferred.
+        # Only these columns: the model also maps columns added by later migrations
+        jobs = JobDescription.query.options(load_only(
+            JobDescription.title, JobDescription.skills_required, JobDescription.skills_preferred
+        )).all()
         for job in jobs:
             existing_skills = job.get_skills_required()
             if existing_skills and not job.skills_preferred:
@@ -0,0 +1,49 @@
+"""
+Database migration script to add the uploaded file hash to resumes
+"""
+from config.database import db
+from models.resume_model import Resume
+from services.parse_cache import hash_file
+from sqlalchemy import select, text
+import os
+
+def upgrade_resume_content_hash():
+    """Add content_hash column and backfill it from the saved files"""
+    try:
+        with db.engine.connect() as connection:
+            result = connection.execute(text("PRAGMA table_info(resumes)"))
+            columns = [row[1] for row in result.fetchall()]
+            
+            if 'content_hash' not in columns:
+                connection.execute(text("ALTER TABLE resumes ADD COLUMN content_hash VARCHAR(64)"))
+                connection.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_content_hash ON resumes (content_hash)"))
+                connection.commit()
+                print("Successfully added content_hash column")
+            else:
+                print("content_hash column already exists")
+        
+        # Backfill hashes for files still on disk. Only the columns needed are
+        # selected: the Resume model also maps columns added by later migrations
+        with db.engine.connect() as connection:
+            rows = connection.execute(
+                select(Resume.id, Resume.file_path).where(Resume.content_hash.is_(None))
+            ).fetchall()
+            updated = 0
+            for resume_id, file_path in rows:
+                if file_path and os.path.exists(file_path):
+                    # Plain SQL update, so backfilling does not touch updated_at
+                    connection.execute(text("UPDATE resumes SET content_hash = :content_hash WHERE id = :id"),
+                                       {'content_hash': hash_file(file_path), 'id': resume_id})
+                    updated += 1
+            
+            connection.commit()
+            print(f"Successfully hashed {updated} of {len(rows)} existing resumes")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        upgrade_resume_content_hash()
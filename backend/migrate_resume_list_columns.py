@@ -0,0 +1,58 @@
+"""
+Database migration script to promote filterable parsed fields to resume columns
+"""
+from config.database import db
+from sqlalchemy import text
+import json
+
+def upgrade_resume_list_columns():
+    """Add candidate_name and experience_years columns, index them and backfill"""
+    try:
+        with db.engine.connect() as connection:
+            result = connection.execute(text("PRAGMA table_info(resumes)"))
+            columns = [row[1] for row in result.fetchall()]
+            
+            if 'candidate_name' not in columns:
+                connection.execute(text("ALTER TABLE resumes ADD COLUMN candidate_name VARCHAR(100)"))
+                print("Successfully added candidate_name column")
+            else:
+                print("candidate_name column already exists")
+            
+            if 'experience_years' not in columns:
+                connection.execute(text("ALTER TABLE resumes ADD COLUMN experience_years INTEGER DEFAULT 0"))
+                print("Successfully added experience_years column")
+            else:
+                print("experience_years column already exists")
+            
+            connection.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_candidate_name_lower ON resumes (lower(candidate_name))"))
+            connection.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_experience_years ON resumes (experience_years)"))
+            connection.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_parse_status ON resumes (parse_status)"))
+            connection.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_uploaded_at ON resumes (uploaded_at)"))
+            
+            # Plain SQL updates, so backfilling does not touch updated_at
+            connection.execute(text(
+                "UPDATE resumes SET candidate_name = "
+                "(SELECT name FROM users WHERE users.id = resumes.candidate_id)"
+            ))
+            
+            rows = connection.execute(text("SELECT id, parsed_data FROM resumes")).fetchall()
+            for resume_id, parsed_data in rows:
+                try:
+                    parsed = json.loads(parsed_data) if parsed_data else {}
+                    years = parsed.get('total_experience_years') or 0
+                except (ValueError, AttributeError):
+                    years = 0
+                connection.execute(text("UPDATE resumes SET experience_years = :years WHERE id = :id"),
+                                   {'years': years, 'id': resume_id})
+            
+            connection.commit()
+            print(f"Successfully backfilled {len(rows)} resumes")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        upgrade_resume_list_columns()
@@ -0,0 +1,31 @@
+"""
+Database migration script to add the background parsing state to resumes
+"""
+from config.database import db
+from sqlalchemy import text
+
+def upgrade_resume_parse_status():
+    """Add parse_status column to existing database"""
+    try:
+        with db.engine.connect() as connection:
+            result = connection.execute(text("PRAGMA table_info(resumes)"))
+            columns = [row[1] for row in result.fetchall()]
+            
+            if 'parse_status' not in columns:
+                connection.execute(text("ALTER TABLE resumes ADD COLUMN parse_status VARCHAR(7) DEFAULT 'queued'"))
+                # Everything uploaded before the queue existed was parsed inline
+                connection.execute(text("UPDATE resumes SET parse_status = 'scored'"))
+                connection.commit()
+                print("Successfully added parse_status column")
+            else:
+                print("parse_status column already exists")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        db.session.rollback()
+
+if __name__ == "__main__":
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        upgrade_resume_parse_status()
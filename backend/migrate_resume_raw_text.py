@@ -0,0 +1,56 @@
+"""
+Database migration script to move raw_text out of parsed_data into a compressed column
+"""
+from config.database import db
+from sqlalchemy import text
+import json
+import zlib
+
+def upgrade_resume_raw_text():
+    """Add the raw_text column and move existing raw text into it"""
+    try:
+        with db.engine.connect() as connection:
+            result = connection.execute(text("PRAGMA table_info(resumes)"))
+            columns = [row[1] for row in result.fetchall()]
+            
+            if 'raw_text' not in columns:
+                connection.execute(text("ALTER TABLE resumes ADD COLUMN raw_text BLOB"))
+                print("Successfully added raw_text column")
+            else:
+                print("raw_text column already exists")
+            
+            # Plain SQL updates, so moving the text does not touch updated_at
+            rows = connection.execute(text(
+                "SELECT id, parsed_data FROM resumes WHERE parsed_data LIKE '%\"raw_text\"%'"
+            )).fetchall()
+            moved = 0
+            for resume_id, parsed_data in rows:
+                try:
+                    parsed = json.loads(parsed_data)
+                except ValueError:
+                    continue
+                if not isinstance(parsed, dict) or 'raw_text' not in parsed:
+                    continue
+                raw_text = parsed.pop('raw_text')
+                connection.execute(text(
+                    "UPDATE resumes SET parsed_data = :parsed_data, raw_text = :raw_text WHERE id = :id"
+                ), {
+                    'parsed_data': json.dumps(parsed),
+                    'raw_text': zlib.compress(raw_text.encode('utf-8')) if raw_text else None,
+                    'id': resume_id
+                })
+                moved += 1
+            
+            connection.commit()
+            print(f"Successfully moved raw text of {moved} resumes")
+            if moved:
+                print("Run VACUUM on the database to reclaim the freed space")
+        
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        upgrade_resume_raw_text()
@@ -0,0 +1,62 @@
+"""
+Database migration script to build the resume full-text search index
+"""
+from config.database import db
+from models.job_model import JobDescription
+from models.resume_model import Resume
+from models.user_model import User
+from services.resume_search import SEARCH_TABLE, build_search_document, create_search_table, search_index_available
+from sqlalchemy import select, text
+import json
+
+BATCH_SIZE = 500
+
+def upgrade_resume_search():
+    """Create the resume_search table and (re)index every existing resume"""
+    try:
+        create_search_table()
+        if not search_index_available():
+            print("Resume search index is not available on this database; search will scan instead")
+            return
+
+        # Only the columns the index needs, streamed in batches: the Resume model
+        # also maps columns added by later migrations, and parsed_data can be large
+        query = (
+            select(Resume.id, Resume.parsed_data, User.name, JobDescription.title)
+            .outerjoin(User, User.id == Resume.candidate_id)
+            .outerjoin(JobDescription, JobDescription.id == Resume.job_id)
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        insert = text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, candidate_name, skills, education, job_title) "
+            "VALUES (:resume_id, :candidate_name, :skills, :education, :job_title)"
+        )
+
+        with db.engine.connect() as connection:
+            connection.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+            indexed = 0
+            for rows in connection.execute(query).partitions():
+                documents = []
+                for resume_id, parsed_data, candidate_name, job_title in rows:
+                    try:
+                        parsed = json.loads(parsed_data) if parsed_data else {}
+                    except ValueError:
+                        parsed = {}
+                    if not isinstance(parsed, dict):
+                        parsed = {}
+                    documents.append({'resume_id': resume_id,
+                                      **build_search_document(candidate_name, job_title, parsed)})
+                connection.execute(insert, documents)
+                indexed += len(documents)
+
+            connection.commit()
+            print(f"Successfully indexed {indexed} resumes for search")
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        upgrade_resume_search()
@@ -24,6 +24,7 @@ class JobDescription(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     view_count = db.Column(db.Integer, default=0)  # Track job post views
     archived_at = db.Column(db.DateTime, nullable=True)  # Track when job was archived
+    match_profile = db.Column(db.Text, nullable=True)  # JSON of the compiled JobProfile used for scoring
     
     # Relationships
     resumes = db.relationship('Resume', backref='job', lazy=True, cascade='all, delete-orphan')
@@ -70,7 +71,20 @@ class JobDescription(db.Model):
                 return []
         return []
     
-    def to_dict(self, include_resumes=False):
+    def set_match_profile(self, profile):
+        """Store the compiled match profile as a JSON string"""
+        self.match_profile = json.dumps(profile)
+    
+    def get_match_profile(self):
+        """Convert the match profile JSON string back to a dict"""
+        if self.match_profile:
+            try:
+                return json.loads(self.match_profile)
+            except (json.JSONDecodeError, TypeError):
+                return None
+        return None
+    
+    def to_dict(self, include_resumes=False, include_resume_details=True):
         """Convert job description to dictionary"""
         result = {
             'id': self.id,
@@ -97,7 +111,8 @@ class JobDescription(db.Model):
         if include_resumes:
             active_resumes = [resume for resume in self.resumes if resume.status != 'deleted']
             result['resumes_count'] = len(active_resumes)
-            result['resumes'] = [resume.to_dict() for resume in active_resumes]
+            if include_resume_details:
+                result['resumes'] = [resume.to_dict() for resume in active_resumes]
             
             # Add analytics data
             result['applications_by_status'] = {
@@ -0,0 +1,17 @@
+from config.database import db
+from datetime import datetime
+
+class ParsedResumeCache(db.Model):
+    __tablename__ = 'parsed_resume_cache'
+    __table_args__ = (
+        db.UniqueConstraint('content_hash', 'parser_version', name='uq_parse_cache_key'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    content_hash = db.Column(db.String(64), nullable=False)  # SHA-256 of the uploaded file bytes
+    parser_version = db.Column(db.String(20), nullable=False)
+    parsed_data = db.Column(db.Text, nullable=False)  # JSON string of parsed resume data
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ParsedResumeCache {self.content_hash[:12]} v{self.parser_version}>'
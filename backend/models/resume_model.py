@@ -1,6 +1,7 @@
 from config.database import db
 from datetime import datetime
 import json
+import zlib
 
 class Resume(db.Model):
     __tablename__ = 'resumes'
@@ -12,40 +13,96 @@ class Resume(db.Model):
     file_path = db.Column(db.String(500), nullable=False)
     resume_text = db.Column(db.Text, nullable=True)
     parsed_data = db.Column(db.Text, nullable=True)  # JSON string of parsed resume data
+    raw_text = db.deferred(db.Column(db.LargeBinary, nullable=True))  # zlib-compressed extracted text
+    candidate_name = db.Column(db.String(100), nullable=True)  # Copied from the candidate for sorting
+    experience_years = db.Column(db.Integer, nullable=True, default=0, index=True)  # From parsed_data
+    content_hash = db.Column(db.String(64), nullable=True, index=True)  # SHA-256 of the uploaded file
     match_score = db.Column(db.Float, nullable=True, default=0.0)
     status = db.Column(db.Enum('pending', 'shortlisted', 'rejected', 'deleted', name='resume_status'), 
                       default='pending')
-    uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
+    parse_status = db.Column(db.Enum('queued', 'parsing', 'scored', 'failed', name='resume_parse_status'),
+                            default='queued', index=True)
+    uploaded_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_resumes_candidate_name_lower', db.func.lower(candidate_name)),
+    )
+    
     def set_parsed_data(self, parsed_dict):
         """Convert parsed data dictionary to JSON string"""
         if parsed_dict:
+            # The extracted text is stored on its own, most readers never need it
+            if 'raw_text' in parsed_dict:
+                parsed_dict = dict(parsed_dict)
+                self.set_raw_text(parsed_dict.pop('raw_text'))
             self.parsed_data = json.dumps(parsed_dict)
+            self.experience_years = parsed_dict.get('total_experience_years') or 0
+            self._parsed_cache = (self.parsed_data, parsed_dict)
     
     def get_parsed_data(self):
-        """Convert JSON string back to parsed data dictionary"""
-        if self.parsed_data:
-            try:
-                return json.loads(self.parsed_data)
-            except:
-                return {}
-        return {}
-    
-    def to_dict(self, include_job_details=False):
+        """Convert JSON string back to parsed data dictionary.
+        
+        Decoded once per instance and shared by every caller, so copy the dict
+        before changing it unless it is passed straight to set_parsed_data.
+        """
+        if not self.parsed_data:
+            return {}
+        
+        # Keyed on the JSON string itself, so reloads and direct assignments re-decode
+        cached = getattr(self, '_parsed_cache', None)
+        if cached is not None and cached[0] is self.parsed_data:
+            return cached[1]
+        
+        try:
+            parsed = json.loads(self.parsed_data)
+        except:
+            parsed = {}
+        self._parsed_cache = (self.parsed_data, parsed)
+        return parsed
+    
+    def get_skills(self):
+        """Skills extracted from the resume"""
+        return self.get_parsed_data().get('skills', [])
+    
+    def get_education(self):
+        """Education entries extracted from the resume"""
+        return self.get_parsed_data().get('education', [])
+    
+    def get_experience_years(self):
+        """Total years of experience, read from its column without decoding parsed_data"""
+        if self.experience_years is not None:
+            return self.experience_years
+        return self.get_parsed_data().get('total_experience_years', 0)
+    
+    def set_raw_text(self, text):
+        """Compress and store the text extracted from the resume file"""
+        self.raw_text = zlib.compress(text.encode('utf-8')) if text else None
+    
+    def get_raw_text(self):
+        """Extracted resume text; loads the deferred column on first access"""
+        if self.raw_text:
+            return zlib.decompress(self.raw_text).decode('utf-8')
+        return ''
+    
+    def to_dict(self, include_job_details=False, include_parsed_data=True, include_raw_text=False):
         """Convert resume to dictionary"""
         result = {
             'id': self.id,
             'candidate_id': self.candidate_id,
             'job_id': self.job_id,
             'filename': self.filename,
-            'parsed_data': self.get_parsed_data(),
+            'parsed_data': self.get_parsed_data() if include_parsed_data else None,
             'match_score': self.match_score,
             'status': self.status,
+            'parse_status': self.parse_status,
             'uploaded_at': self.uploaded_at.isoformat() if self.uploaded_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
         
+        if include_raw_text:
+            result['raw_text'] = self.get_raw_text()
+        
         if include_job_details and self.job:
             result['job_title'] = self.job.title
             result['company'] = self.job.company
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Bulk-parse resume files on a process pool and write the results as JSON lines
+
+Usage:
+    python parse_resumes.py uploads/agency_dump --workers 8 --output parsed.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.resume_parser import resume_parser
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+def collect_paths(inputs):
+    """Expand files and directories into resume file paths"""
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, _, filenames in os.walk(path):
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                        yield os.path.join(root, filename)
+        else:
+            yield path
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('paths', nargs='+', help='Resume files or directories to scan')
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help='Worker processes (default: number of CPUs)')
+    arg_parser.add_argument('--output', default='-', help='JSON lines output file (default: stdout)')
+    args = arg_parser.parse_args()
+    
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    started = time.time()
+    parsed_count = 0
+    failed_count = 0
+    
+    try:
+        for file_path, parsed_data in resume_parser.parse_many(collect_paths(args.paths), workers=args.workers):
+            output.write(json.dumps({'file': file_path, 'parsed_data': parsed_data}) + '\n')
+            parsed_count += 1
+            if parsed_data.get('parsing_status') != 'success':
+                failed_count += 1
+                print(f"❌ {file_path}: {parsed_data.get('error', 'unknown error')}", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    elapsed = time.time() - started
+    print(f"Parsed {parsed_count} files ({failed_count} failed) in {elapsed:.1f}s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,8 @@ from config.database import db
 from models.resume_model import Resume
 from models.job_model import JobDescription
 from models.user_model import User
-from services.enhanced_job_matcher import EnhancedJobMatcher
-import json
+from services.enhanced_job_matcher import enhanced_job_matcher
+from services.job_profile import get_job_profile
 
 def recalculate_all_scores():
     """Recalculate match scores for all resumes using enhanced algorithm"""
@@ -15,49 +15,45 @@ def recalculate_all_scores():
         resumes = Resume.query.filter(Resume.status != 'deleted').all()
         updated_count = 0
         
-        matcher = EnhancedJobMatcher()
-        
+        # Group resumes by job so each job is scored in a single batch
+        resumes_by_job = {}
         for resume in resumes:
+            job = resume.job
+            if not job:
+                print(f"No job found for resume {resume.id}")
+                continue
+            
+            # Get resume data - convert from JSON string to dict
+            resume_data = resume.get_parsed_data()  # This returns a dict
+            
+            if not resume_data:
+                print(f"No parsed data for resume {resume.id}")
+                continue
+            
+            resumes_by_job.setdefault(job.id, (job, []))[1].append((resume, resume_data))
+        
+        for job, entries in resumes_by_job.values():
             try:
-                # Get job data
-                job = resume.job
-                if not job:
-                    print(f"No job found for resume {resume.id}")
-                    continue
-                
-                # Get candidate name from user relationship
-                candidate = User.query.get(resume.candidate_id)
-                candidate_name = candidate.name if candidate else 'Unknown'
-                
-                job_data = {
-                    'skills_required': job.get_skills_required() or [],
-                    'skills_preferred': job.get_skills_preferred() or [],
-                    'extracted_skills': job.get_skills() or [],
-                    'experience_required': job.experience_required or '',
-                    'title': job.title
-                }
-                
-                # Get resume data - convert from JSON string to dict
-                resume_data = resume.get_parsed_data()  # This returns a dict
-                
-                if not resume_data:
-                    print(f"No parsed data for resume {resume.id}")
-                    continue
-                
-                # Calculate enhanced match score
-                match_result = matcher.calculate_overall_match_score(resume_data, job_data)
-                
+                # Same compiled job profile the upload pipeline scores against
+                job_profile = get_job_profile(job)
+                match_results = enhanced_job_matcher.score_batch(
+                    job_profile, [resume_data for _, resume_data in entries]
+                )
+            except Exception as e:
+                print(f"Failed to score resumes for job {job.id}: {e}")
+                import traceback
+                traceback.print_exc()
+                continue
+            
+            for (resume, _), match_result in zip(entries, match_results):
                 # Update the resume with new match score
                 resume.match_score = match_result['overall_score']
                 updated_count += 1
                 
+                # Get candidate name from user relationship
+                candidate = User.query.get(resume.candidate_id)
+                candidate_name = candidate.name if candidate else 'Unknown'
                 print(f"Updated {candidate_name} for {job.title}: {match_result['overall_score']}%")
-                
-            except Exception as e:
-                print(f"Failed to update resume {resume.id}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
         
         # Commit all changes
         db.session.commit()
@@ -4,6 +4,10 @@ from models.user_model import User
 from models.job_model import JobDescription
 from models.resume_model import Resume
 from config.database import db
+from services.job_profile import job_profile_cache
+from services.resume_search import reindex_job_title
+from utils.pagination import keyset_paginate, page_items, parse_fields, wants
+from sqlalchemy.orm import defer
 from datetime import datetime
 
 job_bp = Blueprint('jobs', __name__)
@@ -53,6 +57,9 @@ def create_job():
         if isinstance(skills_preferred, list):
             job.set_skills_preferred(skills_preferred)
         
+        # Compile the job side of matching once, not once per applicant
+        job_profile_cache.refresh(job)
+        
         db.session.add(job)
         db.session.commit()
         
@@ -79,25 +86,39 @@ def list_jobs():
         
         # Get query parameters
         include_archived = request.args.get('include_archived', 'false').lower() == 'true'
+        limit = request.args.get('limit', type=int)
+        cursor = request.args.get('cursor')
+        fields = parse_fields(request.args.get('fields'))
         
         # HR sees jobs they created, Candidates see all active jobs
         if user.role == 'HR':
             query = JobDescription.query.filter_by(created_by=user_id)
             if not include_archived:
                 query = query.filter_by(is_active=True)
-            jobs = query.order_by(JobDescription.created_at.desc()).all()
         else:
-            jobs = JobDescription.query.filter_by(
-                is_active=True
-            ).order_by(JobDescription.created_at.desc()).all()
+            query = JobDescription.query.filter_by(is_active=True)
+        
+        active_count = query.filter(JobDescription.is_active.is_(True)).count()
+        archived_count = query.filter(JobDescription.is_active.is_(False)).count()
+        
+        try:
+            jobs, next_cursor = keyset_paginate(query, JobDescription.created_at, JobDescription.id,
+                                                cursor=cursor, limit=limit)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        jobs_list = [job.to_dict(include_resumes=True) for job in jobs]
+        # Application stats, and the applications themselves, only when asked for
+        include_resumes = wants(fields, 'resumes', 'resumes_count', 'applications_by_status', 'avg_match_score')
+        jobs_list = page_items((job.to_dict(include_resumes=include_resumes,
+                                            include_resume_details=wants(fields, 'resumes'))
+                                for job in jobs), fields)
         
         return jsonify({
             'jobs': jobs_list,
-            'total': len(jobs_list),
-            'active_count': len([j for j in jobs if j.is_active]),
-            'archived_count': len([j for j in jobs if not j.is_active])
+            'total': active_count + archived_count,
+            'active_count': active_count,
+            'archived_count': archived_count,
+            'next_cursor': next_cursor
         }), 200
         
     except Exception as e:
@@ -164,6 +185,7 @@ def update_job(job_id):
         # Update job fields
         if 'title' in data:
             job.title = data['title']
+            reindex_job_title(job)
         if 'company' in data:
             job.company = data['company']
         if 'description_text' in data:
@@ -191,6 +213,7 @@ def update_job(job_id):
         
         # Update timestamp
         job.updated_at = datetime.utcnow()
+        job_profile_cache.refresh(job)
         
         db.session.commit()
         
@@ -298,17 +321,14 @@ def get_job_analytics(job_id):
             experience_years = []
             
             for resume in resumes:
-                parsed_data = resume.get_parsed_data()
-                if parsed_data:
-                    # Count skills
-                    skills = parsed_data.get('skills', [])
-                    for skill in skills:
-                        skills_count[skill] = skills_count.get(skill, 0) + 1
-                    
-                    # Collect experience years
-                    exp_years = parsed_data.get('total_experience_years', 0)
-                    if exp_years:
-                        experience_years.append(exp_years)
+                # Count skills
+                for skill in resume.get_skills():
+                    skills_count[skill] = skills_count.get(skill, 0) + 1
+                
+                # Collect experience years (a column, no JSON decoding)
+                exp_years = resume.get_experience_years()
+                if exp_years:
+                    experience_years.append(exp_years)
             
             # Top 10 skills
             top_skills = sorted(skills_count.items(), key=lambda x: x[1], reverse=True)[:10]
@@ -331,10 +351,10 @@ def get_job_analytics(job_id):
 
 @job_bp.route('/<int:job_id>/resumes', methods=['GET'])
 @jwt_required()
-def get_job_resumes():
+def get_job_resumes(job_id):
     """Get all resumes for a specific job (HR only)"""
     try:
-        user_id = get_jwt_identity()
+        user_id = int(get_jwt_identity())
         user = User.query.get(user_id)
         
         # Check if user is HR
@@ -349,21 +369,35 @@ def get_job_resumes():
         if job.created_by != user_id:
             return jsonify({'error': 'Access denied'}), 403
         
-        # Get resumes sorted by match score (highest first)
-        resumes = Resume.query.filter_by(
+        limit = request.args.get('limit', type=int)
+        cursor = request.args.get('cursor')
+        fields = parse_fields(request.args.get('fields'))
+        include_parsed_data = wants(fields, 'parsed_data')
+        
+        query = Resume.query.filter_by(
             job_id=job_id
         ).filter(
             Resume.status != 'deleted'
-        ).order_by(
-            Resume.match_score.desc()
-        ).all()
+        )
+        total = query.count()
+        if not include_parsed_data:
+            query = query.options(defer(Resume.parsed_data))
+        
+        # Get resumes sorted by match score (highest first)
+        try:
+            resumes, next_cursor = keyset_paginate(query, db.func.coalesce(Resume.match_score, 0.0), Resume.id,
+                                                   cursor=cursor, limit=limit)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        resumes_list = [resume.to_dict(include_job_details=True) for resume in resumes]
+        resumes_list = page_items((resume.to_dict(include_job_details=True, include_parsed_data=include_parsed_data)
+                                   for resume in resumes), fields)
         
         return jsonify({
             'job': job.to_dict(),
             'resumes': resumes_list,
-            'total': len(resumes_list)
+            'total': total,
+            'next_cursor': next_cursor
         }), 200
         
     except Exception as e:
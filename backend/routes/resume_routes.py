@@ -7,8 +7,14 @@ from config.database import db
 import os
 from datetime import datetime
 from werkzeug.utils import secure_filename
-from services.resume_parser import resume_parser, job_matcher
 from services.enhanced_job_matcher import enhanced_job_matcher
+from services.job_index import job_skill_index
+from services.job_profile import get_job_profile
+from services.parse_queue import parse_queue
+from services.parse_cache import hash_bytes
+from services.resume_search import index_resume, search_resume_ids, skill_resume_ids
+from utils.pagination import keyset_paginate, page_items, parse_fields, wants
+from sqlalchemy.orm import defer
 
 resume_bp = Blueprint('resumes', __name__)
 
@@ -75,68 +81,134 @@ def upload_resume():
         filename = f"{user_id}_{job_id}_{timestamp}_{filename}"
         file_path = os.path.join(upload_folder, filename)
         
-        # Save file
-        file.save(file_path)
+        # Read the upload once: the same buffer is saved, hashed and parsed
+        content = file.read()
+        with open(file_path, 'wb') as saved_file:
+            saved_file.write(content)
         
-        # Parse resume using our parsing service
-        try:
-            parsed_data = resume_parser.parse_resume(file_path)
-            
-            # Calculate match score with enhanced job matcher
-            job_data = {
-                'skills_required': job.get_skills_required() or [],
-                'skills_preferred': job.get_skills_preferred() or [],
-                'extracted_skills': job.get_skills() or [],
-                'experience_required': job.experience_required or '',
-                'requirements': job.requirements or '',
-                'description_text': job.description_text or ''
-            }
-            
-            # Use enhanced matcher for detailed scoring
-            match_result = enhanced_job_matcher.calculate_overall_match_score(parsed_data, job_data)
-            match_score = match_result.get('overall_score', 0.0)
-            
-            # Store detailed match information
-            parsed_data['match_details'] = match_result
-            
-        except Exception as parsing_error:
-            print(f"Parsing error: {parsing_error}")
-            # If parsing fails, continue with empty data
-            parsed_data = {
-                'raw_text': '',
-                'skills': [],
-                'experience': [],
-                'education': [],
-                'total_experience_years': 0,
-                'parsing_status': 'failed'
-            }
-            match_score = 0
-        
-        # Create resume record with parsed data
+        # Create resume record; parsing and scoring happen on the worker pool
         resume = Resume(
             candidate_id=user_id,
             job_id=job_id,
             filename=filename,
             file_path=file_path,
-            match_score=match_score,
-            status='pending'
+            candidate_name=user.name,
+            content_hash=hash_bytes(content),
+            match_score=0.0,
+            status='pending',
+            parse_status='queued'
         )
         
-        # Use the model method to properly serialize parsed_data
-        resume.set_parsed_data(parsed_data)
-        
         db.session.add(resume)
+        db.session.flush()
+        
+        # Searchable by candidate name and job title right away; skills follow once parsed
+        index_resume(resume, {})
         db.session.commit()
         
+        parse_queue.submit(resume.id, content)
+        
         return jsonify({
-            'message': 'Resume uploaded successfully',
+            'message': 'Resume uploaded successfully, analysis in progress',
             'resume': resume.to_dict(include_job_details=True)
-        }), 201
+        }), 202
         
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': f'Failed to upload resume: {str(e)}'}), 500
 
+@resume_bp.route('/<int:resume_id>/parse-status', methods=['GET'])
+@jwt_required()
+def get_parse_status(resume_id):
+    """Poll background parsing progress for an uploaded resume"""
+    try:
+        # Convert string identity back to int
+        user_id = int(get_jwt_identity())
+        user = User.query.get(user_id)
+        
+        if not user:
+            return jsonify({'error': 'User not found'}), 404
+        
+        resume = Resume.query.get(resume_id)
+        if not resume:
+            return jsonify({'error': 'Resume not found'}), 404
+        
+        # Candidates poll their own uploads, HR polls resumes for their jobs
+        if user.role == 'Candidate' and resume.candidate_id != user_id:
+            return jsonify({'error': 'Access denied'}), 403
+        if user.role == 'HR' and resume.job.created_by != user_id:
+            return jsonify({'error': 'Access denied'}), 403
+        
+        # Make sure rows queued before a restart are being worked on
+        if resume.parse_status in ('queued', 'parsing'):
+            parse_queue.start()
+        
+        result = {
+            'resume_id': resume.id,
+            'parse_status': resume.parse_status,
+            'match_score': resume.match_score
+        }
+        if resume.parse_status == 'scored':
+            result['resume'] = resume.to_dict(include_job_details=True)
+        
+        return jsonify(result), 200
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to get parse status: {str(e)}'}), 500
+
+@resume_bp.route('/<int:resume_id>/recommended-jobs', methods=['GET'])
+@jwt_required()
+def get_recommended_jobs(resume_id):
+    """Rank active jobs for one of the candidate's parsed resumes"""
+    try:
+        # Convert string identity back to int
+        user_id = int(get_jwt_identity())
+        user = User.query.get(user_id)
+        
+        if not user or user.role != 'Candidate':
+            return jsonify({'error': 'Only candidates can get job recommendations'}), 403
+        
+        resume = Resume.query.get(resume_id)
+        if not resume or resume.candidate_id != user_id:
+            return jsonify({'error': 'Resume not found'}), 404
+        
+        parsed_data = resume.get_parsed_data()
+        if resume.parse_status != 'scored' or not parsed_data:
+            return jsonify({'error': 'Resume has not been analyzed yet'}), 409
+        
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+        
+        # Only jobs sharing a canonical skill with the resume are scored
+        ranked = job_skill_index.recommend(parsed_data, limit)
+        jobs = {job.id: job for job in JobDescription.query.filter(
+            JobDescription.id.in_([job_id for job_id, _ in ranked])
+        ).all()}
+        applied_job_ids = {job_id for (job_id,) in db.session.query(Resume.job_id).filter(
+            Resume.candidate_id == user_id, Resume.status != 'deleted'
+        ).all()}
+        
+        recommendations = []
+        for job_id, match_result in ranked:
+            job = jobs.get(job_id)
+            if not job:
+                continue
+            recommendations.append({
+                'job': job.to_dict(),
+                'match_score': match_result.get('overall_score', 0.0),
+                'recommendation': match_result.get('recommendation'),
+                'matched_skills': match_result.get('skills', {}).get('matched_skills', []),
+                'already_applied': job_id in applied_job_ids
+            })
+        
+        return jsonify({
+            'resume_id': resume.id,
+            'recommendations': recommendations,
+            'total': len(recommendations)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to get job recommendations: {str(e)}'}), 500
+
 @resume_bp.route('/my-applications', methods=['GET'])
 @jwt_required()
 def get_my_applications():
@@ -150,20 +222,34 @@ def get_my_applications():
         if not user or user.role != 'Candidate':
             return jsonify({'error': 'Only candidates can view their applications'}), 403
         
-        # Get all resumes by this candidate
-        resumes = Resume.query.filter_by(
+        limit = request.args.get('limit', type=int)
+        cursor = request.args.get('cursor')
+        fields = parse_fields(request.args.get('fields'))
+        include_parsed_data = wants(fields, 'parsed_data')
+        
+        query = Resume.query.filter_by(
             candidate_id=user_id
         ).filter(
             Resume.status != 'deleted'
-        ).order_by(
-            Resume.uploaded_at.desc()
-        ).all()
+        )
+        total = query.count()
+        if not include_parsed_data:
+            query = query.options(defer(Resume.parsed_data))
         
-        applications = [resume.to_dict(include_job_details=True) for resume in resumes]
+        # Get resumes by this candidate, newest first
+        try:
+            resumes, next_cursor = keyset_paginate(query, Resume.uploaded_at, Resume.id,
+                                                   cursor=cursor, limit=limit)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        applications = page_items((resume.to_dict(include_job_details=True, include_parsed_data=include_parsed_data)
+                                   for resume in resumes), fields)
         
         return jsonify({
             'applications': applications,
-            'total': len(applications)
+            'total': total,
+            'next_cursor': next_cursor
         }), 200
         
     except Exception as e:
@@ -193,6 +279,10 @@ def list_resumes():
         quick_filter = request.args.get('quick_filter', '')  # top_candidates, recent_applications
         sort_by = request.args.get('sort_by', 'uploaded_at')  # uploaded_at, match_score, candidate_name
         sort_order = request.args.get('sort_order', 'desc')  # asc, desc
+        skills_filter = [skill.strip() for skill in request.args.get('skills', '').split(',') if skill.strip()]
+        limit = request.args.get('limit', type=int)
+        cursor = request.args.get('cursor')
+        fields = parse_fields(request.args.get('fields'))
 
         # Start with base query
         query = Resume.query.filter(Resume.status != 'deleted')
@@ -211,93 +301,79 @@ def list_resumes():
         if max_match_score is not None:
             query = query.filter(Resume.match_score <= max_match_score)
             
-        # Get all matching resumes
-        resumes = query.all()
-        
-        # Convert to dictionaries with full details
-        resume_list = []
-        for resume in resumes:
-            resume_dict = resume.to_dict(include_job_details=True)
-            parsed_data = resume_dict['parsed_data'] or {}
-            
-            # Add computed fields for easier filtering
-            resume_dict['total_experience_years'] = parsed_data.get('total_experience_years', 0)
-            resume_dict['skills'] = parsed_data.get('skills', [])
-            resume_dict['education'] = parsed_data.get('education', [])
-            resume_dict['candidate_name'] = resume_dict.get('candidate_name', '')
-            
-            resume_list.append(resume_dict)
+        total_before_filters = query.count()
         
-        # Apply search query filter (after getting parsed data)
+        # Search and skill filters run against the full-text index
         if search_query:
-            filtered_resumes = []
-            for resume in resume_list:
-                # Search in candidate name
-                if search_query in resume['candidate_name'].lower():
-                    filtered_resumes.append(resume)
-                    continue
-                
-                # Search in skills
-                skills = resume.get('skills', [])
-                if any(search_query in skill.lower() for skill in skills):
-                    filtered_resumes.append(resume)
-                    continue
-                    
-                # Search in job title
-                if search_query in (resume.get('job_title', '')).lower():
-                    filtered_resumes.append(resume)
-                    continue
-                    
-                # Search in education
-                education = resume.get('education', [])
-                for edu in education:
-                    if isinstance(edu, dict):
-                        edu_text = f"{edu.get('degree', '')} {edu.get('field', '')} {edu.get('institution', '')}".lower()
-                        if search_query in edu_text:
-                            filtered_resumes.append(resume)
-                            break
-                            
-            resume_list = filtered_resumes
+            query = query.filter(Resume.id.in_(search_resume_ids(search_query)))
+        if skills_filter:
+            query = query.filter(Resume.id.in_(skill_resume_ids(skills_filter)))
         
         # Apply experience range filter
-        if min_experience is not None or max_experience is not None:
-            filtered_resumes = []
-            for resume in resume_list:
-                exp_years = resume.get('total_experience_years', 0)
-                if min_experience is not None and exp_years < min_experience:
-                    continue
-                if max_experience is not None and exp_years > max_experience:
-                    continue
-                filtered_resumes.append(resume)
-            resume_list = filtered_resumes
+        if min_experience is not None:
+            query = query.filter(Resume.experience_years >= min_experience)
+        if max_experience is not None:
+            query = query.filter(Resume.experience_years <= max_experience)
         
         # Apply quick filters
         if quick_filter == 'top_candidates':
             # Top 20% by match score or minimum 70% match
-            if resume_list:
-                min_score = max(70.0, sorted([r['match_score'] for r in resume_list], reverse=True)[int(len(resume_list) * 0.2)] if len(resume_list) > 5 else 70.0)
-                resume_list = [r for r in resume_list if r['match_score'] >= min_score]
+            matching = query.count()
+            min_score = 70.0
+            if matching > 5:
+                cutoff = query.with_entities(Resume.match_score).order_by(
+                    Resume.match_score.desc()
+                ).offset(int(matching * 0.2)).limit(1).scalar()
+                min_score = max(min_score, cutoff or 0.0)
+            query = query.filter(Resume.match_score >= min_score)
         elif quick_filter == 'recent_applications':
             # Applications from last 7 days
-            from datetime import datetime, timedelta
+            from datetime import timedelta
             seven_days_ago = datetime.utcnow() - timedelta(days=7)
-            resume_list = [r for r in resume_list if datetime.fromisoformat(r['uploaded_at'].replace('Z', '+00:00')) > seven_days_ago]
-        
-        # Apply sorting
-        reverse_order = sort_order == 'desc'
-        if sort_by == 'match_score':
-            resume_list.sort(key=lambda x: x['match_score'] or 0, reverse=reverse_order)
-        elif sort_by == 'candidate_name':
-            resume_list.sort(key=lambda x: x['candidate_name'].lower(), reverse=reverse_order)
-        elif sort_by == 'uploaded_at':
-            resume_list.sort(key=lambda x: x['uploaded_at'] or '', reverse=reverse_order)
-        elif sort_by == 'experience':
-            resume_list.sort(key=lambda x: x.get('total_experience_years', 0), reverse=reverse_order)
+            query = query.filter(Resume.uploaded_at > seven_days_ago)
+        
+        total = query.count()
+        
+        # Parsed data is only read when a requested field is derived from it
+        include_parsed_data = wants(fields, 'parsed_data', 'skills', 'education')
+        if not include_parsed_data:
+            query = query.options(defer(Resume.parsed_data))
+        
+        # Sort keys, with missing values ordered like zero / empty
+        sort_keys = {
+            'match_score': db.func.coalesce(Resume.match_score, 0.0),
+            'candidate_name': db.func.lower(db.func.coalesce(Resume.candidate_name, '')),
+            'uploaded_at': Resume.uploaded_at,
+            'experience': db.func.coalesce(Resume.experience_years, 0)
+        }
+        
+        # Only the requested page is loaded; the id breaks ties so pages are stable
+        try:
+            resumes, next_cursor = keyset_paginate(query, sort_keys.get(sort_by, Resume.uploaded_at), Resume.id,
+                                                   cursor=cursor, limit=limit, descending=sort_order == 'desc')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Convert to dictionaries with full details
+        resume_list = []
+        for resume in resumes:
+            resume_dict = resume.to_dict(include_job_details=True, include_parsed_data=include_parsed_data)
+            
+            # Add computed fields for easier filtering
+            resume_dict['total_experience_years'] = resume.get_experience_years()
+            resume_dict['skills'] = resume.get_skills() if include_parsed_data else []
+            resume_dict['education'] = resume.get_education() if include_parsed_data else []
+            resume_dict['candidate_name'] = resume_dict.get('candidate_name', '')
+            
+            resume_list.append(resume_dict)
+        resume_list = page_items(resume_list, fields)
         
         return jsonify({
             'resumes': resume_list,
             'count': len(resume_list),
-            'total_before_filters': len(resumes)
+            'total': total,
+            'total_before_filters': total_before_filters,
+            'next_cursor': next_cursor
         }), 200
         
     except Exception as e:
@@ -379,7 +455,8 @@ def update_resume_status(resume_id):
 def get_resume_details(resume_id):
     """Get detailed resume information"""
     try:
-        user_id = get_jwt_identity()
+        # Convert string identity back to int
+        user_id = int(get_jwt_identity())
         user = User.query.get(user_id)
         
         if not user:
@@ -399,8 +476,11 @@ def get_resume_details(resume_id):
             if resume.job.created_by != user_id:
                 return jsonify({'error': 'Access denied'}), 403
         
+        # The extracted text is large and only sent on request
+        include_raw_text = request.args.get('include_raw_text', 'false').lower() == 'true'
+        
         return jsonify({
-            'resume': resume.to_dict(include_job_details=True)
+            'resume': resume.to_dict(include_job_details=True, include_raw_text=include_raw_text)
         }), 200
         
     except Exception as e:
@@ -414,54 +494,63 @@ def recalculate_all_match_scores():
         current_user_id = get_jwt_identity()
         user = User.query.get(current_user_id)
         
-        if user.role != 'hr':
+        if not user or user.role != 'HR':
             return jsonify({'error': 'Unauthorized. HR access required.'}), 403
         
         # Get all resumes
         resumes = Resume.query.filter(Resume.status != 'deleted').all()
         updated_count = 0
         
+        # Group by job so each job's applicants are scored in one batch
+        resumes_by_job = {}
         for resume in resumes:
+            if not resume.job:
+                continue
+            # Get parsed resume data
+            parsed_data = resume.get_parsed_data()
+            if not parsed_data:
+                continue
+            resumes_by_job.setdefault(resume.job_id, (resume.job, []))[1].append((resume, parsed_data))
+        
+        failed_count = 0
+        for job, entries in resumes_by_job.values():
             try:
-                # Get job data
-                job = resume.job
-                if not job:
-                    continue
-                
-                job_data = {
-                    'skills_required': job.get_skills_required() or [],
-                    'skills_preferred': job.get_skills_preferred() or [],
-                    'extracted_skills': job.get_skills() or [],
-                    'experience_required': job.experience_required or '',
-                    'requirements': job.requirements or '',
-                    'description_text': job.description_text or ''
-                }
-                
-                # Get parsed resume data
-                parsed_data = resume.get_parsed_data()
-                if not parsed_data:
+                # Compiled once per job and reused for all of its applicants
+                job_profile = get_job_profile(job)
+            except Exception as e:
+                print(f"Error compiling job {job.id}: {e}")
+                failed_count += len(entries)
+                continue
+            
+            parsed_resumes = [parsed_data for _, parsed_data in entries]
+            try:
+                match_results = enhanced_job_matcher.score_batch(job_profile, parsed_resumes)
+            except Exception as e:
+                # One bad resume must not cost the rest of the job its scores
+                print(f"Error batch scoring resumes for job {job.id}, scoring one by one: {e}")
+                match_results = [enhanced_job_matcher.score_profile(parsed_data, job_profile)
+                                 for parsed_data in parsed_resumes]
+            
+            for (resume, parsed_data), match_result in zip(entries, match_results):
+                if 'error' in match_result:
+                    # Keep the previous score rather than overwrite it with 0
+                    print(f"Error updating resume {resume.id}: {match_result['error']}")
+                    failed_count += 1
                     continue
                 
-                # Calculate new match score
-                match_result = enhanced_job_matcher.calculate_overall_match_score(parsed_data, job_data)
-                new_score = match_result.get('overall_score', 0.0)
-                
                 # Update resume with new score and match details
-                resume.match_score = new_score
+                resume.match_score = match_result.get('overall_score', 0.0)
                 parsed_data['match_details'] = match_result
                 resume.set_parsed_data(parsed_data)
                 
                 updated_count += 1
-                
-            except Exception as e:
-                print(f"Error updating resume {resume.id}: {e}")
-                continue
         
         db.session.commit()
         
         return jsonify({
             'message': f'Successfully recalculated match scores for {updated_count} resumes',
             'updated_count': updated_count,
+            'failed_count': failed_count,
             'total_resumes': len(resumes)
         })
         
@@ -568,7 +657,7 @@ def compare_resumes():
                     education_level = str(education_list)
             
             # Extract experience properly
-            experience_years = parsed_data.get('total_experience_years', 0)
+            experience_years = resume.get_experience_years()
             experience_list = parsed_data.get('experience', [])
             
             # Extract contact info properly
@@ -698,7 +787,7 @@ def get_ranked_candidates(job_id):
                     education_level = str(education_list)
             
             # Extract experience properly
-            experience_years = parsed_data.get('total_experience_years', 0)
+            experience_years = resume.get_experience_years()
             skills = parsed_data.get('skills', [])
             
             candidate_data = {
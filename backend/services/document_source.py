@@ -0,0 +1,87 @@
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+# A resume can be handed to the parser as a file path or as the upload's bytes
+DocumentSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap]
+
+# Leading bytes of the formats we accept
+_MAGIC_NUMBERS = {
+    b'%PDF': '.pdf',
+    b'PK\x03\x04': '.docx',  # DOCX is a zip package
+}
+
+
+def is_path(source: DocumentSource) -> bool:
+    """True when the source names a file on disk rather than holding its bytes"""
+    return isinstance(source, (str, os.PathLike))
+
+
+def detect_file_type(source: DocumentSource, file_type: Optional[str] = None) -> str:
+    """Resolve the extension ('.pdf', '.docx') of a path or in-memory document"""
+    if file_type:
+        file_type = file_type.lower()
+        return file_type if file_type.startswith('.') else f'.{file_type}'
+
+    if is_path(source):
+        return Path(source).suffix.lower()
+
+    header = bytes(source[:4])
+    for magic, extension in _MAGIC_NUMBERS.items():
+        if header.startswith(magic):
+            return extension
+    return ''
+
+
+def as_bytes(source: DocumentSource) -> bytes:
+    """Bytes for libraries that insist on them; bytes objects pass through uncopied"""
+    if isinstance(source, bytes):
+        return source
+    return bytes(source)
+
+
+class _MappedReader(io.RawIOBase):
+    """Seekable file object over a memory map that copies only the ranges read"""
+
+    def __init__(self, mapped):
+        self._mapped = mapped
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._mapped[self._position:self._position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._mapped)
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+def open_stream(source: DocumentSource):
+    """Seekable binary file object over an in-memory document"""
+    if isinstance(source, (mmap.mmap, memoryview)):
+        return io.BufferedReader(_MappedReader(source))
+    # BytesIO shares a bytes object's buffer until something writes to it
+    return io.BytesIO(source)
+
+
+def map_file(file_path: str) -> mmap.mmap:
+    """Read-only memory map of a saved file (hash and parse without buffered copies)"""
+    with open(file_path, 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,122 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator, List
+from services.document_source import DocumentSource, is_path, open_stream
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+PARAGRAPH = W + 'p'
+RUN = W + 'r'
+TEXT = W + 't'
+TABLE_ROW = W + 'tr'
+TABLE_CELL = W + 'tc'
+
+# Run children that stand for a character, as python-docx renders them
+RUN_CHARACTERS = {
+    W + 'tab': '\t',
+    W + 'ptab': '\t',
+    W + 'br': '\n',
+    W + 'cr': '\n',
+    W + 'noBreakHyphen': '-',
+}
+
+HEADER_PART = re.compile(r'word/header(\d+)\.xml$')
+DOCUMENT_PART = 'word/document.xml'
+
+
+def iter_docx_text(source: DocumentSource) -> Iterator[str]:
+    """Stream the text of a DOCX straight from its XML parts, one line at a time.
+
+    Headers come first (templates often put the name and contact details
+    there), then the body. Table rows become one tab-separated line and text
+    boxes become lines of their own; no python-docx object model is built.
+    """
+    with zipfile.ZipFile(source if is_path(source) else open_stream(source)) as package:
+        seen_headers = []
+        for part_name in _header_parts(package):
+            with package.open(part_name) as part:
+                lines = [line for line in iter_part_lines(part) if line.strip()]
+            # First-page, even and default headers usually repeat each other
+            if lines and lines not in seen_headers:
+                seen_headers.append(lines)
+                yield from lines
+
+        with package.open(DOCUMENT_PART) as part:
+            yield from iter_part_lines(part)
+
+
+def _header_parts(package: zipfile.ZipFile) -> List[str]:
+    headers = []
+    for name in package.namelist():
+        match = HEADER_PART.match(name)
+        if match:
+            headers.append((int(match.group(1)), name))
+    return [name for _, name in sorted(headers)]
+
+
+def iter_part_lines(stream) -> Iterator[str]:
+    """Yield paragraph and table-row text from one WordprocessingML part.
+
+    Elements are cleared once consumed, so memory stays flat however long
+    the document is.
+    """
+    paragraphs = []  # Text fragments of each open paragraph (text boxes nest them)
+    cells = []       # Lines collected by each open table cell
+    rows = []        # Cell texts of each open table row
+    run_depth = 0
+    fallback_depth = 0
+
+    def emit(line, output):
+        # Lines inside a table cell belong to that cell, not the document flow
+        if cells:
+            cells[-1].append(line)
+        else:
+            output.append(line)
+
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        tag = element.tag
+
+        if tag == MC_FALLBACK:
+            # mc:Fallback repeats the mc:Choice content (e.g. VML text boxes)
+            fallback_depth += 1 if event == 'start' else -1
+            if event == 'end':
+                element.clear()
+            continue
+        if fallback_depth:
+            continue
+
+        if event == 'start':
+            if tag == PARAGRAPH:
+                paragraphs.append([])
+            elif tag == RUN:
+                run_depth += 1
+            elif tag == TABLE_ROW:
+                rows.append([])
+            elif tag == TABLE_CELL:
+                cells.append([])
+            continue
+
+        output = []
+        if tag == TEXT:
+            if paragraphs:
+                paragraphs[-1].append(element.text or '')
+        elif tag in RUN_CHARACTERS:
+            # w:tab also defines tab stops in paragraph properties; only runs hold text
+            if run_depth and paragraphs:
+                paragraphs[-1].append(RUN_CHARACTERS[tag])
+        elif tag == RUN:
+            run_depth -= 1
+        elif tag == PARAGRAPH:
+            emit(''.join(paragraphs.pop()), output)
+            element.clear()
+        elif tag == TABLE_CELL:
+            cell_text = ' '.join(line.strip() for line in cells.pop() if line.strip())
+            if rows:
+                rows[-1].append(cell_text)
+        elif tag == TABLE_ROW:
+            emit('\t'.join(cell for cell in rows.pop() if cell), output)
+            element.clear()
+
+        yield from output
@@ -1,39 +1,31 @@
 import re
-import spacy
 import json
-from typing import Dict, List, Set, Tuple, Optional
+from typing import AbstractSet, Dict, List, Set, Tuple, Optional
 from difflib import SequenceMatcher
 import logging
+import numpy as np
+from services.skill_similarity import FUZZY_THRESHOLD, candidate_indices, similarity_cache
+from services.job_profile import JobProfile
+from services.nlp_models import get_nlp
+from services.skill_taxonomy import get_taxonomy
+
+# Resumes scored per array pass in score_batch (bounds job x resume x skill memory)
+SCORE_BATCH_CHUNK = 512
+
+# Education level scoring
+EDUCATION_SCORES = {
+    'phd': 100, 'doctorate': 100,
+    'master': 90, 'mba': 90,
+    'bachelor': 80, 'degree': 80,
+    'associate': 60,
+    'diploma': 50, 'certificate': 50,
+    'high school': 30
+}
 
 class EnhancedJobMatcher:
     """Enhanced job matching algorithm with sophisticated scoring"""
     
     def __init__(self):
-        self.nlp = None
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            logging.warning("spaCy model not loaded. Some features may be limited.")
-            
-        # Skill synonyms and aliases for better matching
-        self.skill_synonyms = {
-            'javascript': ['js', 'node.js', 'nodejs'],
-            'react': ['reactjs', 'react.js'],
-            'angular': ['angularjs'],
-            'python': ['py'],
-            'c++': ['cpp', 'cplusplus'],
-            'c#': ['csharp', 'c sharp'],
-            'sql': ['mysql', 'postgresql', 'sqlite'],
-            'html': ['html5'],
-            'css': ['css3'],
-            'machine learning': ['ml', 'artificial intelligence', 'ai'],
-            'docker': ['containerization'],
-            'kubernetes': ['k8s'],
-            'amazon web services': ['aws'],
-            'google cloud': ['gcp'],
-            'microsoft azure': ['azure'],
-        }
-        
         # Experience level mappings
         self.experience_levels = {
             'junior': (0, 2),
@@ -44,41 +36,72 @@ class EnhancedJobMatcher:
             'principal': (10, 20)
         }
     
-    def normalize_skill(self, skill: str) -> Set[str]:
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded on first use (None if unavailable)"""
+        return get_nlp()
+    
+    def normalize_skill(self, skill: str) -> AbstractSet[str]:
         """Normalize skill name and return all possible variations"""
-        skill_lower = skill.lower().strip()
-        variations = {skill_lower}
-        
-        # Add synonyms
-        for main_skill, synonyms in self.skill_synonyms.items():
-            if skill_lower == main_skill:
-                variations.update(synonyms)
-            elif skill_lower in synonyms:
-                variations.add(main_skill)
-                variations.update(synonyms)
-        
-        return variations
+        # Synonym groups come precomputed from the shared skills taxonomy
+        return get_taxonomy().variants(skill)
     
     def calculate_skills_similarity(self, skill1: str, skill2: str) -> float:
         """Calculate semantic similarity between two skills"""
-        # Exact match
-        if skill1.lower() == skill2.lower():
-            return 1.0
-            
-        # Check synonyms
-        skill1_variants = self.normalize_skill(skill1)
-        skill2_variants = self.normalize_skill(skill2)
+        taxonomy = get_taxonomy()
+        skill1_lower, skill2_lower = skill1.lower(), skill2.lower()
         
-        if skill1_variants & skill2_variants:
-            return 1.0
-            
+        def compute():
+            # Exact match or synonyms: both resolve to the same canonical skill ID
+            if taxonomy.skill_id(skill1) == taxonomy.skill_id(skill2):
+                return 1.0
+            return self.fuzzy_skill_similarity(skill1_lower, skill2_lower)
+        
+        return similarity_cache.get_or_compute((skill1_lower, skill2_lower), taxonomy.version, compute)
+    
+    def fuzzy_skill_similarity(self, skill1_lower: str, skill2_lower: str) -> float:
+        """Similarity of two lowercased skills that are not synonyms"""
         # Substring matching for compound skills
-        if skill1.lower() in skill2.lower() or skill2.lower() in skill1.lower():
+        if skill1_lower in skill2_lower or skill2_lower in skill1_lower:
             return 0.8
             
         # String similarity
-        similarity = SequenceMatcher(None, skill1.lower(), skill2.lower()).ratio()
-        return similarity if similarity > 0.7 else 0.0
+        similarity = SequenceMatcher(None, skill1_lower, skill2_lower).ratio()
+        return similarity if similarity > FUZZY_THRESHOLD else 0.0
+    
+    def find_best_skill_match(self, job_skill: str, resume_entries: List[Tuple[str, str]],
+                              resume_ids: Dict[int, str],
+                              candidates: Optional[List[int]] = None) -> Tuple[float, Optional[str]]:
+        """Best-matching resume skill for one job skill, as (similarity, resume_skill).
+
+        ``resume_ids`` maps canonical skill IDs to the first resume skill with
+        that ID, so exact and synonym matches are a single lookup; only the
+        leftovers go through the fuzzy comparison. ``candidates`` narrows that
+        to the resume_entries positions the vectorized prefilter kept.
+        """
+        taxonomy = get_taxonomy()
+        job_skill_id = taxonomy.skill_id(job_skill)
+        if job_skill_id in resume_ids:
+            # Nothing scores above 1.0, and a fuzzy 1.0 means the same skill ID
+            return 1.0, resume_ids[job_skill_id]
+        
+        if candidates is None:
+            candidates = range(len(resume_entries))
+        
+        best_match = 0.0
+        best_match_skill = None
+        job_skill_lower = job_skill.lower()
+        for index in candidates:
+            resume_skill, resume_skill_lower = resume_entries[index]
+            # Different skill IDs, so the pair's similarity is its fuzzy score
+            similarity = similarity_cache.get_or_compute(
+                (job_skill_lower, resume_skill_lower), taxonomy.version,
+                lambda: self.fuzzy_skill_similarity(job_skill_lower, resume_skill_lower)
+            )
+            if similarity > best_match:
+                best_match = similarity
+                best_match_skill = resume_skill
+        return best_match, best_match_skill
     
     def calculate_skills_match(self, resume_skills: List[str], job_skills: List[str], 
                              required_skills: List[str] = None, preferred_skills: List[str] = None) -> Dict[str, float]:
@@ -94,21 +117,29 @@ class EnhancedJobMatcher:
             required_skills = []
         elif not preferred_skills:
             preferred_skills = []
+        
+        # Intern resume skills once per call instead of once per skill pair
+        taxonomy = get_taxonomy()
+        resume_entries = [(skill, skill.lower()) for skill in resume_skills]
+        resume_ids = {}
+        for resume_skill in resume_skills:
+            resume_ids.setdefault(taxonomy.skill_id(resume_skill), resume_skill)
+        
+        # One vectorized pass rules out the pairs that cannot clear the fuzzy threshold
+        job_lowers = [skill.lower() for skill in [*required_skills, *preferred_skills]]
+        candidates = candidate_indices(job_lowers, [skill_lower for _, skill_lower in resume_entries])
+        required_candidates = candidates[:len(required_skills)]
+        preferred_candidates = candidates[len(required_skills):]
             
         matched_skills = []
         required_matches = 0
         preferred_matches = 0
         
         # Match required skills
-        for req_skill in required_skills:
-            best_match = 0.0
-            best_match_skill = None
-            
-            for resume_skill in resume_skills:
-                similarity = self.calculate_skills_similarity(req_skill, resume_skill)
-                if similarity > best_match:
-                    best_match = similarity
-                    best_match_skill = resume_skill
+        for req_skill, req_candidates in zip(required_skills, required_candidates):
+            best_match, best_match_skill = self.find_best_skill_match(
+                req_skill, resume_entries, resume_ids, req_candidates
+            )
             
             if best_match >= 0.6:  # Lowered match threshold for better matching
                 required_matches += best_match
@@ -120,15 +151,10 @@ class EnhancedJobMatcher:
                 })
         
         # Match preferred skills
-        for pref_skill in preferred_skills:
-            best_match = 0.0
-            best_match_skill = None
-            
-            for resume_skill in resume_skills:
-                similarity = self.calculate_skills_similarity(pref_skill, resume_skill)
-                if similarity > best_match:
-                    best_match = similarity
-                    best_match_skill = resume_skill
+        for pref_skill, pref_candidates in zip(preferred_skills, preferred_candidates):
+            best_match, best_match_skill = self.find_best_skill_match(
+                pref_skill, resume_entries, resume_ids, pref_candidates
+            )
             
             if best_match >= 0.6:  # Lowered threshold for preferred skills too
                 preferred_matches += best_match
@@ -204,11 +230,14 @@ class EnhancedJobMatcher:
     def calculate_experience_match(self, resume_experience: Dict, job_requirements: str) -> Dict[str, float]:
         """Enhanced experience matching"""
         req_info = self.extract_experience_requirements(job_requirements)
-        resume_years = resume_experience.get('total_experience_years', 0)
-        
-        min_required = req_info['min_years']
-        max_required = req_info['max_years']
-        
+        return self.score_experience(
+            resume_experience.get('total_experience_years', 0),
+            req_info['min_years'], req_info['max_years'], req_info['level']
+        )
+    
+    def score_experience(self, resume_years: float, min_required: int, max_required: int,
+                         level: str) -> Dict[str, float]:
+        """Score a resume's years against an already-parsed requirement range"""
         # Perfect match zone
         if min_required <= resume_years <= max_required:
             score = 100.0
@@ -232,26 +261,23 @@ class EnhancedJobMatcher:
             'resume_years': resume_years,
             'required_min': min_required,
             'required_max': max_required,
-            'level_match': req_info['level']
+            'level_match': level
         }
     
+    def required_education_levels(self, job_requirements: str) -> List[Tuple[str, int]]:
+        """Education keywords (with their scores) that appear in the job text"""
+        req_lower = job_requirements.lower() if job_requirements else ''
+        return [(req_ed, score) for req_ed, score in EDUCATION_SCORES.items() if req_ed in req_lower]
+    
     def calculate_education_match(self, resume_education: List[Dict], job_requirements: str) -> Dict[str, float]:
         """Calculate education matching score"""
+        return self.score_education(resume_education, self.required_education_levels(job_requirements))
+    
+    def score_education(self, resume_education: List[Dict], required_levels: List[Tuple[str, int]]) -> Dict[str, float]:
+        """Score resume education against the levels a job asks for"""
         if not resume_education:
             return {'score': 50.0, 'details': 'No education information found'}
         
-        req_lower = job_requirements.lower() if job_requirements else ''
-        
-        # Education level scoring
-        education_scores = {
-            'phd': 100, 'doctorate': 100,
-            'master': 90, 'mba': 90,
-            'bachelor': 80, 'degree': 80,
-            'associate': 60,
-            'diploma': 50, 'certificate': 50,
-            'high school': 30
-        }
-        
         max_score = 0
         matched_education = None
         
@@ -260,8 +286,8 @@ class EnhancedJobMatcher:
             edu_field = edu.get('field', '').lower()
             
             # Check for education level match
-            for req_ed, score in education_scores.items():
-                if req_ed in req_lower and req_ed in edu_level:
+            for req_ed, score in required_levels:
+                if req_ed in edu_level:
                     if score > max_score:
                         max_score = score
                         matched_education = edu
@@ -271,7 +297,7 @@ class EnhancedJobMatcher:
         if max_score == 0:
             for edu in resume_education:
                 edu_level = edu.get('level', '').lower()
-                for ed_level, score in education_scores.items():
+                for ed_level, score in EDUCATION_SCORES.items():
                     if ed_level in edu_level and score > max_score:
                         max_score = score
                         matched_education = edu
@@ -286,43 +312,67 @@ class EnhancedJobMatcher:
             'details': f"Matched: {matched_education.get('level', 'Unknown') if matched_education else 'General education'}"
         }
     
+    def build_job_profile(self, job_data: Dict) -> JobProfile:
+        """Derive the per-job half of matching once, for reuse across resumes"""
+        # Extract job requirements with proper fallback logic
+        required_skills = job_data.get('skills_required', [])
+        preferred_skills = job_data.get('skills_preferred', [])
+        all_skills = job_data.get('extracted_skills', [])
+        
+        # If no specific required/preferred split, use extracted skills intelligently
+        if not required_skills and not preferred_skills and all_skills:
+            # Split skills: first 60% as required, rest as preferred
+            split_point = max(1, len(all_skills) * 60 // 100)
+            required_skills = all_skills[:split_point]
+            preferred_skills = all_skills[split_point:]
+        elif not required_skills and not preferred_skills:
+            # Fallback to any available skills
+            required_skills = all_skills
+            preferred_skills = []
+        
+        req_info = self.extract_experience_requirements(job_data.get('experience_required', ''))
+        education_levels = self.required_education_levels(
+            job_data.get('requirements', '') + ' ' + job_data.get('description_text', '')
+        )
+        
+        return JobProfile(
+            required_skills=list(required_skills),
+            preferred_skills=list(preferred_skills),
+            min_years=req_info['min_years'],
+            max_years=req_info['max_years'],
+            level=req_info['level'],
+            education_levels=education_levels
+        )
+    
     def calculate_overall_match_score(self, parsed_resume: Dict, job_data: Dict) -> Dict[str, any]:
         """Calculate comprehensive match score with detailed breakdown"""
         try:
-            # Extract job requirements with proper fallback logic
-            required_skills = job_data.get('skills_required', [])
-            preferred_skills = job_data.get('skills_preferred', [])
-            all_skills = job_data.get('extracted_skills', [])
-            
-            # If no specific required/preferred split, use extracted skills intelligently
-            if not required_skills and not preferred_skills and all_skills:
-                # Split skills: first 60% as required, rest as preferred
-                split_point = max(1, len(all_skills) * 60 // 100)
-                required_skills = all_skills[:split_point]
-                preferred_skills = all_skills[split_point:]
-            elif not required_skills and not preferred_skills:
-                # Fallback to any available skills
-                required_skills = all_skills
-                preferred_skills = []
-            
+            job_profile = self.build_job_profile(job_data)
+        except Exception as e:
+            return self._match_error(e)
+        return self.score_profile(parsed_resume, job_profile)
+    
+    def score_profile(self, parsed_resume: Dict, job_profile: JobProfile) -> Dict[str, any]:
+        """Score a resume against a precompiled job profile"""
+        try:
             # Skills matching (60% weight)
             skills_result = self.calculate_skills_match(
                 parsed_resume.get('skills', []),
-                required_skills + preferred_skills,  # All skills for context
-                required_skills,
-                preferred_skills
+                job_profile.all_skills,  # All skills for context
+                job_profile.required_skills,
+                job_profile.preferred_skills
             )
             
             # Experience matching (30% weight)
-            experience_result = self.calculate_experience_match(
-                parsed_resume,
-                job_data.get('experience_required', '')
+            experience_result = self.score_experience(
+                parsed_resume.get('total_experience_years', 0),
+                job_profile.min_years, job_profile.max_years, job_profile.level
             )
             
             # Education matching (10% weight)
-            education_result = self.calculate_education_match(
+            education_result = self.score_education(
                 parsed_resume.get('education', []),
-                job_data.get('requirements', '') + ' ' + job_data.get('description_text', '')
+                job_profile.education_levels
             )
             
             # Calculate weighted overall score
@@ -349,11 +399,204 @@ class EnhancedJobMatcher:
             }
             
         except Exception as e:
-            logging.error(f"Error calculating enhanced match score: {e}")
-            return {
-                'overall_score': 0.0,
-                'error': str(e)
+            return self._match_error(e)
+    
+    def score_batch(self, job_profile: JobProfile, resumes: List[Dict]) -> List[Dict[str, any]]:
+        """Score many parsed resumes against one job profile.
+
+        Returns the same per-resume results as score_profile, in order. Each
+        distinct resume skill is compared with the job's skills once for the
+        whole batch. The best match per (job skill, resume) comes from one
+        gather over a padded resume x skill index matrix. Experience scores
+        and the weighted totals are array operations. Sums run in the same
+        order as the scalar path and rounding uses Python's round, so the
+        numbers are identical.
+        """
+        results = [None] * len(resumes)
+        batch = []
+        for position, parsed_resume in enumerate(resumes):
+            # Anything the array path cannot represent goes through the scalar path
+            if self._batchable(parsed_resume):
+                batch.append(position)
+            else:
+                results[position] = self.score_profile(parsed_resume, job_profile)
+        
+        for start in range(0, len(batch), SCORE_BATCH_CHUNK):
+            positions = batch[start:start + SCORE_BATCH_CHUNK]
+            try:
+                chunk_results = self._score_chunk(job_profile, [resumes[p] for p in positions])
+            except Exception as e:
+                logging.warning(f"Batch scoring failed, scoring resumes one by one: {e}")
+                chunk_results = [self.score_profile(resumes[p], job_profile) for p in positions]
+            for position, result in zip(positions, chunk_results):
+                results[position] = result
+        return results
+    
+    @staticmethod
+    def _batchable(parsed_resume: Dict) -> bool:
+        years = parsed_resume.get('total_experience_years', 0)
+        skills = parsed_resume.get('skills', [])
+        return (
+            type(years) in (int, float) and
+            isinstance(skills, list) and all(isinstance(skill, str) for skill in skills)
+        )
+    
+    def _score_chunk(self, job_profile: JobProfile, resumes: List[Dict]) -> List[Dict[str, any]]:
+        skills_results = self._skills_batch(job_profile, [r.get('skills', []) for r in resumes])
+        
+        years = [r.get('total_experience_years', 0) for r in resumes]
+        experience_scores = self._experience_scores(
+            np.array(years, dtype=np.float64), job_profile.min_years, job_profile.max_years
+        )
+        education_results = [
+            self.score_education(r.get('education', []), job_profile.education_levels) for r in resumes
+        ]
+        
+        overall_scores = (
+            (np.array([result['overall'] for result in skills_results]) * 0.6) +
+            (experience_scores * 0.3) +
+            (np.array([result['score'] for result in education_results], dtype=np.float64) * 0.1)
+        ).tolist()
+        
+        results = []
+        for i, overall_score in enumerate(overall_scores):
+            experience_result = {
+                'score': experience_scores[i].item(),
+                'resume_years': years[i],
+                'required_min': job_profile.min_years,
+                'required_max': job_profile.max_years,
+                'level_match': job_profile.level
             }
+            results.append({
+                'overall_score': round(overall_score, 2),
+                'skills': skills_results[i],
+                'experience': experience_result,
+                'education': education_results[i],
+                'recommendation': self.get_recommendation(overall_score, skills_results[i], experience_result),
+                'match_breakdown': {
+                    'skills_weight': 60,
+                    'experience_weight': 30,
+                    'education_weight': 10
+                }
+            })
+        return results
+    
+    @staticmethod
+    def _experience_scores(resume_years: np.ndarray, min_required: int, max_required: int) -> np.ndarray:
+        """Vectorized score_experience; conditions are checked in the same order"""
+        return np.select(
+            [
+                (min_required <= resume_years) & (resume_years <= max_required),
+                resume_years <= max_required + 3,
+                resume_years >= min_required - 1,
+                resume_years > max_required + 5,
+                resume_years >= min_required - 2,
+            ],
+            [100.0, 90.0, 75.0, 70.0, 50.0],
+            default=25.0
+        )
+    
+    def _skills_batch(self, job_profile: JobProfile, resume_skill_lists: List[List[str]]) -> List[Dict]:
+        """calculate_skills_match for many resumes against one profile"""
+        required_skills = job_profile.required_skills
+        preferred_skills = job_profile.preferred_skills
+        job_skills = required_skills + preferred_skills
+        if not job_skills:
+            return [{'overall': 0.0, 'required': 0.0, 'preferred': 0.0, 'matched_skills': []}
+                    for _ in resume_skill_lists]
+        
+        # Sparse resume x skill structure: each resume lists indexes into one shared vocabulary
+        vocabulary = {}
+        for skills in resume_skill_lists:
+            for skill in skills:
+                vocabulary.setdefault(skill.lower(), len(vocabulary))
+        longest = max((len(skills) for skills in resume_skill_lists), default=0)
+        skill_index = np.full((len(resume_skill_lists), max(longest, 1)), -1, dtype=np.int64)
+        for row, skills in enumerate(resume_skill_lists):
+            skill_index[row, :len(skills)] = [vocabulary[skill.lower()] for skill in skills]
+        
+        # Every job skill against every distinct resume skill, once; a padding column scores 0
+        similarity = np.zeros((len(job_skills), len(vocabulary) + 1))
+        similarity[:, :len(vocabulary)] = self._similarity_matrix(job_skills, list(vocabulary))
+        
+        # job skill x resume x resume-skill-slot; argmax keeps the first best skill, like the scalar loop
+        pair_similarity = similarity[:, skill_index]
+        best_slot = pair_similarity.argmax(axis=2)
+        best_match = np.take_along_axis(pair_similarity, best_slot[:, :, None], axis=2)[:, :, 0]
+        counted = np.where(best_match >= 0.6, best_match, 0.0)
+        
+        # Accumulate job skill by job skill, in the scalar path's order
+        required_count = len(required_skills)
+        required_matches = np.zeros(len(resume_skill_lists))
+        for j in range(required_count):
+            required_matches = required_matches + counted[j]
+        preferred_matches = np.zeros(len(resume_skill_lists))
+        for j in range(required_count, len(job_skills)):
+            preferred_matches = preferred_matches + counted[j]
+        
+        if required_skills:
+            required_scores = required_matches / len(required_skills) * 100
+        else:
+            required_scores = np.full(len(resume_skill_lists), 100.0)
+        if preferred_skills:
+            preferred_scores = preferred_matches / len(preferred_skills) * 100
+        else:
+            preferred_scores = np.full(len(resume_skill_lists), 100.0)
+        overall_scores = (required_scores * 0.8) + (preferred_scores * 0.2)
+        
+        best_match_values = best_match.tolist()
+        best_slots = best_slot.tolist()
+        results = []
+        for row, skills in enumerate(resume_skill_lists):
+            matched_skills = []
+            for j, job_skill in enumerate(job_skills):
+                similarity_value = best_match_values[j][row]
+                if similarity_value >= 0.6:
+                    matched_skills.append({
+                        'job_skill': job_skill,
+                        'resume_skill': skills[best_slots[j][row]],
+                        'similarity': similarity_value,
+                        'type': 'required' if j < required_count else 'preferred'
+                    })
+            results.append({
+                'overall': round(overall_scores[row].item(), 2),
+                'required': round(required_scores[row].item(), 2),
+                'preferred': round(preferred_scores[row].item(), 2),
+                'matched_skills': matched_skills
+            })
+        return results
+    
+    def _similarity_matrix(self, job_skills: List[str], resume_skills_lower: List[str]) -> np.ndarray:
+        """Similarity of each job skill to each distinct lowercased resume skill"""
+        taxonomy = get_taxonomy()
+        resume_ids = [taxonomy.skill_id(skill) for skill in resume_skills_lower]
+        positions_by_id = {}
+        for u, skill_id in enumerate(resume_ids):
+            positions_by_id.setdefault(skill_id, []).append(u)
+        job_lowers = [skill.lower() for skill in job_skills]
+        candidates = candidate_indices(job_lowers, resume_skills_lower)
+        
+        matrix = np.zeros((len(job_skills), len(resume_skills_lower)))
+        for j, job_skill in enumerate(job_skills):
+            job_skill_id = taxonomy.skill_id(job_skill)
+            job_skill_lower = job_lowers[j]
+            for u in candidates[j]:
+                if resume_ids[u] != job_skill_id:
+                    resume_skill_lower = resume_skills_lower[u]
+                    matrix[j, u] = similarity_cache.get_or_compute(
+                        (job_skill_lower, resume_skill_lower), taxonomy.version,
+                        lambda: self.fuzzy_skill_similarity(job_skill_lower, resume_skill_lower)
+                    )
+            # Exact and synonym matches
+            matrix[j, positions_by_id.get(job_skill_id, [])] = 1.0
+        return matrix
+    
+    def _match_error(self, error: Exception) -> Dict[str, any]:
+        logging.error(f"Error calculating enhanced match score: {error}")
+        return {
+            'overall_score': 0.0,
+            'error': str(error)
+        }
     
     def get_recommendation(self, overall_score: float, skills_result: Dict, experience_result: Dict) -> Dict[str, str]:
         """Generate hiring recommendation based on scores"""
@@ -0,0 +1,82 @@
+import heapq
+import logging
+import threading
+from typing import Dict, List, Set, Tuple
+from sqlalchemy import func
+from config.database import db
+from models.job_model import JobDescription
+from services.job_profile import get_job_profile
+from services.skill_taxonomy import get_taxonomy
+
+
+class JobSkillIndex:
+    """Inverted index from canonical skill ID to the active jobs asking for it.
+
+    Used for reverse matching: a resume is only scored against jobs that
+    share at least one canonical skill with it, instead of every open job.
+    The index is rebuilt lazily when the set of active jobs changes (count
+    or latest updated_at) or the skills taxonomy is reloaded.
+    """
+
+    def __init__(self):
+        self._signature = None
+        self._jobs_by_skill = {}
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def _current_signature(self) -> Tuple:
+        job_count, last_updated = db.session.query(
+            func.count(JobDescription.id), func.max(JobDescription.updated_at)
+        ).filter(JobDescription.is_active.is_(True)).one()
+        return get_taxonomy().version, job_count, last_updated
+
+    def _ensure_fresh(self):
+        """Rebuild the index if jobs or the taxonomy changed (requires an app context)"""
+        signature = self._current_signature()
+        if signature == self._signature:
+            return
+
+        with self._lock:
+            if signature == self._signature:
+                return
+
+            taxonomy = get_taxonomy()
+            jobs_by_skill = {}
+            profiles = {}
+            for job in JobDescription.query.filter(JobDescription.is_active.is_(True)).all():
+                profile = get_job_profile(job)
+                profiles[job.id] = profile
+                for skill in profile.all_skills:
+                    jobs_by_skill.setdefault(taxonomy.skill_id(skill), set()).add(job.id)
+
+            self._jobs_by_skill, self._profiles = jobs_by_skill, profiles
+            self._signature = signature
+            logging.info(f"Indexed {len(profiles)} active jobs over {len(jobs_by_skill)} skills")
+
+    def candidate_job_ids(self, skills: List[str]) -> Set[int]:
+        """Active jobs sharing at least one canonical skill with ``skills``"""
+        self._ensure_fresh()
+        taxonomy = get_taxonomy()
+        job_ids = set()
+        for skill in skills:
+            job_ids |= self._jobs_by_skill.get(taxonomy.skill_id(skill), set())
+        return job_ids
+
+    def recommend(self, parsed_resume: Dict, limit: int = 10) -> List[Tuple[int, Dict]]:
+        """Top ``limit`` (job_id, match_result) pairs for a parsed resume, best first"""
+        from services.enhanced_job_matcher import enhanced_job_matcher
+
+        job_ids = self.candidate_job_ids(parsed_resume.get('skills') or [])
+        scored = []
+        for job_id in job_ids:
+            profile = self._profiles.get(job_id)
+            if profile is None:
+                continue
+            scored.append((job_id, enhanced_job_matcher.score_profile(parsed_resume, profile)))
+
+        # Ties go to the older posting so results are stable between calls
+        return heapq.nlargest(limit, scored, key=lambda item: (item[1].get('overall_score', 0.0), -item[0]))
+
+
+# Global instance
+job_skill_index = JobSkillIndex()
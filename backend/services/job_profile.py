@@ -0,0 +1,127 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Bump whenever the way a profile is derived from a job changes
+PROFILE_VERSION = 1
+
+
+class JobProfile:
+    """Job side of resume matching, derived once per job version.
+
+    Holds everything calculate_overall_match_score used to re-derive for
+    every resume: the required/preferred skill split, the parsed experience
+    range and the education levels the job text asks for. Plain attributes
+    only, so profiles pickle cheaply to parse workers and round-trip through
+    the job's match_profile column.
+    """
+
+    def __init__(self, required_skills: List[str], preferred_skills: List[str],
+                 min_years: int, max_years: int, level: str,
+                 education_levels: List[Tuple[str, int]]):
+        self.required_skills = required_skills
+        self.preferred_skills = preferred_skills
+        self.min_years = min_years
+        self.max_years = max_years
+        self.level = level
+        self.education_levels = education_levels
+
+    @property
+    def all_skills(self) -> List[str]:
+        return self.required_skills + self.preferred_skills
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': PROFILE_VERSION,
+            'required_skills': self.required_skills,
+            'preferred_skills': self.preferred_skills,
+            'min_years': self.min_years,
+            'max_years': self.max_years,
+            'level': self.level,
+            'education_levels': [list(level) for level in self.education_levels]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional['JobProfile']:
+        """Rebuild a stored profile; None if it was built by another profile version"""
+        if not data or data.get('version') != PROFILE_VERSION:
+            return None
+        return cls(
+            required_skills=data['required_skills'],
+            preferred_skills=data['preferred_skills'],
+            min_years=data['min_years'],
+            max_years=data['max_years'],
+            level=data['level'],
+            education_levels=[tuple(level) for level in data['education_levels']]
+        )
+
+
+def build_job_data(job) -> Dict:
+    """Collect the job fields the matcher needs into a plain dict"""
+    return {
+        'skills_required': job.get_skills_required() or [],
+        'skills_preferred': job.get_skills_preferred() or [],
+        'extracted_skills': job.get_skills() or [],
+        'experience_required': job.experience_required or '',
+        'requirements': job.requirements or '',
+        'description_text': job.description_text or ''
+    }
+
+
+def build_job_profile(job) -> JobProfile:
+    """Compile a job's match profile from its current fields"""
+    from services.enhanced_job_matcher import enhanced_job_matcher
+    return enhanced_job_matcher.build_job_profile(build_job_data(job))
+
+
+class JobProfileCache:
+    """In-process LRU of compiled job profiles.
+
+    Entries are keyed by job id and stamped with the job's updated_at, so an
+    edited job is recompiled on next use. A miss first tries the profile
+    persisted on the job row and only re-derives it when that is missing or
+    from an older PROFILE_VERSION.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job) -> JobProfile:
+        """Profile for a job row, reused across every resume scored against it"""
+        stamp = job.updated_at
+        with self._lock:
+            cached = self._profiles.get(job.id)
+            if cached is not None and cached[0] == stamp:
+                self._profiles.move_to_end(job.id)
+                return cached[1]
+
+        profile = JobProfile.from_dict(job.get_match_profile())
+        if profile is None:
+            logging.info(f"Compiling match profile for job {job.id}")
+            profile = build_job_profile(job)
+
+        with self._lock:
+            self._profiles[job.id] = (stamp, profile)
+            self._profiles.move_to_end(job.id)
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def refresh(self, job) -> JobProfile:
+        """Recompile and persist a job's profile; call before committing job edits"""
+        profile = build_job_profile(job)
+        job.set_match_profile(profile.to_dict())
+        with self._lock:
+            self._profiles.pop(job.id, None)
+        return profile
+
+
+# Global instance
+job_profile_cache = JobProfileCache()
+
+
+def get_job_profile(job) -> JobProfile:
+    return job_profile_cache.get(job)
@@ -0,0 +1,64 @@
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+# Pipeline components nobody downstream reads; excluding them at load time
+# keeps their weights out of memory. Override with a comma separated list.
+DEFAULT_EXCLUDE = 'parser,lemmatizer,attribute_ruler,tagger,senter'
+
+
+class NlpRegistry:
+    """Process-wide spaCy pipelines, loaded once on first use.
+
+    The parser and both matchers share these instead of each calling
+    spacy.load() at import. spaCy itself is only imported when a pipeline is
+    first requested, so processes that never need one never pay for it.
+    A failed load is remembered and not retried.
+    """
+
+    def __init__(self):
+        self.model_name = os.getenv('SPACY_MODEL', 'en_core_web_sm')
+        self.exclude = [name.strip() for name in os.getenv('SPACY_EXCLUDE', DEFAULT_EXCLUDE).split(',')
+                        if name.strip()]
+        self._pipelines = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: Optional[str] = None):
+        """The named pipeline (default model if omitted), or None if it cannot be loaded"""
+        name = name or self.model_name
+        if name in self._pipelines:
+            return self._pipelines[name]
+
+        with self._lock:
+            if name not in self._pipelines:
+                self._pipelines[name] = self._load(name)
+            return self._pipelines[name]
+
+    def _load(self, name: str):
+        try:
+            import spacy
+            nlp = spacy.load(name, exclude=self.exclude)
+            logging.info(f"spaCy model {name} loaded with components {nlp.pipe_names}")
+            return nlp
+        except OSError as e:
+            logging.warning(f"spaCy model not found: {e}")
+            logging.info(f"Falling back to basic text processing (install '{name}' for better results)")
+        except Exception as e:
+            logging.error(f"Failed to load spaCy model: {e}")
+        return None
+
+    def stats(self) -> Dict:
+        """Loaded pipelines for the metrics endpoint"""
+        return {
+            name: nlp.pipe_names if nlp is not None else None
+            for name, nlp in self._pipelines.items()
+        }
+
+
+# Global instance
+nlp_registry = NlpRegistry()
+
+
+def get_nlp(name: Optional[str] = None):
+    return nlp_registry.get(name)
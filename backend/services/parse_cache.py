@@ -0,0 +1,112 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+from sqlalchemy.exc import IntegrityError
+from config.database import db
+from models.parse_cache_model import ParsedResumeCache
+from services.document_source import map_file
+from services.resume_parser import PARSER_VERSION
+from services.skill_taxonomy import get_taxonomy
+
+
+def hash_bytes(content) -> str:
+    """SHA-256 of an in-memory document (bytes, memoryview or mmap)"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 of a saved file, hashed through a memory map"""
+    if os.path.getsize(file_path) == 0:
+        return hash_bytes(b'')
+    mapped = map_file(file_path)
+    try:
+        return hash_bytes(mapped)
+    finally:
+        mapped.close()
+
+
+def cache_version() -> str:
+    """Parser version plus taxonomy version: either changing alters parse output"""
+    return f"{PARSER_VERSION}+{get_taxonomy().version}"
+
+
+class ParseCache:
+    """Content-addressed cache of parsed resume data.
+
+    Entries are keyed by the SHA-256 of the file bytes plus cache_version(), so
+    bumping the parser version or editing the skills taxonomy invalidates
+    everything. A bounded in-memory LRU
+    sits in front of the parsed_resume_cache table. Values are kept as JSON
+    strings so every hit hands back a fresh dict the caller may mutate.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Read cache configuration from the Flask app"""
+        self.max_entries = app.config.get('PARSE_CACHE_SIZE', self.max_entries)
+        app.extensions['parse_cache'] = self
+
+    def get(self, content_hash: str) -> Optional[Dict]:
+        """Return cached parsed data for a file hash, or None (requires an app context)"""
+        version = cache_version()
+        key = (content_hash, version)
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                return json.loads(cached)
+
+        entry = ParsedResumeCache.query.filter_by(
+            content_hash=content_hash, parser_version=version
+        ).first()
+        if not entry:
+            return None
+
+        self._remember(key, entry.parsed_data)
+        return json.loads(entry.parsed_data)
+
+    def put(self, content_hash: str, parsed_data: Dict):
+        """Store parsed data for a file hash (requires an app context)"""
+        if parsed_data.get('parsing_status') != 'success':
+            return  # Never cache failures; a later parser may do better
+
+        # Matching is per job, only the parse itself is reusable
+        cacheable = {k: v for k, v in parsed_data.items() if k != 'match_details'}
+        serialized = json.dumps(cacheable)
+        version = cache_version()
+
+        try:
+            db.session.add(ParsedResumeCache(
+                content_hash=content_hash,
+                parser_version=version,
+                parsed_data=serialized
+            ))
+            db.session.commit()
+        except IntegrityError:
+            # Another worker stored the same file first
+            db.session.rollback()
+        except Exception as e:
+            db.session.rollback()
+            logging.warning(f"Failed to persist parse cache entry: {e}")
+
+        self._remember((content_hash, version), serialized)
+
+    def _remember(self, key, serialized: str):
+        with self._lock:
+            self._memory[key] = serialized
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+# Global instance
+parse_cache = ParseCache()
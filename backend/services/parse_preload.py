@@ -0,0 +1,14 @@
+"""Preloaded by the parse pool's fork server (see ParseQueue._create_executor).
+
+The fork server imports this module once and forks every parse worker from
+itself, so the parse workers of one API process share the parser, skills
+taxonomy, spaCy pipeline and PDF library copy-on-write instead of each
+loading their own.
+"""
+
+from services.pdf_backends import get_fitz
+from services.prefork import warm_up
+
+# The API process defers PyMuPDF to keep startup fast; parse workers always need it
+get_fitz()
+warm_up()
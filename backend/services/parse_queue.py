@@ -0,0 +1,305 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from config.database import db
+from models.resume_model import Resume
+from services.job_profile import JobProfile, get_job_profile
+from services.parse_cache import parse_cache, hash_bytes, hash_file
+from services.prefork import memory_stats
+from services.resume_search import index_resume
+
+# Modules the parse pool's fork server imports before forking any worker
+PARSE_PRELOAD = ['services.parse_queue', 'services.parse_preload']
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_and_score(source, job_profile: JobProfile, file_type: Optional[str] = None) -> Tuple[Dict, float]:
+    """Worker entry point: parse a resume (file path or uploaded bytes) and score it against a job"""
+    # Imported here; workers forked from the fork server find it preloaded
+    from services.resume_parser import resume_parser
+
+    parsed_data = resume_parser.parse_resume(source, file_type)
+    if parsed_data.get('parsing_status') != 'success':
+        return parsed_data, 0  # Nothing to score; the row is marked failed
+    return score_parsed(parsed_data, job_profile)
+
+
+def score_parsed(parsed_data: Dict, job_profile: JobProfile) -> Tuple[Dict, float]:
+    """Score already-parsed resume data against a job's compiled profile"""
+    from services.enhanced_job_matcher import enhanced_job_matcher
+
+    # Use enhanced matcher for detailed scoring
+    match_result = enhanced_job_matcher.score_profile(parsed_data, job_profile)
+    match_score = match_result.get('overall_score', 0.0)
+
+    # Store detailed match information
+    parsed_data['match_details'] = match_result
+    return parsed_data, match_score
+
+
+class ParseQueue:
+    """In-process queue that parses and scores uploaded resumes on a worker pool.
+
+    Uploads only persist the file and a Resume row in the ``queued`` state.
+    The upload's bytes ride along with the queue entry (within a memory
+    budget) so workers parse the same buffer that was hashed and saved
+    instead of reading the file back.
+    A dispatcher thread claims queued rows, moves them to ``parsing`` and hands
+    them to a process pool; results are written back as ``scored``, or
+    ``failed`` if the file could not be parsed or the worker crashed. The
+    Resume rows double as the durable queue, so rows left behind by a restart
+    are picked up again: at startup, and whenever the dispatcher has been idle
+    for the stale interval.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.workers = 2
+        self.stale_after = timedelta(minutes=10)
+        self.buffer_budget = 64 * 1024 * 1024
+        self._buffered_bytes = 0
+        self._queue = queue.Queue()
+        self._executor = None
+        self._dispatcher = None
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Bind the queue to a Flask app and read its configuration"""
+        self.app = app
+        self.workers = app.config.get('PARSE_WORKERS', 2)
+        self.stale_after = timedelta(seconds=app.config.get('PARSE_STALE_SECONDS', 600))
+        self.buffer_budget = app.config.get('PARSE_BUFFER_BYTES', self.buffer_budget)
+        app.extensions['parse_queue'] = self
+
+    def submit(self, resume_id: int, content: Optional[bytes] = None):
+        """Queue a resume for background parsing, optionally with the uploaded bytes"""
+        self.start()
+        with self._lock:
+            if content is not None and self._buffered_bytes + len(content) > self.buffer_budget:
+                content = None  # Over budget: the worker reads the saved file instead
+            if content is not None:
+                self._buffered_bytes += len(content)
+        self._queue.put((resume_id, content))
+
+    def start(self):
+        """Start the dispatcher and worker pool once per process"""
+        with self._lock:
+            if self._dispatcher is not None:
+                return
+
+            if self.workers > 0:
+                self._executor = self._create_executor()
+            self._slots = threading.BoundedSemaphore(max(self.workers, 1))
+
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name='resume-parse-dispatcher', daemon=True
+            )
+            self._dispatcher.start()
+
+        self._recover()
+
+    def _create_executor(self, workers: Optional[int] = None):
+        # Workers are forked from a fork server, a fresh single-threaded
+        # interpreter, so they never inherit the server's threads or sockets.
+        # It preloads and warms up the parser once and every worker shares
+        # that copy-on-write. Without fork servers, each worker is spawned.
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(PARSE_PRELOAD)
+            # The fork server starts with the interpreter's default sys.path,
+            # not ours, and silently skips preloads it cannot import
+            python_path = [path for path in os.environ.get('PYTHONPATH', '').split(os.pathsep) if path]
+            if BACKEND_DIR not in python_path:
+                os.environ['PYTHONPATH'] = os.pathsep.join([BACKEND_DIR, *python_path])
+        else:
+            context = multiprocessing.get_context('spawn')
+        return ProcessPoolExecutor(max_workers=workers or self.workers, mp_context=context)
+
+    def worker_memory(self) -> List[Dict]:
+        """memory_stats of each parse worker process started by this process"""
+        # ProcessPoolExecutor has no public accessor for its worker processes
+        processes = getattr(self._executor, '_processes', None) or {}
+        return [memory_stats(pid) for pid in list(processes)]
+
+    def _recover(self):
+        """Re-queue resumes a previous process accepted but never finished"""
+        with self.app.app_context():
+            stale_before = datetime.utcnow() - self.stale_after
+            stale = Resume.query.filter(
+                (Resume.parse_status == 'queued') |
+                ((Resume.parse_status == 'parsing') & (Resume.updated_at < stale_before))
+            ).all()
+
+            for resume in stale:
+                # Stale 'parsing' rows go back to 'queued' so they can be claimed again
+                resume.parse_status = 'queued'
+            db.session.commit()
+
+            for resume in stale:
+                logging.info(f"Re-queueing resume {resume.id} for parsing")
+                self._queue.put((resume.id, None))
+
+    def _dispatch_loop(self):
+        while True:
+            try:
+                resume_id, content = self._queue.get(timeout=self.stale_after.total_seconds())
+            except queue.Empty:
+                # Idle: pick up rows whose parse outlived the process that ran it
+                try:
+                    self._recover()
+                except Exception as e:
+                    logging.error(f"Failed to recover stale resumes: {e}")
+                continue
+            if content is not None:
+                with self._lock:
+                    self._buffered_bytes -= len(content)
+            self._slots.acquire()
+            try:
+                self._dispatch(resume_id, content)
+            except Exception as e:
+                logging.error(f"Failed to dispatch resume {resume_id}: {e}")
+                self._slots.release()
+
+    def _dispatch(self, resume_id: int, content: Optional[bytes] = None):
+        """Claim a queued resume and hand it to a worker"""
+        with self.app.app_context():
+            # Atomic claim so the same row is never parsed twice
+            claimed = Resume.query.filter_by(id=resume_id, parse_status='queued').update(
+                {'parse_status': 'parsing', 'updated_at': datetime.utcnow()},
+                synchronize_session=False
+            )
+            db.session.commit()
+            if not claimed:
+                self._slots.release()
+                return
+
+        try:
+            self._parse_claimed(resume_id, content)
+        except Exception as e:
+            # Failing the row, rather than leaving it 'parsing', keeps recovery
+            # from re-queueing a resume that can never be dispatched
+            self._finish(resume_id, error=e)
+
+    def _parse_claimed(self, resume_id: int, content: Optional[bytes] = None):
+        """Parse a claimed resume, from the cache, inline or on the pool"""
+        with self.app.app_context():
+            resume = Resume.query.get(resume_id)
+            file_path = resume.file_path
+            file_type = os.path.splitext(resume.filename)[1]
+            job_profile = get_job_profile(resume.job)
+
+            try:
+                # Uploads are hashed from the request buffer; older rows are hashed here
+                content_hash = resume.content_hash
+                if content_hash is None:
+                    content_hash = hash_bytes(content) if content is not None else hash_file(file_path)
+                cached = parse_cache.get(content_hash)
+            except OSError as e:
+                logging.warning(f"Could not hash {file_path}: {e}")
+                content_hash, cached = None, None
+
+        source = content if content is not None else file_path
+
+        if cached is not None:
+            # Byte-identical file parsed before: only the per-job matching step runs
+            logging.info(f"Parse cache hit for resume {resume_id}")
+            self._finish(resume_id, result=score_parsed(cached, job_profile))
+            return
+
+        if self._executor is None:
+            # PARSE_WORKERS=0 parses on the dispatcher thread (handy for debugging)
+            result = parse_and_score(source, job_profile, file_type)
+            self._finish(resume_id, result=result, content_hash=content_hash)
+            return
+
+        self._submit(resume_id, content_hash, (source, job_profile, file_type))
+
+    def _submit(self, resume_id: int, content_hash: Optional[str], task: Tuple, retry: bool = False):
+        """Run parse_and_score(*task) on the pool, or alone on a one-worker pool when retrying"""
+        if retry:
+            executor = self._create_executor(workers=1)
+            future = executor.submit(parse_and_score, *task)
+        else:
+            executor = self._executor
+            try:
+                future = executor.submit(parse_and_score, *task)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed on a pathological file); start a fresh pool
+                logging.warning("Resume parse pool is broken, restarting it")
+                executor = self._replace_executor(executor)
+                future = executor.submit(parse_and_score, *task)
+        future.add_done_callback(lambda f: self._on_done(resume_id, content_hash, task, executor, retry, f))
+
+    def _replace_executor(self, broken):
+        """Swap a broken pool for a fresh one, once however many of its tasks report it"""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = self._create_executor()
+            executor = self._executor
+        # Usually called on the broken pool's own thread, which must not wait for itself
+        broken.shutdown(wait=False)
+        return executor
+
+    def _on_done(self, resume_id: int, content_hash: Optional[str], task: Tuple, executor, retry: bool, future):
+        error = future.exception()
+        if retry:
+            executor.shutdown(wait=False)
+        elif isinstance(error, BrokenProcessPool):
+            # A dying worker takes every resume in flight down with it. Retry each
+            # on its own pool so only the one that crashes a worker again fails
+            logging.warning(f"Resume parse pool crashed, retrying resume {resume_id} alone")
+            self._replace_executor(executor)
+            try:
+                self._submit(resume_id, content_hash, task, retry=True)
+                return
+            except Exception as e:
+                error = e
+
+        if error is not None:
+            self._finish(resume_id, error=error)
+        else:
+            self._finish(resume_id, result=future.result(), content_hash=content_hash)
+
+    def _finish(self, resume_id: int, result=None, error=None, content_hash=None):
+        """Write worker output back to the Resume row"""
+        try:
+            with self.app.app_context():
+                resume = Resume.query.get(resume_id)
+                if not resume:
+                    return
+
+                if error is not None:
+                    logging.error(f"Worker failed to parse resume {resume_id}: {error}")
+                    resume.parse_status = 'failed'
+                    resume.match_score = 0
+                elif result[0].get('parsing_status') != 'success':
+                    logging.warning(f"Resume {resume_id} could not be parsed: {result[0].get('error')}")
+                    resume.set_parsed_data(result[0])
+                    resume.parse_status = 'failed'
+                    resume.match_score = 0
+                else:
+                    parsed_data, match_score = result
+                    resume.set_parsed_data(parsed_data)
+                    resume.match_score = match_score
+                    resume.parse_status = 'scored'
+                    index_resume(resume, parsed_data)
+
+                db.session.commit()
+
+                if content_hash and error is None:
+                    parse_cache.put(content_hash, result[0])
+        except Exception as e:
+            logging.error(f"Failed to store parse result for resume {resume_id}: {e}")
+        finally:
+            self._slots.release()
+
+
+# Global instance
+parse_queue = ParseQueue()
@@ -0,0 +1,238 @@
+import logging
+import threading
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterator, Optional, Tuple
+from services.document_source import DocumentSource, as_bytes, is_path, open_stream
+
+# PDF libraries are imported on first use: they dominate import time and
+# most processes (and most requests) never open a PDF
+_fitz = False  # False until the import is attempted, None if PyMuPDF is missing
+
+
+def get_fitz():
+    """The PyMuPDF module, or None if it is not installed"""
+    global _fitz
+    if _fitz is False:
+        try:
+            import fitz  # PyMuPDF
+            _fitz = fitz
+        except ImportError:
+            _fitz = None
+            logging.warning("PyMuPDF not available, install with: pip install PyMuPDF")
+    return _fitz
+
+# Producer substrings known to extract better with a specific backend.
+# Keys are matched case-insensitively; tune these from the recorded backend stats.
+PRODUCER_BACKEND_HINTS = {}
+
+# PyPDF2 is markedly slower on long documents, so hints only apply below this size
+PYPDF2_MAX_PAGES = 5
+
+
+class PdfBackend:
+    """Base class for PDF text extraction backends.
+
+    A backend opens a document once; the same handle is used to collect the
+    cheap selection signals and, if the backend is chosen, to stream page text.
+    """
+
+    name = None
+
+    def available(self) -> bool:
+        return True
+
+    def open(self, source: DocumentSource):
+        """Open a document from a file path or an in-memory buffer"""
+        raise NotImplementedError
+
+    def signals(self, document) -> Dict:
+        """Cheap per-document signals: producer, page count, text layer presence"""
+        raise NotImplementedError
+
+    def iter_pages(self, document, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Yield the text of each page, decoding pages lazily"""
+        raise NotImplementedError
+
+    def close(self, document):
+        pass
+
+
+class PyMuPDFBackend(PdfBackend):
+    name = 'pymupdf'
+
+    def available(self) -> bool:
+        return get_fitz() is not None
+
+    def open(self, source: DocumentSource):
+        fitz = get_fitz()
+        if is_path(source):
+            return fitz.open(source)
+        return fitz.open(stream=as_bytes(source), filetype='pdf')
+
+    def signals(self, document) -> Dict:
+        page_count = document.page_count
+        return {
+            'producer': (document.metadata or {}).get('producer') or '',
+            'page_count': page_count,
+            # Scanned pages carry images but no fonts
+            'has_text_layer': page_count > 0 and bool(document[0].get_fonts())
+        }
+
+    def iter_pages(self, document, max_pages: Optional[int] = None) -> Iterator[str]:
+        page_count = document.page_count if max_pages is None else min(document.page_count, max_pages)
+        for page_number in range(page_count):
+            yield document.load_page(page_number).get_text()
+
+    def close(self, document):
+        document.close()
+
+
+class PyPDF2Backend(PdfBackend):
+    name = 'pypdf2'
+
+    def open(self, source: DocumentSource):
+        import PyPDF2
+        return PyPDF2.PdfReader(source if is_path(source) else open_stream(source))
+
+    def signals(self, document) -> Dict:
+        page_count = len(document.pages)
+        has_text_layer = False
+        if page_count:
+            resources = document.pages[0].get('/Resources') or {}
+            has_text_layer = '/Font' in resources
+        metadata = document.metadata
+        return {
+            'producer': (metadata.producer if metadata else None) or '',
+            'page_count': page_count,
+            'has_text_layer': has_text_layer
+        }
+
+    def iter_pages(self, document, max_pages: Optional[int] = None) -> Iterator[str]:
+        for page in islice(document.pages, max_pages):
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text
+
+
+PDF_BACKENDS = {
+    PyMuPDFBackend.name: PyMuPDFBackend(),
+    PyPDF2Backend.name: PyPDF2Backend(),
+}
+
+# How often each backend won, for tuning PRODUCER_BACKEND_HINTS
+backend_usage = Counter()
+_usage_lock = threading.Lock()
+
+
+def register_backend(backend: PdfBackend):
+    """Make an additional extraction backend selectable"""
+    PDF_BACKENDS[backend.name] = backend
+
+
+def choose_backend(signals: Dict) -> str:
+    """Pick one backend per document from cheap signals"""
+    if not PDF_BACKENDS[PyMuPDFBackend.name].available():
+        return PyPDF2Backend.name
+
+    # Without a text layer PyPDF2 finds nothing; PyMuPDF copes with odd encodings best
+    if not signals.get('has_text_layer'):
+        return PyMuPDFBackend.name
+
+    producer = signals.get('producer', '').lower()
+    if producer and signals.get('page_count', 0) <= PYPDF2_MAX_PAGES:
+        for hint, backend_name in PRODUCER_BACKEND_HINTS.items():
+            if hint.lower() in producer and backend_name in PDF_BACKENDS:
+                return backend_name
+
+    return PyMuPDFBackend.name
+
+
+def iter_pdf_pages(source: DocumentSource, info: Optional[Dict] = None,
+                   max_pages: Optional[int] = None) -> Iterator[str]:
+    """Stream page texts from a single backend chosen up front.
+
+    ``info`` is filled with the selection signals and the backend that ran.
+    Closing the generator early leaves the remaining pages undecoded.
+    """
+    info = {} if info is None else info
+    probe = PDF_BACKENDS[PyMuPDFBackend.name]
+    if not probe.available():
+        probe = PDF_BACKENDS[PyPDF2Backend.name]
+
+    document = probe.open(source)
+    try:
+        signals = probe.signals(document)
+        info.update(signals)
+        if max_pages is not None and signals['page_count'] > max_pages:
+            info['truncated'] = True
+
+        backend = PDF_BACKENDS[choose_backend(signals)]
+        if backend is not probe:
+            probe.close(document)
+            document = None
+
+        info['backend'] = backend.name
+        with _usage_lock:
+            backend_usage[backend.name] += 1
+        logging.info(f"Extracting PDF with {backend.name} "
+                     f"(producer={signals['producer']!r}, pages={signals['page_count']})")
+
+        # The probe's document is reused when the probe backend wins
+        yield from _iter_with_fallback(backend, document, source, info, max_pages)
+    finally:
+        if document is not None:
+            probe.close(document)
+
+
+def extract_pdf_text(source: DocumentSource, max_pages: Optional[int] = None) -> Tuple[str, Dict]:
+    """Extract text from a PDF in a single pass, returning (text, extraction_info)"""
+    info = {}
+    text = "\n".join(iter_pdf_pages(source, info, max_pages))
+    return text.strip(), info
+
+
+def _iter_with(backend: PdfBackend, document, source: DocumentSource, max_pages: Optional[int]) -> Iterator[str]:
+    if document is not None:
+        yield from backend.iter_pages(document, max_pages)
+        return
+    document = backend.open(source)
+    try:
+        yield from backend.iter_pages(document, max_pages)
+    finally:
+        backend.close(document)
+
+
+def _iter_with_fallback(backend: PdfBackend, document, source: DocumentSource, info: Dict,
+                        max_pages: Optional[int]) -> Iterator[str]:
+    """Stream with the chosen backend, trying the others only if it fails before any output"""
+    pages_yielded = 0
+    try:
+        for page_text in _iter_with(backend, document, source, max_pages):
+            pages_yielded += 1
+            yield page_text
+        return
+    except Exception as e:
+        if pages_yielded:
+            raise
+        logging.warning(f"{backend.name} extraction failed: {e}")
+
+    for fallback in PDF_BACKENDS.values():
+        if fallback is backend or not fallback.available():
+            continue
+        try:
+            pages = list(_iter_with(fallback, None, source, max_pages))
+        except Exception as e:
+            logging.warning(f"{fallback.name} extraction failed: {e}")
+            continue
+        info['backend'] = fallback.name
+        yield from pages
+        return
+
+    raise ValueError("No PDF backend could extract text")
+
+
+def get_backend_stats() -> Dict[str, int]:
+    """Snapshot of backend usage counts"""
+    with _usage_lock:
+        return dict(backend_usage)
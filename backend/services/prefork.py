@@ -0,0 +1,64 @@
+import gc
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from services.nlp_models import get_nlp
+from services.skill_taxonomy import get_taxonomy
+
+# Fields of /proc/<pid>/smaps_rollup reported by memory_stats, in kB
+SMAPS_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+
+def warm_up() -> Dict:
+    """Build everything a forked process would otherwise build on first use.
+
+    Meant to run once in a process that others are forked from: the gunicorn
+    master (see gunicorn.conf.py) and the parse pool's fork server (see
+    services/parse_preload.py). The spaCy pipeline, the skills taxonomy with
+    its compiled skill matcher, and the parser and matcher modules, whose
+    regexes compile at import, are loaded before the fork. Everything
+    allocated so far is then moved to the permanent GC generation with
+    gc.freeze(), so collections in the children do not write to those
+    objects and their pages stay shared copy-on-write.
+    """
+    started = time.perf_counter()
+
+    taxonomy = get_taxonomy()
+    nlp = get_nlp()
+    from services import enhanced_job_matcher, resume_parser  # noqa: F401
+
+    gc.collect()
+    gc.freeze()
+
+    result = {
+        'seconds': round(time.perf_counter() - started, 3),
+        'taxonomy_version': taxonomy.version,
+        'nlp_loaded': nlp is not None,
+        'frozen_objects': gc.get_freeze_count()
+    }
+    logging.info(f"Warmed up before fork: {result}")
+    return result
+
+
+def memory_stats(pid: Optional[int] = None) -> Dict:
+    """A process's memory split into shared and private pages (Linux only).
+
+    Private pages are what each additional worker really costs; shared pages
+    are the copy-on-write ones inherited from the process it was forked
+    from. Defaults to the current process.
+    """
+    stats = {'pid': pid or os.getpid()}
+    try:
+        with open(f"/proc/{pid or 'self'}/smaps_rollup") as smaps:
+            for line in smaps:
+                name, _, value = line.partition(':')
+                if name in SMAPS_FIELDS:
+                    stats[name.lower() + '_kb'] = int(value.split()[0])
+    except OSError:
+        return stats
+
+    stats['private_kb'] = stats.get('private_clean_kb', 0) + stats.get('private_dirty_kb', 0)
+    stats['shared_kb'] = stats.get('shared_clean_kb', 0) + stats.get('shared_dirty_kb', 0)
+    return stats
@@ -1,93 +1,101 @@
-import spacy
 import re
-import json
-from pathlib import Path
-import PyPDF2
-from docx import Document
+import os
 import logging
-from typing import Dict, List, Optional, Tuple
-import dateutil.parser as date_parser
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from services.document_source import DocumentSource, detect_file_type
+from services.docx_text import iter_docx_text
+from services.nlp_models import get_nlp
+from services.pdf_backends import iter_pdf_pages
+from services import resume_patterns as patterns
+from services.resume_sections import ResumeSections
+from services.skill_taxonomy import get_taxonomy
+
+# Bump whenever extraction output changes so cached parses are not reused
+PARSER_VERSION = '5'
 
 class ResumeParser:
-    def __init__(self):
-        """Initialize the resume parser with spaCy model"""
-        self.nlp = None
-        try:
-            # Try to load the spaCy model
-            self.nlp = spacy.load("en_core_web_sm")
-            logging.info("spaCy model loaded successfully")
-        except OSError as e:
-            logging.warning(f"spaCy model not found: {e}")
-            logging.info("Falling back to basic text processing (install 'en_core_web_sm' for better results)")
-        except Exception as e:
-            logging.error(f"Failed to load spaCy model: {e}")
-            logging.info("Using basic text processing without NLP model")
+    def __init__(self, max_pages: Optional[int] = None, max_chars: Optional[int] = None):
+        """Initialize the resume parser"""
+        # Caps so an oversized "portfolio" upload cannot pin a worker
+        self.max_pages = max_pages or int(os.getenv('RESUME_MAX_PAGES', '20'))
+        self.max_chars = max_chars or int(os.getenv('RESUME_MAX_CHARS', '100000'))
+    
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded on first use (None if unavailable)"""
+        return get_nlp()
+    
+    def iter_pdf_pages(self, source: DocumentSource, info: Optional[Dict] = None) -> Iterator[str]:
+        """Stream PDF text one page at a time, up to max_pages"""
+        return iter_pdf_pages(source, info, self.max_pages)
     
     def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file using multiple methods"""
-        text = ""
-        
+        """Extract text from PDF file"""
+        text, _ = self.extract_pdf_with_info(file_path)
+        return text
+    
+    def extract_pdf_with_info(self, source: DocumentSource) -> Tuple[str, Dict]:
+        """Extract PDF text with one backend chosen up front; also returns which backend ran"""
+        info = {}
         try:
-            # Method 1: Try PyPDF2 first
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            
-            # If we got substantial text, return it
-            if len(text.strip()) > 50:
-                return text.strip()
-            
-            # Method 2: Try alternative approach with more flexible extraction
-            logging.warning(f"PyPDF2 extracted minimal text ({len(text)} chars), trying alternative method")
-            
-            try:
-                import fitz  # PyMuPDF
-                doc = fitz.open(file_path)
-                alternative_text = ""
-                for page in doc:
-                    alternative_text += page.get_text() + "\n"
-                doc.close()
-                
-                if len(alternative_text.strip()) > len(text.strip()):
-                    logging.info("PyMuPDF extracted more text, using it")
-                    return alternative_text.strip()
-                    
-            except ImportError:
-                logging.warning("PyMuPDF not available, install with: pip install PyMuPDF")
-            except Exception as e:
-                logging.warning(f"PyMuPDF extraction failed: {e}")
-            
-            # Return whatever we got
-            return text.strip()
-            
+            return self.collect_text(self.iter_pdf_pages(source, info), info), info
         except Exception as e:
             logging.error(f"Error extracting text from PDF: {e}")
-            return ""
+            return "", {}
+    
+    def iter_docx_paragraphs(self, source: DocumentSource) -> Iterator[str]:
+        """Stream DOCX text one paragraph (or table row) at a time, headers first"""
+        return iter_docx_text(source)
     
     def extract_text_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
+        text, _ = self.extract_docx_with_info(file_path)
+        return text
+    
+    def extract_docx_with_info(self, source: DocumentSource) -> Tuple[str, Dict]:
+        """Extract DOCX text; also returns extraction details"""
+        info = {'backend': 'docx-xml'}
         try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return self.collect_text(self.iter_docx_paragraphs(source), info), info
         except Exception as e:
             logging.error(f"Error extracting text from DOCX: {e}")
-            return ""
+            return "", {}
+    
+    def collect_text(self, chunks: Iterator[str], info: Dict) -> str:
+        """Join streamed text chunks, stopping early once max_chars is reached"""
+        parts = []
+        total_chars = 0
+        try:
+            for chunk in chunks:
+                total_chars += len(chunk)
+                if total_chars > self.max_chars:
+                    parts.append(chunk[:len(chunk) - (total_chars - self.max_chars)])
+                    info['truncated'] = True
+                    logging.warning(f"Resume text capped at {self.max_chars} characters")
+                    break
+                parts.append(chunk)
+        finally:
+            # Stop the producer now so the rest of the document is never decoded
+            close = getattr(chunks, 'close', None)
+            if close:
+                close()
+        return "\n".join(parts).strip()
     
     def extract_text(self, file_path: str) -> str:
         """Extract text from resume file based on extension"""
-        file_ext = Path(file_path).suffix.lower()
+        text, _ = self.extract_text_with_info(file_path)
+        return text
+    
+    def extract_text_with_info(self, source: DocumentSource, file_type: Optional[str] = None) -> Tuple[str, Dict]:
+        """Extract text from a file path or in-memory document, plus details about how it was extracted"""
+        file_ext = detect_file_type(source, file_type)
         
         if file_ext == '.pdf':
-            return self.extract_text_from_pdf(file_path)
+            return self.extract_pdf_with_info(source)
         elif file_ext == '.docx':
-            return self.extract_text_from_docx(file_path)
+            return self.extract_docx_with_info(source)
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
@@ -100,7 +108,7 @@ class ResumeParser:
             line = line.strip()
             if len(line.split()) >= 2 and len(line.split()) <= 4:
                 # Check if it looks like a name (not email, phone, etc.)
-                if not re.search(r'[@\d\+\-\(\)]', line) and len(line) > 3:
+                if not patterns.NAME_EXCLUDED.search(line) and len(line) > 3:
                     # Additional checks to avoid false positives
                     words = line.split()
                     if all(word.isalpha() or word.replace('.', '').isalpha() for word in words):
@@ -113,54 +121,33 @@ class ResumeParser:
         contact_info = {}
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        contact_info['email'] = emails[0] if emails else ""
-        
-        # Extract phone number (enhanced patterns)
-        phone_patterns = [
-            r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\+?\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}',
-            r'\d{3}[-.\s]\d{3}[-.\s]\d{4}'
-        ]
+        email = patterns.EMAIL.search(text)
+        contact_info['email'] = email.group() if email else ""
         
+        # Extract phone number (enhanced patterns, first one that matches wins)
         phone = ""
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                phone = phones[0]
+        for pattern in patterns.PHONES:
+            match = pattern.search(text)
+            if match:
+                phone = match.group()
                 break
         contact_info['phone'] = phone
         
         # Extract LinkedIn
-        linkedin_patterns = [
-            r'linkedin\.com/in/[\w-]+',
-            r'linkedin\.com/[\w-]+',
-            r'www\.linkedin\.com/in/[\w-]+'
-        ]
-        
         linkedin = ""
-        for pattern in linkedin_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                linkedin = matches[0]
+        for pattern in patterns.LINKEDIN:
+            match = pattern.search(text)
+            if match:
+                linkedin = match.group()
                 break
         contact_info['linkedin'] = linkedin
         
         # Extract location/address
-        location_patterns = [
-            r'Location[:\s]+([^\n]+)',
-            r'Address[:\s]+([^\n]+)',
-            r'\b([A-Z][a-z]+,\s*[A-Z][a-z]+)\b',  # City, State
-            r'\b([A-Z][a-z]+,\s*[A-Z]{2})\b'      # City, ST
-        ]
-        
         location = ""
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                location = matches[0]
+        for pattern in patterns.LOCATIONS:
+            match = pattern.search(text)
+            if match:
+                location = match.group(1)
                 break
         contact_info['location'] = location
         
@@ -168,130 +155,27 @@ class ResumeParser:
     
     def extract_skills(self, text: str) -> List[str]:
         """Enhanced skills extraction with comprehensive keyword matching"""
-        skills = set()
-        text_lower = text.lower()
-        
-        # Comprehensive list of technical skills
-        tech_skills = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c sharp', 'php', 'ruby', 
-            'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash',
-            
-            # Web Frontend
-            'html', 'css', 'react', 'reactjs', 'angular', 'angularjs', 'vue.js', 'vuejs', 'jquery',
-            'bootstrap', 'tailwind', 'material ui', 'sass', 'scss', 'less', 'webpack', 'babel',
-            
-            # Web Backend  
-            'node.js', 'nodejs', 'express.js', 'express', 'django', 'flask', 'fastapi', 
-            'spring', 'spring boot', 'laravel', 'rails', 'asp.net', '.net', 'dotnet',
-            
-            # Databases
-            'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'sqlite', 'oracle',
-            'cassandra', 'elasticsearch', 'dynamodb', 'neo4j', 'sql server',
-            
-            # Cloud Platforms
-            'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud',
-            'heroku', 'digitalocean', 'linode',
-            
-            # DevOps & Tools
-            'docker', 'kubernetes', 'jenkins', 'gitlab', 'github', 'terraform', 'ansible',
-            'chef', 'puppet', 'vagrant', 'git', 'svn', 'mercurial',
-            
-            # Data Science & AI
-            'machine learning', 'ml', 'artificial intelligence', 'ai', 'data science',
-            'deep learning', 'neural networks', 'tensorflow', 'pytorch', 'keras',
-            'scikit-learn', 'sklearn', 'pandas', 'numpy', 'matplotlib', 'seaborn',
-            'jupyter', 'r studio', 'tableau', 'power bi',
-            
-            # Mobile Development
-            'android', 'ios', 'react native', 'flutter', 'xamarin', 'cordova', 'phonegap',
-            
-            # Others
-            'rest api', 'restful', 'graphql', 'soap', 'microservices', 'agile', 'scrum',
-            'devops', 'ci/cd', 'linux', 'unix', 'windows', 'macos', 'blockchain', 'iot',
-            'version control', 'unit testing', 'integration testing', 'tdd', 'bdd'
-        ]
-        
-        # Find skills in text
-        for skill in tech_skills:
-            # Check for exact matches
-            if skill in text_lower:
-                skills.add(skill.title() if skill.islower() else skill)
-            
-            # Check for word boundaries for single words
-            if ' ' not in skill and re.search(rf'\b{re.escape(skill)}\b', text_lower):
-                skills.add(skill.title() if skill.islower() else skill)
-        
-        # Special handling for common abbreviations and variations
-        skill_variations = {
-            'js': 'JavaScript', 'ts': 'TypeScript', 'py': 'Python', 
-            'db': 'Database', 'api': 'API', 'ui': 'UI', 'ux': 'UX',
-            'ml': 'Machine Learning', 'ai': 'Artificial Intelligence',
-            'css3': 'CSS', 'html5': 'HTML', 'es6': 'JavaScript'
-        }
-        
-        for abbr, full_name in skill_variations.items():
-            if re.search(rf'\b{re.escape(abbr)}\b', text_lower):
-                skills.add(full_name)
-        
-        return sorted(list(skills))
+        # The shared taxonomy finds every vocabulary entry in one pass
+        return get_taxonomy().find_skills(text)
     
-    def extract_experience(self, text: str) -> Tuple[List[Dict], int]:
+    def extract_experience(self, text: str, sections: Optional[ResumeSections] = None) -> Tuple[List[Dict], int]:
         """Enhanced experience extraction with detailed parsing"""
         experiences = []
         total_years = 0
         
-        # Look for experience sections and also scan full text for experience mentions
-        experience_section = ""
-        lines = text.split('\n')
-        
-        in_experience_section = False
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            
-            # Detect experience section start
-            if any(keyword in line_lower for keyword in ['experience', 'work history', 'employment', 'career']):
-                in_experience_section = True
-                continue
-            
-            # Stop at next major section
-            if in_experience_section and any(keyword in line_lower for keyword in ['education', 'skills', 'projects', 'certifications']):
-                break
-                
-            if in_experience_section:
-                experience_section += line + "\n"
-        
-        # Enhanced job parsing patterns for the specific format in the resume
-        exp_patterns = [
-            # Pattern 1: "Position | Company | Date - Date (Duration)" - Main format
-            r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager|Analyst|Specialist|Programmer)[^|\n]*?)\s*\|\s*([^|\n]+?(?:LLC|Inc|Corp|Company|Solutions|Group|Tech)[^|\n]*?)\s*\|\s*([A-Za-z]+ \d{4} - (?:Present|[A-Za-z]+ \d{4}))',
-            
-            # Pattern 2: Job title on separate line, company and dates following
-            r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager|Analyst|Specialist))\s*[\n\r]+([^|\n]+(?:LLC|Inc|Corp|Company|Solutions|Group))[^|\n]*[\n\r]*([A-Za-z]+ \d{4} - (?:Present|[A-Za-z]+ \d{4}))',
-            
-            # Pattern 3: Simple "Position | Company" format (company names with common suffixes)
-            r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager|Analyst|Specialist)[^|\n]*?)\s*\|\s*([A-Z][^|\n]+?(?:LLC|Inc|Corp|Company|Solutions|Group|Tech))',
-            
-            # Pattern 4: Alternative format with "at" 
-            r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager)[^|\n]*?)\s+at\s+([A-Z][^|\n]+?)\s*(?:\||\n)',
-        ]
+        # Read the experience section; the full text is also scanned for experience mentions
+        sections = sections or ResumeSections(text)
+        experience_section = sections.section_text('experience')
         
         # First, look for date ranges in the experience section
         date_ranges = []
-        date_patterns = [
-            r'([A-Za-z]+ \d{4})\s*-\s*(Present|[A-Za-z]+ \d{4})\s*(?:\([^)]+\))?',  # "Jan 2021 - Present (3 years)"
-            r'(\d{4})\s*-\s*(Present|\d{4})',                                        # "2021 - Present"
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, experience_section, re.IGNORECASE)
-            for start_date, end_date in matches:
+        for pattern in patterns.DATE_RANGES:
+            for start_date, end_date in pattern.findall(experience_section):
                 date_ranges.append((start_date.strip(), end_date.strip()))
         
         # Parse job entries with improved logic
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, experience_section, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-            for match in matches:
+        for pattern, titles in patterns.EXPERIENCE_ENTRIES:
+            for match in patterns.find_title_matches(pattern, titles, experience_section):
                 position = match[0].strip()
                 company = match[1].strip()
                 duration = match[2].strip() if len(match) > 2 and match[2].strip() else ""
@@ -345,7 +229,7 @@ class ResumeParser:
                         duration = ""
                         
                         # Look for date pattern at end
-                        date_match = re.search(r'([A-Za-z]+ \d{4} - (?:Present|[A-Za-z]+ \d{4}))', company_and_date)
+                        date_match = patterns.DATE_RANGE_IN_LINE.search(company_and_date)
                         if date_match:
                             duration = date_match.group(1)
                             company = company_and_date.replace(duration, '').strip()
@@ -360,16 +244,9 @@ class ResumeParser:
         duration_text = (experience_section + " " + text).lower()
         
         # Priority 1: Look for explicit professional summary mentions (most reliable)
-        summary_patterns = [
-            r'(?:experienced|seasoned|senior).*?with\s*(\d+)\s*years?\s*of\s*(?:expertise|experience)',
-            r'(\d+)\s*years?\s*of\s*(?:expertise|experience).*?(?:developer|engineer|professional)',
-            r'professional.*?with\s*(\d+)\s*years?',
-        ]
-        
         summary_years = []
-        for pattern in summary_patterns:
-            matches = re.findall(pattern, duration_text)
-            for match in matches:
+        for pattern in patterns.SUMMARY_YEARS:
+            for match in pattern.findall(duration_text):
                 try:
                     years = int(match)
                     if 0 < years <= 50:  # Reasonable range
@@ -381,13 +258,13 @@ class ResumeParser:
         calculated_years = []
         for start_date, end_date in date_ranges:
             try:
-                start_year = int(re.search(r'\d{4}', start_date).group())
+                start_year = int(patterns.YEAR.search(start_date).group())
                 current_year = 2026
                 
                 if 'present' in end_date.lower() or 'current' in end_date.lower():
                     end_year = current_year
                 else:
-                    end_year_match = re.search(r'\d{4}', end_date)
+                    end_year_match = patterns.YEAR.search(end_date)
                     end_year = int(end_year_match.group()) if end_year_match else current_year
                 
                 if start_year > 0 and end_year >= start_year:
@@ -397,25 +274,15 @@ class ResumeParser:
             except (ValueError, AttributeError):
                 continue
         
-        # Priority 3: Look for explicit duration mentions in job descriptions
-        job_duration_patterns = [
-            r'\((\d+)\s*years?\)',      # "(3 years)"
-            r'\((\d+)\s*months?\)',     # "(6 months)" 
-        ]
-        
+        # Priority 3: Look for explicit duration mentions in job descriptions,
+        # "(3 years)" and "(6 months)" collected in a single pass
         explicit_years = []
         explicit_months = []
-        for pattern in job_duration_patterns:
-            matches = re.findall(pattern, duration_text)
-            for match in matches:
-                try:
-                    value = int(match)
-                    if 'year' in pattern:
-                        explicit_years.append(value)
-                    else:  # months
-                        explicit_months.append(value)
-                except (ValueError, TypeError):
-                    continue
+        for value, unit in patterns.EXPLICIT_DURATION.findall(duration_text):
+            if unit.startswith('year'):
+                explicit_years.append(int(value))
+            else:  # months
+                explicit_months.append(int(value))
         
         # Determine final total years using priority system
         if summary_years:
@@ -433,27 +300,12 @@ class ResumeParser:
         
         return experiences, max(total_years, 0)
     
-    def extract_education(self, text: str) -> List[Dict]:
+    def extract_education(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict]:
         """Enhanced education extraction"""
         educations = []
         
         # Look for education section
-        education_section = ""
-        lines = text.split('\n')
-        
-        in_education_section = False
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            if any(keyword in line_lower for keyword in ['education', 'academic', 'qualification']):
-                in_education_section = True
-                continue
-            
-            if in_education_section and any(keyword in line_lower for keyword in ['experience', 'skills', 'projects', 'certifications']):
-                break
-                
-            if in_education_section:
-                education_section += line + "\n"
+        sections = sections or ResumeSections(text)
         
         # Education patterns
         degree_keywords = [
@@ -463,7 +315,7 @@ class ResumeParser:
         ]
         
         # Find degree information
-        lines = education_section.split('\n')
+        lines = sections.section_lines('education')
         current_education = {}
         
         for line in lines:
@@ -486,7 +338,7 @@ class ResumeParser:
                     break
             
             # Look for years (graduation year)
-            year_matches = re.findall(r'\b(19|20)\d{2}\b', line)
+            year_matches = patterns.GRADUATION_YEAR.findall(line)
             if year_matches and current_education:
                 years = [int(y) for y in year_matches]
                 if len(years) == 2:
@@ -505,30 +357,15 @@ class ResumeParser:
         
         return educations
     
-    def extract_projects(self, text: str) -> List[Dict]:
+    def extract_projects(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict]:
         """Extract project information"""
         projects = []
         
         # Look for projects section
-        project_section = ""
-        lines = text.split('\n')
-        
-        in_project_section = False
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            if any(keyword in line_lower for keyword in ['projects', 'project work', 'key projects']):
-                in_project_section = True
-                continue
-            
-            if in_project_section and any(keyword in line_lower for keyword in ['experience', 'skills', 'education', 'certifications']):
-                break
-                
-            if in_project_section:
-                project_section += line + "\n"
+        sections = sections or ResumeSections(text)
         
         # Parse projects
-        project_lines = [line.strip() for line in project_section.split('\n') if line.strip()]
+        project_lines = [line.strip() for line in sections.section_lines('projects') if line.strip()]
         current_project = None
         
         for line in project_lines:
@@ -557,11 +394,15 @@ class ResumeParser:
         
         return projects
     
-    def parse_resume(self, file_path: str) -> Dict:
-        """Main method to parse resume and extract all information"""
+    def parse_resume(self, source: DocumentSource, file_type: Optional[str] = None) -> Dict:
+        """Main method to parse resume and extract all information.
+        
+        ``source`` is a file path or the document's bytes (bytes, memoryview or
+        mmap); ``file_type`` ('pdf'/'docx') is sniffed from the bytes if omitted.
+        """
         try:
             # Extract text from file
-            text = self.extract_text(file_path)
+            text, extraction_info = self.extract_text_with_info(source, file_type)
             
             if not text:
                 raise ValueError("Could not extract text from resume")
@@ -569,8 +410,11 @@ class ResumeParser:
             # Extract candidate name
             candidate_name = self.extract_name(text)
             
+            # Segment the text into sections once for every extractor
+            sections = ResumeSections(text)
+            
             # Extract experience and calculate years
-            experiences, total_experience_years = self.extract_experience(text)
+            experiences, total_experience_years = self.extract_experience(text, sections)
             
             # Extract all information using enhanced methods
             parsed_data = {
@@ -579,9 +423,10 @@ class ResumeParser:
                 'contact_info': self.extract_contact_info(text),
                 'skills': self.extract_skills(text),
                 'experience': experiences,
-                'education': self.extract_education(text),
-                'projects': self.extract_projects(text),
+                'education': self.extract_education(text, sections),
+                'projects': self.extract_projects(text, sections),
                 'total_experience_years': total_experience_years,
+                'extraction': extraction_info,
                 'parsing_status': 'success'
             }
             
@@ -589,27 +434,105 @@ class ResumeParser:
             
         except Exception as e:
             logging.error(f"Error parsing resume: {e}")
-            return {
-                'raw_text': '',
-                'candidate_name': '',
-                'contact_info': {},
-                'skills': [],
-                'experience': [],
-                'education': [],
-                'projects': [],
-                'total_experience_years': 0,
-                'parsing_status': 'failed',
-                'error': str(e)
-            }
+            return self.failed_result(str(e))
+    
+    @staticmethod
+    def failed_result(error: str) -> Dict:
+        """Parsed-data shape returned when a resume cannot be parsed"""
+        return {
+            'raw_text': '',
+            'candidate_name': '',
+            'contact_info': {},
+            'skills': [],
+            'experience': [],
+            'education': [],
+            'projects': [],
+            'total_experience_years': 0,
+            'parsing_status': 'failed',
+            'error': error
+        }
+    
+    def parse_many(self, file_paths: Iterable[str], workers: Optional[int] = None) -> Iterator[Tuple[str, Dict]]:
+        """Parse many resumes on a process pool, yielding (file_path, parsed_data) as each finishes.
+        
+        Results arrive in completion order, not input order. A file that crashes
+        its worker is reported as a failed parse instead of aborting the batch:
+        the pool is replaced and the other files that were in flight are retried.
+        """
+        file_paths = iter(file_paths)
+        workers = workers or os.cpu_count() or 1
+        
+        if workers == 1:
+            for file_path in file_paths:
+                yield file_path, self.parse_resume(file_path)
+            return
+        
+        # Keep a bounded number of files in flight so huge batches stay cheap
+        max_in_flight = workers * 4
+        executor = ProcessPoolExecutor(max_workers=workers)
+        pending = {}
+        # Files in flight when a worker died; the whole pool goes down with it
+        suspects = []
+        
+        def fill():
+            for file_path in file_paths:
+                try:
+                    future = executor.submit(_parse_in_worker, file_path)
+                except BrokenProcessPool:
+                    suspects.append(file_path)
+                    return
+                pending[future] = file_path
+                if len(pending) >= max_in_flight:
+                    break
+        
+        try:
+            fill()
+            while pending or suspects:
+                if pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        file_path = pending.pop(future)
+                        try:
+                            parsed_data = future.result()
+                        except BrokenProcessPool:
+                            suspects.append(file_path)
+                            continue
+                        except Exception as e:
+                            logging.error(f"Worker failed on {file_path}: {e}")
+                            parsed_data = self.failed_result(str(e))
+                        yield file_path, parsed_data
+                
+                if suspects:
+                    # Retry every file that was in flight on its own, in a new
+                    # pool, so only the one that crashes a worker fails
+                    suspects.extend(pending.values())
+                    pending.clear()
+                    retry, suspects[:] = list(suspects), []
+                    executor.shutdown(wait=True)
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    for file_path in retry:
+                        try:
+                            parsed_data = executor.submit(_parse_in_worker, file_path).result()
+                        except BrokenProcessPool as e:
+                            logging.error(f"Worker crashed on {file_path}: {e}")
+                            parsed_data = self.failed_result(f"Worker crashed: {e}")
+                            executor.shutdown(wait=True)
+                            executor = ProcessPoolExecutor(max_workers=workers)
+                        except Exception as e:
+                            logging.error(f"Worker failed on {file_path}: {e}")
+                            parsed_data = self.failed_result(str(e))
+                        yield file_path, parsed_data
+                
+                fill()
+        finally:
+            executor.shutdown(wait=True)
 
 # Job matching functionality
 class JobMatcher:
-    def __init__(self):
-        self.nlp = None
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            pass
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded on first use (None if unavailable)"""
+        return get_nlp()
     
     def calculate_skills_match(self, resume_skills: List[str], job_skills: List[str]) -> float:
         """Calculate skills match percentage"""
@@ -679,6 +602,10 @@ class JobMatcher:
             logging.error(f"Error calculating match score: {e}")
             return 0.0
 
+def _parse_in_worker(file_path: str) -> Dict:
+    """parse_many worker: reuses the module-level parser, so each process loads spaCy once"""
+    return resume_parser.parse_resume(file_path)
+
 # Global instances
 resume_parser = ResumeParser()
 job_matcher = JobMatcher()
\ No newline at end of file
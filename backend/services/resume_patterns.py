@@ -0,0 +1,107 @@
+import re
+from typing import List, Tuple
+
+# Compiled once for ResumeParser. Where a field keeps "first pattern that
+# matches wins" semantics the patterns stay separate and use search(), which
+# stops at the first hit instead of collecting every match with findall().
+
+# Name lines never contain these
+NAME_EXCLUDED = re.compile(r'[@\d\+\-\(\)]')
+
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# In priority order. "+1 555 123 4567" without parentheses used to be a
+# pattern of its own, but the first pattern already matches everything it did.
+PHONES = (
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    re.compile(r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}'),
+    re.compile(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}'),
+)
+
+# "www.linkedin.com/in/..." is always found by the first pattern already
+LINKEDIN = (
+    re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE),
+    re.compile(r'linkedin\.com/[\w-]+', re.IGNORECASE),
+)
+
+LOCATIONS = (
+    re.compile(r'Location[:\s]+([^\n]+)', re.IGNORECASE),
+    re.compile(r'Address[:\s]+([^\n]+)', re.IGNORECASE),
+    re.compile(r'\b([A-Z][a-z]+,\s*[A-Z][a-z]+)\b', re.IGNORECASE),  # City, State
+    re.compile(r'\b([A-Z][a-z]+,\s*[A-Z]{2})\b', re.IGNORECASE),     # City, ST
+)
+
+
+def _titles(*names: str):
+    return re.compile('|'.join(names), re.IGNORECASE)
+
+
+# Job entries: (pattern, the job titles its first group ends with)
+_EXPERIENCE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+_TITLES = ('Developer', 'Engineer', 'Manager', 'Analyst', 'Specialist')
+EXPERIENCE_ENTRIES = (
+    # "Position | Company | Date - Date (Duration)" - Main format
+    (re.compile(r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager|Analyst|Specialist|Programmer)[^|\n]*?)\s*\|\s*([^|\n]+?(?:LLC|Inc|Corp|Company|Solutions|Group|Tech)[^|\n]*?)\s*\|\s*([A-Za-z]+ \d{4} - (?:Present|[A-Za-z]+ \d{4}))', _EXPERIENCE_FLAGS),
+     _titles(*_TITLES, 'Programmer')),
+    # Job title on separate line, company and dates following
+    (re.compile(r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager|Analyst|Specialist))\s*[\n\r]+([^|\n]+(?:LLC|Inc|Corp|Company|Solutions|Group))[^|\n]*[\n\r]*([A-Za-z]+ \d{4} - (?:Present|[A-Za-z]+ \d{4}))', _EXPERIENCE_FLAGS),
+     _titles(*_TITLES)),
+    # Simple "Position | Company" format (company names with common suffixes)
+    (re.compile(r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager|Analyst|Specialist)[^|\n]*?)\s*\|\s*([A-Z][^|\n]+?(?:LLC|Inc|Corp|Company|Solutions|Group|Tech))', _EXPERIENCE_FLAGS),
+     _titles(*_TITLES)),
+    # Alternative format with "at"
+    (re.compile(r'([A-Z][a-zA-Z\s]+(?:Developer|Engineer|Manager)[^|\n]*?)\s+at\s+([A-Z][^|\n]+?)\s*(?:\||\n)', _EXPERIENCE_FLAGS),
+     _titles('Developer', 'Engineer', 'Manager')),
+)
+
+# The same character class as the title prefix, under the same flags
+_TITLE_RUN = re.compile(r'[a-zA-Z\s]+', re.IGNORECASE)
+
+DATE_RANGES = (
+    re.compile(r'([A-Za-z]+ \d{4})\s*-\s*(Present|[A-Za-z]+ \d{4})\s*(?:\([^)]+\))?', re.IGNORECASE),  # "Jan 2021 - Present (3 years)"
+    re.compile(r'(\d{4})\s*-\s*(Present|\d{4})', re.IGNORECASE),                                        # "2021 - Present"
+)
+DATE_RANGE_IN_LINE = re.compile(r'([A-Za-z]+ \d{4} - (?:Present|[A-Za-z]+ \d{4}))')
+YEAR = re.compile(r'\d{4}')
+
+# Professional summary mentions, matched against lowercased text
+SUMMARY_YEARS = (
+    re.compile(r'(?:experienced|seasoned|senior).*?with\s*(\d+)\s*years?\s*of\s*(?:expertise|experience)'),
+    re.compile(r'(\d+)\s*years?\s*of\s*(?:expertise|experience).*?(?:developer|engineer|professional)'),
+    re.compile(r'professional.*?with\s*(\d+)\s*years?'),
+)
+
+# "(3 years)" and "(6 months)" in one pass; group 2 tells which it was
+EXPLICIT_DURATION = re.compile(r'\((\d+)\s*(years?|months?)\)')
+
+GRADUATION_YEAR = re.compile(r'\b(19|20)\d{2}\b')
+
+
+def find_title_matches(pattern, titles, text: str) -> List[Tuple[str, ...]]:
+    """Same result as ``pattern.findall(text)`` for an EXPERIENCE_ENTRIES pattern.
+
+    Those patterns start with ``[A-Z][a-zA-Z\\s]+`` followed by a job title,
+    which makes findall() quadratic: from every letter the engine runs to the
+    end of the letters-and-spaces run and backtracks looking for a title.
+    A match can only start inside a run that contains a title at least two
+    characters further on, so every other start position is skipped and
+    only the remaining ones are tried, in order, exactly as findall would.
+    """
+    matches = []
+    position = 0
+    for run in _TITLE_RUN.finditer(text):
+        last_title = None
+        for title in titles.finditer(text, run.start(), run.end()):
+            last_title = title.start()
+        if last_title is None:
+            continue
+
+        start = max(run.start(), position)
+        while start <= last_title - 2:
+            match = pattern.match(text, start)
+            if match:
+                matches.append(match.groups(default=''))
+                position = start = match.end()
+            else:
+                start += 1
+    return matches
@@ -0,0 +1,166 @@
+import json
+import logging
+from typing import Dict, List, Optional
+from sqlalchemy import column, func, or_, select, table, text
+from sqlalchemy.exc import OperationalError
+from config.database import db
+from models.job_model import JobDescription
+from models.resume_model import Resume
+
+# SQLite FTS5 table with the trigram tokenizer: a quoted phrase in a MATCH
+# query finds that substring in any of its columns from the index instead
+# of scanning every resume. The rowid is the resume id. All text is stored
+# lowercased.
+SEARCH_TABLE = 'resume_search'
+
+# The trigram index cannot look up shorter terms; they fall back to LIKE
+MIN_INDEXED_TERM = 3
+
+# Skills are stored one per line with newlines at both ends, so one column
+# serves both substring search and exact "has this skill" filters
+SKILL_SEPARATOR = '\n'
+
+
+def create_search_table():
+    """Create the search index table if it is missing (SQLite only)"""
+    if db.engine.dialect.name != 'sqlite':
+        logging.warning("Resume search index requires SQLite FTS5; search is disabled")
+        return
+    try:
+        with db.engine.connect() as connection:
+            connection.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                "candidate_name, skills, education, job_title, tokenize='trigram')"
+            ))
+            connection.commit()
+    except OperationalError as e:
+        # SQLite built without FTS5, or older than 3.34 (no trigram tokenizer)
+        logging.warning(f"Could not create the resume search index, search will scan instead: {e}")
+        return
+    _indexed_engines.add(db.engine)
+
+
+# Engines known to have the search table. Only hits are remembered, so a
+# table created later by migrate_resume_search.py is picked up.
+_indexed_engines = set()
+
+
+def search_index_available() -> bool:
+    """Whether the current database has the search table"""
+    engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return False
+    if engine not in _indexed_engines:
+        found = db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': SEARCH_TABLE}
+        ).first()
+        if not found:
+            return False
+        _indexed_engines.add(engine)
+    return True
+
+
+def search_document(resume, parsed_data: Optional[Dict] = None) -> Dict[str, str]:
+    """The searchable text of a resume, as stored in the index"""
+    parsed_data = parsed_data if parsed_data is not None else (resume.get_parsed_data() or {})
+    return build_search_document(resume.candidate.name if resume.candidate else None,
+                                 resume.job.title if resume.job else None, parsed_data)
+
+
+def build_search_document(candidate_name: Optional[str], job_title: Optional[str], parsed_data: Dict) -> Dict[str, str]:
+    """search_document from plain column values, for bulk indexing without loading Resume rows"""
+    skills = [skill.lower() for skill in parsed_data.get('skills', []) if isinstance(skill, str)]
+    education = [
+        f"{edu.get('degree', '')} {edu.get('field', '')} {edu.get('institution', '')}".lower()
+        for edu in parsed_data.get('education', []) if isinstance(edu, dict)
+    ]
+    return {
+        'candidate_name': (candidate_name or '').lower(),
+        'skills': SKILL_SEPARATOR + SKILL_SEPARATOR.join(skills) + SKILL_SEPARATOR if skills else '',
+        'education': '\n'.join(education),
+        'job_title': (job_title or '').lower()
+    }
+
+
+def index_resume(resume, parsed_data: Optional[Dict] = None):
+    """Insert or replace a resume's index entry in the current transaction"""
+    if not search_index_available():
+        return
+    document = search_document(resume, parsed_data)
+    db.session.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :resume_id"),
+                       {'resume_id': resume.id})
+    db.session.execute(text(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, candidate_name, skills, education, job_title) "
+        "VALUES (:resume_id, :candidate_name, :skills, :education, :job_title)"
+    ), {'resume_id': resume.id, **document})
+
+
+def reindex_job_title(job):
+    """Refresh the job title stored for every resume submitted to a job"""
+    if not search_index_available():
+        return
+    db.session.execute(text(
+        f"UPDATE {SEARCH_TABLE} SET job_title = :job_title "
+        "WHERE rowid IN (SELECT id FROM resumes WHERE job_id = :job_id)"
+    ), {'job_title': (job.title or '').lower(), 'job_id': job.id})
+
+
+def _phrase(term: str) -> str:
+    """FTS5 string literal matching ``term`` exactly (a substring, under trigram)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def search_resume_ids(search_query: str):
+    """Subquery of resume ids whose name, skills, job title or education contains the text"""
+    term = search_query.lower()
+    if not search_index_available():
+        return _unindexed_search_ids(term)
+
+    if len(term) >= MIN_INDEXED_TERM:
+        return text(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :phrase").bindparams(
+            phrase=_phrase(term)
+        )
+    # Too short for trigrams: every row is scanned whatever the query looks like
+    table = _search_table()
+    return select(table.c.rowid).where(or_(*(
+        table.c[column].contains(term, autoescape=True)
+        for column in ('candidate_name', 'skills', 'job_title', 'education')
+    )))
+
+
+def skill_resume_ids(skills: List[str]):
+    """Subquery of resume ids that list every one of ``skills`` (case-insensitive)"""
+    if not search_index_available():
+        return _unindexed_skill_ids(skills)
+
+    # Delimited skills are always long enough for the trigram index
+    query = ' AND '.join(
+        f"skills : {_phrase(SKILL_SEPARATOR + skill.lower() + SKILL_SEPARATOR)}" for skill in skills
+    )
+    return text(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :query").bindparams(query=query)
+
+
+def _search_table():
+    return table(SEARCH_TABLE, column('rowid'), column('candidate_name'), column('skills'),
+                 column('job_title'), column('education'))
+
+
+# Without the search table (databases other than SQLite, or before
+# migrate_resume_search.py has run) the filters use LIKE on the resume rows
+# themselves. Skills and education are looked for anywhere in the parsed
+# JSON, so these can return more resumes than the index would.
+
+def _unindexed_search_ids(term: str):
+    return select(Resume.id).outerjoin(JobDescription, Resume.job_id == JobDescription.id).where(or_(
+        func.lower(Resume.candidate_name).contains(term, autoescape=True),
+        func.lower(JobDescription.title).contains(term, autoescape=True),
+        func.lower(Resume.parsed_data).contains(term, autoescape=True)
+    ))
+
+
+def _unindexed_skill_ids(skills: List[str]):
+    # A skill is a whole JSON string in the parsed data: "python" with its quotes
+    return select(Resume.id).where(*(
+        func.lower(Resume.parsed_data).contains(json.dumps(skill.lower()), autoescape=True)
+        for skill in skills
+    ))
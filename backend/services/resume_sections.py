@@ -0,0 +1,83 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Header vocabulary per section. A header line is one of these phrases,
+# optionally between qualifier words ("Work Experience", "Technical Skills",
+# "Experience Summary", "Education and Training") and followed by a second
+# heading ("Education & Certifications"), a parenthetical ("Experience
+# (5 years)") or a colon; the first phrase decides the section. Anything else
+# on the line, as in "Key Achievements:" under a job or "5 years of
+# experience", is not a header.
+SECTION_HEADERS = {
+    'experience': ('experience', 'work history', 'employment', 'employment history', 'career',
+                   'career history', 'internship', 'internships'),
+    'education': ('education', 'academic', 'academics', 'academic background', 'qualification',
+                  'qualifications'),
+    'skills': ('skills', 'competencies'),
+    'projects': ('projects', 'project', 'project work'),
+    'certifications': ('certifications', 'certificates', 'licenses'),
+}
+QUALIFIERS = ('work', 'professional', 'relevant', 'technical', 'core', 'key', 'academic', 'educational',
+              'internship', 'personal', 'selected', 'other', 'additional')
+# Words that may follow a phrase, optionally after "and" or "&"
+TRAILERS = ('details', 'summary', 'history', 'training', 'undertaken', 'qualification', 'qualifications')
+
+_HEADER_SECTION = {phrase: section for section, phrases in SECTION_HEADERS.items() for phrase in phrases}
+
+
+def _alternation(words) -> str:
+    # Longest first, so a phrase is tried before any shorter phrase it starts with
+    return '|'.join(re.escape(word).replace(r'\ ', r'\s+') for word in sorted(words, key=len, reverse=True))
+
+
+_QUALIFIED = rf'(?:(?:{_alternation(QUALIFIERS)})\s+)*'
+_TRAILED = rf'(?:\s+(?:(?:and|&)\s+)?(?:{_alternation(TRAILERS)}))*'
+_HEADING = rf'{_QUALIFIED}(?:{_alternation(_HEADER_SECTION)}){_TRAILED}'
+HEADER = re.compile(
+    rf'[^\w]*{_QUALIFIED}({_alternation(_HEADER_SECTION)}){_TRAILED}'
+    rf'(?:\s*(?:&|/|,|and)\s*{_HEADING})*(?:\s*\([^()]*\))?\s*:?\s*',
+    re.IGNORECASE
+)
+
+
+def classify_header(line: str) -> Optional[str]:
+    """Section a line starts, or None if the line is not a section header"""
+    match = HEADER.fullmatch(line.strip())
+    if not match:
+        return None
+    return _HEADER_SECTION[' '.join(match.group(1).lower().split())]
+
+
+class ResumeSections:
+    """A resume's lines, split once, and the line span of each section.
+
+    ``spans`` maps a section name to ``(start, end)`` line indexes: the lines
+    after its header up to the next header of any section. Only the first
+    occurrence of a section is kept.
+    """
+
+    def __init__(self, text: str):
+        self.lines = text.split('\n')
+        self.spans: Dict[str, Tuple[int, int]] = {}
+
+        current, start = None, 0
+        for index, line in enumerate(self.lines):
+            section = classify_header(line)
+            if section is None:
+                continue
+            if current is not None and current not in self.spans:
+                self.spans[current] = (start, index)
+            current, start = section, index + 1
+        if current is not None and current not in self.spans:
+            self.spans[current] = (start, len(self.lines))
+
+    def section_lines(self, name: str) -> List[str]:
+        """Lines of a section, without its header ([] if the resume has none)"""
+        if name not in self.spans:
+            return []
+        start, end = self.spans[name]
+        return self.lines[start:end]
+
+    def section_text(self, name: str) -> str:
+        """A section as text, every line newline-terminated"""
+        return ''.join(line + '\n' for line in self.section_lines(name))
@@ -0,0 +1,107 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+
+class SkillMatcher:
+    """Find every vocabulary skill in a text with one compiled pattern.
+
+    Two kinds of entries are supported, mirroring how resumes are scanned:
+
+    * ``skills`` match anywhere in the text, as plain substrings
+      ("java" is found inside "javascript").
+    * ``aliases`` only match as whole words and map to a display name
+      ("js" -> "JavaScript", but not inside "nodejs").
+
+    All entries are compiled into a single trie-shaped regex inside a
+    lookahead, so the text is scanned once and overlapping entries are all
+    seen: at each position the regex reports the longest entry, and the
+    shorter entries it starts with are looked up from a precomputed table.
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        aliases = aliases or {}
+        # Lowercase entries are shown title-cased; mixed-case ones ("GraphQL") as written
+        self.skill_names = {skill.lower(): skill.title() if skill.islower() else skill for skill in skills}
+        self.aliases = {alias.lower(): name for alias, name in aliases.items()}
+
+        trie = _build_trie(set(self.skill_names) | set(self.aliases))
+        # Entries implied by each longest match: itself plus the entries it starts with
+        self._prefixes = _prefix_table(trie)
+        self._pattern = re.compile(f'(?=({_trie_pattern(trie)}))') if trie else None
+
+    def find(self, text_lower: str) -> List[str]:
+        """Display names of the skills found in already-lowercased text"""
+        found = set()
+        if self._pattern is None:
+            return []
+
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            for entry in self._prefixes[match.group(1)]:
+                if entry in self.skill_names:
+                    found.add(self.skill_names[entry])
+                if entry in self.aliases and _is_whole_word(text_lower, start, start + len(entry)):
+                    found.add(self.aliases[entry])
+
+        return sorted(found)
+
+
+def _is_word_char(char: str) -> bool:
+    # Same definition of a word character as re's \b on str patterns
+    return char.isalnum() or char == '_'
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Equivalent of re's \\b at ``index``"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Equivalent of matching text[start:end] between two \\b anchors"""
+    return _is_boundary(text, start) and _is_boundary(text, end)
+
+
+def _build_trie(words: Iterable[str]) -> Dict:
+    """Nested character dicts; the '' key marks the end of a word"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = word
+    return trie
+
+
+def _prefix_table(trie: Dict) -> Dict[str, List[str]]:
+    """Map each word to the words it starts with (itself included), in one trie walk"""
+    table = {}
+    stack = [(trie, [])]
+    while stack:
+        node, prefixes = stack.pop()
+        if '' in node:
+            prefixes = prefixes + [node['']]
+            table[node['']] = prefixes
+        for char, child in node.items():
+            if char:
+                stack.append((child, prefixes))
+    return table
+
+
+def _trie_pattern(trie: Dict) -> str:
+    """Regex matching the longest word of ``trie`` at a position.
+
+    Sharing prefixes keeps the alternation from retrying every entry at
+    every character; greedy optional tails make the longest entry win.
+    """
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return f'(?:{body})?'
+        return body
+
+    return build(trie)
@@ -0,0 +1,120 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Fuzzy scores at or below this are treated as no match
+FUZZY_THRESHOLD = 0.7
+
+
+def char_count_matrix(strings: Sequence[str], alphabet: Dict[str, int]) -> np.ndarray:
+    """One row of character counts per string"""
+    counts = np.zeros((len(strings), len(alphabet)), dtype=np.int32)
+    for row, string in enumerate(strings):
+        for char in string:
+            counts[row, alphabet[char]] += 1
+    return counts
+
+
+def fuzzy_candidates(job_skills: Sequence[str], resume_skills: Sequence[str]) -> np.ndarray:
+    """Boolean matrix marking the (job, resume) skill pairs that can score above zero.
+
+    Both lists must already be lowercased. ``SequenceMatcher.ratio()`` never
+    exceeds ``quick_ratio()``, the character-multiset overlap, which is a
+    single vectorized ``np.minimum`` over count matrices. Pairs whose bound is
+    at most FUZZY_THRESHOLD cannot pass the threshold, unless one string is a
+    substring of the other (those get a flat 0.8); a substring's characters
+    are all contained in the longer string, so such pairs show up as an
+    overlap equal to the shorter length and are kept as well.
+    """
+    if not job_skills or not resume_skills:
+        return np.zeros((len(job_skills), len(resume_skills)), dtype=bool)
+
+    alphabet = {}
+    for string in (*job_skills, *resume_skills):
+        for char in string:
+            alphabet.setdefault(char, len(alphabet))
+
+    job_counts = char_count_matrix(job_skills, alphabet)
+    resume_counts = char_count_matrix(resume_skills, alphabet)
+    overlap = np.minimum(job_counts[:, None, :], resume_counts[None, :, :]).sum(axis=2)
+
+    job_lengths = job_counts.sum(axis=1)[:, None]
+    resume_lengths = resume_counts.sum(axis=1)[None, :]
+    total_lengths = job_lengths + resume_lengths
+
+    # Same arithmetic as difflib's quick_ratio, so the comparison is exact
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upper_bound = np.where(total_lengths > 0, 2.0 * overlap / total_lengths, 1.0)
+    maybe_substring = overlap == np.minimum(job_lengths, resume_lengths)
+    return (upper_bound > FUZZY_THRESHOLD) | maybe_substring
+
+
+def candidate_indices(job_skills: Sequence[str], resume_skills: Sequence[str]) -> List[List[int]]:
+    """For each job skill, the resume skill positions worth an exact fuzzy comparison"""
+    candidates = fuzzy_candidates(job_skills, resume_skills)
+    return [np.flatnonzero(row).tolist() for row in candidates]
+
+
+class SimilarityCache:
+    """Process-wide LRU of skill-pair similarities.
+
+    Keys are the ordered pair of lowercased skills (difflib's ratio is not
+    symmetric). Synonym resolution feeds into the cached values, so the
+    cache empties itself whenever the skills taxonomy version changes.
+    Each worker process has its own cache and counters.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else \
+            int(os.getenv('SKILL_SIMILARITY_CACHE_SIZE', '100000'))
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Tuple[str, str], version: str, compute: Callable[[], float]) -> float:
+        """Cached similarity for a pair, computing and storing it on a miss"""
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            similarity = self._entries.get(key)
+            if similarity is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return similarity
+            self.misses += 1
+
+        similarity = compute()
+        if self.max_entries <= 0:
+            return similarity
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = similarity
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return similarity
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters for the metrics endpoint"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+
+# Global instance
+similarity_cache = SimilarityCache()
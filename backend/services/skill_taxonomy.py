@@ -0,0 +1,164 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import AbstractSet, Dict, List, Optional, Tuple
+from services.skill_matcher import SkillMatcher
+
+DEFAULT_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'skills_taxonomy.json'
+)
+
+
+class SkillTaxonomy:
+    """Compiled, read-only view of the skills taxonomy file.
+
+    The file has three sections:
+
+    * ``categories``: category name -> canonical skills, matched anywhere in resume text
+    * ``abbreviations``: short form -> display name, matched as whole words
+    * ``synonyms``: main skill -> alternative names the job matcher treats as equal
+
+    Everything callers need per lookup is precomputed here, so a new
+    instance is built on reload and swapped in whole.
+    """
+
+    def __init__(self, data: Dict, version: Optional[str] = None):
+        self.version = version or str(data.get('version', ''))
+        skills = []
+        self.categories = {}
+        for category, category_skills in data.get('categories', {}).items():
+            for skill in category_skills:
+                skills.append(skill)
+                self.categories.setdefault(skill.lower(), category)
+        self.abbreviations = {abbr.lower(): name for abbr, name in data.get('abbreviations', {}).items()}
+        self.synonyms = {main.lower(): [s.lower() for s in synonyms]
+                         for main, synonyms in data.get('synonyms', {}).items()}
+
+        self.matcher = SkillMatcher(skills, self.abbreviations)
+        self._variants = self._build_variants()
+        self._skill_ids, next_id = self._build_skill_ids()
+        # Names outside every synonym group get an ID hashed from the name, above
+        # every group ID, so resumes full of one-off skills never grow the table
+        self._unknown_base = next_id
+
+    def _build_variants(self) -> Dict[str, frozenset]:
+        # A name maps to every group it belongs to, as a main skill or as a synonym
+        variants = {}
+        for main_skill, synonyms in self.synonyms.items():
+            variants.setdefault(main_skill, {main_skill}).update(synonyms)
+            for synonym in synonyms:
+                variants.setdefault(synonym, {synonym}).update([main_skill, *synonyms])
+        return {name: frozenset(names) for name, names in variants.items()}
+
+    def _build_skill_ids(self) -> Tuple[Dict[str, int], int]:
+        # Synonym groups that share a name describe one skill and get one ID
+        skill_ids = {}
+        next_id = 0
+        for main_skill, synonyms in self.synonyms.items():
+            names = [main_skill, *synonyms]
+            overlapping = {skill_ids[name] for name in names if name in skill_ids}
+            if overlapping:
+                group_id = min(overlapping)
+                for name, skill_id in skill_ids.items():
+                    if skill_id in overlapping:
+                        skill_ids[name] = group_id
+            else:
+                group_id = next_id
+                next_id += 1
+            for name in names:
+                skill_ids[name] = group_id
+        return skill_ids, next_id
+
+    def find_skills(self, text: str) -> List[str]:
+        """Display names of the taxonomy skills mentioned in a text"""
+        return self.matcher.find(text.lower())
+
+    def variants(self, skill: str) -> AbstractSet[str]:
+        """A skill name together with all of its synonyms"""
+        skill_lower = skill.lower().strip()
+        return self._variants.get(skill_lower) or frozenset((skill_lower,))
+
+    def skill_id(self, skill: str) -> int:
+        """Canonical integer ID; synonyms of one skill share it"""
+        skill_lower = skill.lower().strip()
+        skill_id = self._skill_ids.get(skill_lower)
+        if skill_id is None:
+            digest = hashlib.blake2b(skill_lower.encode('utf-8'), digest_size=8).digest()
+            skill_id = self._unknown_base + int.from_bytes(digest, 'big')
+        return skill_id
+
+    def category(self, skill: str) -> Optional[str]:
+        return self.categories.get(skill.lower().strip())
+
+
+class TaxonomyLoader:
+    """Loads the taxonomy once and reloads it when the file changes.
+
+    The file's mtime is checked at most every ``check_interval`` seconds.
+    A changed file is compiled into a new SkillTaxonomy off to the side and
+    then swapped in, so concurrent readers always see a complete index; a
+    file that fails to load leaves the previous taxonomy in place.
+    """
+
+    def __init__(self, path: Optional[str] = None, check_interval: Optional[float] = None):
+        self.path = path or os.getenv('SKILLS_TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)
+        self.check_interval = check_interval if check_interval is not None else \
+            float(os.getenv('SKILLS_TAXONOMY_CHECK_SECONDS', '5'))
+        self._taxonomy = None
+        self._mtime = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> SkillTaxonomy:
+        """Current taxonomy, reloading it first if the file has changed"""
+        now = time.monotonic()
+        if self._taxonomy is None or now >= self._next_check:
+            with self._lock:
+                if self._taxonomy is None or now >= self._next_check:
+                    self._next_check = now + self.check_interval
+                    self._reload_if_changed()
+        return self._taxonomy
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            if self._taxonomy is None:
+                raise
+            logging.error(f"Skills taxonomy unavailable, keeping version {self._taxonomy.version}: {e}")
+            return
+
+        if mtime == self._mtime:
+            return
+
+        try:
+            with open(self.path, 'rb') as taxonomy_file:
+                content = taxonomy_file.read()
+            data = json.loads(content)
+            # Include a content digest so edits that forget to bump "version" still invalidate caches
+            digest = hashlib.sha256(content).hexdigest()[:8]
+            taxonomy = SkillTaxonomy(data, version=f"{data.get('version', '')}-{digest}")
+        except Exception as e:
+            # Unreadable, invalid JSON or the wrong shape: nothing to fall back to on first load
+            if self._taxonomy is None:
+                raise
+            logging.error(f"Failed to reload skills taxonomy, keeping version {self._taxonomy.version}: {e}")
+            # Remember the bad file so it is not parsed again until it changes
+            self._mtime = mtime
+            return
+
+        self._taxonomy, self._mtime = taxonomy, mtime
+        logging.info(f"Loaded skills taxonomy {taxonomy.version} "
+                     f"({len(taxonomy.categories)} skills, {len(taxonomy.abbreviations)} abbreviations)")
+
+
+# Global instance
+taxonomy_loader = TaxonomyLoader()
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Shared taxonomy for the parser and matcher"""
+    return taxonomy_loader.get()
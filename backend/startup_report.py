@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Report where API process startup time goes
+
+Imports the app in a fresh interpreter under ``python -X importtime`` and
+summarizes the cost per module, then times create_app() and the first
+request in-process.
+
+Usage:
+    python startup_report.py --top 15
+    DB_CREATE_ON_STARTUP=false python startup_report.py
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def import_times():
+    """(self_us, cumulative_us, depth, module) for every module the app imports"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return entries
+
+def print_import_report(entries, top):
+    total = next((cumulative for _, cumulative, _, module in entries if module == 'app'), 0)
+    print(f"import app: {total / 1000:.0f} ms")
+
+    # Direct imports of app.py: what each line at the top of the file costs
+    print("\nImported by app.py (cumulative):")
+    direct = sorted((e for e in entries if e[2] == 1), key=lambda e: e[1], reverse=True)
+    for _, cumulative, _, module in direct[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    # Self time summed per top-level package: which dependency is expensive
+    packages = {}
+    for self_us, _, _, module in entries:
+        package = module.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+    print("\nBy package (self time):")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+def print_boot_report():
+    start = time.perf_counter()
+    from app import create_app
+    imported = time.perf_counter()
+    app = create_app()
+    created = time.perf_counter()
+    response = app.test_client().get('/api/health')
+    served = time.perf_counter()
+
+    print("\nIn-process boot:")
+    print(f"  {(imported - start) * 1000:8.1f} ms  import app")
+    print(f"  {(created - imported) * 1000:8.1f} ms  create_app() (schema creation "
+          f"{'on' if app.config['DB_CREATE_ON_STARTUP'] else 'off'})")
+    print(f"  {(served - created) * 1000:8.1f} ms  first /api/health request ({response.status_code})")
+    print(f"  {(served - start) * 1000:8.1f} ms  total")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--top', type=int, default=15, help='rows per section')
+    args = parser.parse_args()
+
+    print_import_report(import_times(), args.top)
+    print_boot_report()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""Check ResumeParser extraction against the recorded fixture output"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_parser import check, load_corpus
+
+def test_extraction_fixtures():
+    print("Comparing extraction with tests/fixtures/resume_extraction_expected.json...")
+    assert check(load_corpus()) == 0
+    print("✓ All fixture resumes extract as recorded")
+
+if __name__ == "__main__":
+    test_extraction_fixtures()
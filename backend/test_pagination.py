@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Check keyset pagination cursors against a plain sort of the same rows"""
+
+import sys
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from config.database import db
+from models.job_model import JobDescription
+from models.resume_model import Resume
+from models.user_model import User
+from utils.pagination import decode_cursor, encode_cursor, keyset_paginate, parse_fields, project
+
+def create_test_app(directory):
+    with mock.patch.dict(os.environ, {'DATABASE_URL': 'sqlite:///' + os.path.join(directory, 'test.db')}):
+        return create_app()
+
+def add_resumes(count, seed=5):
+    """Resumes with many tied scores, names and upload times"""
+    rng = random.Random(seed)
+    hr = User(name='Hr Person', email='hr@example.com', password_hash='x', role='HR')
+    db.session.add(hr)
+    db.session.flush()
+    job = JobDescription(title='Python Developer', description_text='x', created_by=hr.id)
+    db.session.add(job)
+    db.session.flush()
+    start = datetime(2026, 1, 1)
+    for i in range(count):
+        db.session.add(Resume(
+            candidate_id=hr.id, job_id=job.id, filename='r.pdf', file_path='r.pdf',
+            candidate_name=rng.choice(['Ana', 'ana', 'Bo', 'Cy']),
+            match_score=rng.choice([None, 0.0, 55.5, 70.0, 91.25]),
+            uploaded_at=start + timedelta(hours=rng.randint(0, 5))
+        ))
+    db.session.commit()
+
+def walk(query, sort_key, limit, descending):
+    """Ids of every page in order, following next cursors"""
+    ids, cursor, pages = [], None, 0
+    while True:
+        items, cursor = keyset_paginate(query, sort_key, Resume.id, cursor, limit, descending)
+        assert len(items) <= limit
+        ids.extend(item.id for item in items)
+        pages += 1
+        if cursor is None:
+            return ids, pages
+
+def test_cursor_encoding():
+    print("Testing cursor encoding...")
+    moment = datetime(2026, 3, 4, 5, 6, 7, 89)
+    for value in [moment, 55.5, 'ana', None, 0]:
+        assert decode_cursor(encode_cursor(value, 42)) == (value, 42)
+    for bad in ['', 'not-a-cursor', encode_cursor(1, 2)[:-3], 'e30']:
+        try:
+            decode_cursor(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad!r}")
+    print("✓ Cursors round-trip and tampered ones are rejected")
+
+def test_fields_projection():
+    print("Testing field projection...")
+    assert parse_fields(None) is None and parse_fields(' , ') is None
+    assert parse_fields('title, id,') == {'title', 'id'}
+    record = {'id': 1, 'title': 'Dev', 'resumes': []}
+    assert project(record, {'title'}) == {'id': 1, 'title': 'Dev'}
+    assert project(record, None) is record
+    print("✓ Only requested fields are kept, plus the id")
+
+def test_keyset_pages_match_sorted_rows():
+    print("Testing keyset pagination...")
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        with app.app_context():
+            add_resumes(97)
+            resumes = Resume.query.all()
+            scores = {r.id: r.match_score or 0.0 for r in resumes}
+            sort_keys = {
+                'match_score': (db.func.coalesce(Resume.match_score, 0.0), lambda r: r.match_score or 0.0),
+                'candidate_name': (db.func.lower(Resume.candidate_name), lambda r: r.candidate_name.lower()),
+                'uploaded_at': (Resume.uploaded_at, lambda r: r.uploaded_at),
+            }
+            for name, (sort_key, value) in sort_keys.items():
+                for descending in (True, False):
+                    expected = [r.id for r in sorted(resumes, key=lambda r: (value(r), r.id), reverse=descending)]
+                    for limit in (1, 7, 96, 97, 200):
+                        ids, pages = walk(Resume.query, sort_key, limit, descending)
+                        assert ids == expected, (name, descending, limit)
+                        assert pages == max(1, -(-len(expected) // limit))
+
+                    # Filtered queries page the same way
+                    high = Resume.query.filter(Resume.match_score >= 70)
+                    ids, _ = walk(high, sort_key, 10, descending)
+                    assert ids == [i for i in expected if scores[i] >= 70]
+
+            everything, cursor = keyset_paginate(Resume.query, Resume.uploaded_at, Resume.id)
+            assert len(everything) == 97 and cursor is None
+            assert keyset_paginate(Resume.query, Resume.uploaded_at, Resume.id, limit=0) == ([], None)
+    print("✓ Walking the cursors visits every row once, in sort order")
+
+if __name__ == "__main__":
+    test_cursor_encoding()
+    test_fields_projection()
+    test_keyset_pages_match_sorted_rows()
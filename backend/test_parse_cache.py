@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Check the parse cache key and its invalidation on parser/taxonomy version changes"""
+
+import sys
+import os
+import tempfile
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from services import parse_cache as cache_module
+from services.parse_cache import ParseCache, cache_version, hash_bytes, hash_file
+
+PARSED = {'parsing_status': 'success', 'skills': ['Python', 'SQL'], 'total_experience_years': 4}
+
+def create_test_app(directory):
+    with mock.patch.dict(os.environ, {'DATABASE_URL': 'sqlite:///' + os.path.join(directory, 'test.db')}):
+        return create_app()
+
+def test_content_hash():
+    print("Testing content hashes...")
+    content = b'%PDF-1.4 resume bytes'
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'resume.pdf')
+        with open(path, 'wb') as resume_file:
+            resume_file.write(content)
+        assert hash_file(path) == hash_bytes(content)
+        assert hash_bytes(memoryview(content)) == hash_bytes(content)
+
+        empty = os.path.join(directory, 'empty.pdf')
+        open(empty, 'wb').close()
+        assert hash_file(empty) == hash_bytes(b'')
+    assert hash_bytes(content) != hash_bytes(content + b' ')
+    print("✓ Same bytes give the same key, from a file or from memory")
+
+def test_parse_cache_versioning():
+    print("Testing parse cache hits and version invalidation...")
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        with app.app_context():
+            cache = ParseCache(max_entries=2)
+            key = hash_bytes(b'resume one')
+
+            assert cache.get(key) is None
+            cache.put(key, {**PARSED, 'match_details': {'overall_score': 80}})
+            hit = cache.get(key)
+            assert hit == PARSED  # Per-job match details are not cached
+            hit['skills'].append('Mutated')
+            assert cache.get(key) == PARSED  # Every hit is a fresh copy
+
+            # Failures are never cached
+            failed_key = hash_bytes(b'unreadable')
+            cache.put(failed_key, {'parsing_status': 'failed'})
+            assert cache.get(failed_key) is None
+
+            # Evicted from memory, still found in the table
+            cache.put(hash_bytes(b'resume two'), PARSED)
+            cache.put(hash_bytes(b'resume three'), PARSED)
+            assert len(cache._memory) == 2
+            assert cache.get(key) == PARSED
+
+            # A parser version bump misses both the memory and the table
+            with mock.patch.object(cache_module, 'PARSER_VERSION', 'next'):
+                assert cache_version().startswith('next+')
+                assert cache.get(key) is None
+
+            # So does a taxonomy edit
+            taxonomy = mock.Mock(version='edited')
+            with mock.patch.object(cache_module, 'get_taxonomy', return_value=taxonomy):
+                assert cache.get(key) is None
+
+            assert cache.get(key) == PARSED
+    print("✓ Cache hits, misses after version changes and skips failures")
+
+if __name__ == "__main__":
+    test_content_hash()
+    test_parse_cache_versioning()
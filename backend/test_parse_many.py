@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Check that a file crashing its parse worker does not abort a parse_many batch"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services import resume_parser as parser_module
+
+def parse_or_crash(file_path):
+    """Stand-in for the worker entry point: kills the worker on 'crash' files"""
+    if 'crash' in file_path:
+        os._exit(1)
+    return {'parsing_status': 'success', 'file': file_path}
+
+def test_worker_crash_fails_only_its_file():
+    print("Parsing a batch in which one file kills its worker...")
+    original = parser_module._parse_in_worker
+    parser_module._parse_in_worker = parse_or_crash  # Forked workers inherit the patch
+    try:
+        files = [f"resume_{i}.pdf" for i in range(12)]
+        files[5] = "resume_crash.pdf"
+        results = dict(parser_module.resume_parser.parse_many(files, workers=2))
+    finally:
+        parser_module._parse_in_worker = original
+
+    assert sorted(results) == sorted(files)
+    failed = [path for path, data in results.items() if data['parsing_status'] == 'failed']
+    assert failed == ["resume_crash.pdf"], failed
+    for path in files:
+        if path != "resume_crash.pdf":
+            assert results[path]['file'] == path
+    print(f"✓ {len(files) - 1} files parsed, only the crashing one failed")
+
+if __name__ == "__main__":
+    test_worker_crash_fails_only_its_file()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Check how the parse queue writes results and failures back to Resume rows"""
+
+import sys
+import os
+import multiprocessing
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from docx import Document
+from sqlalchemy import text
+from app import create_app
+from config.database import db
+from models.job_model import JobDescription
+from models.resume_model import Resume
+from models.user_model import User
+from services import parse_queue as queue_module
+from services.parse_queue import ParseQueue
+from services.resume_search import SEARCH_TABLE
+
+def create_test_app(directory):
+    with mock.patch.dict(os.environ, {'DATABASE_URL': 'sqlite:///' + os.path.join(directory, 'test.db')}):
+        return create_app()
+
+def create_queue(app, workers=0):
+    """A queue bound to the app, dispatched by hand instead of by its thread"""
+    parse_queue = ParseQueue()
+    parse_queue.init_app(app)
+    parse_queue.workers = workers
+    parse_queue._slots = threading.BoundedSemaphore(max(workers, 1))
+    return parse_queue
+
+def add_queued_resume(directory, filename, content):
+    path = os.path.join(directory, filename)
+    with open(path, 'wb') as resume_file:
+        resume_file.write(content)
+    hr = User.query.filter_by(email='hr@example.com').first()
+    if hr is None:
+        hr = User(name='Hr Person', email='hr@example.com', password_hash='x', role='HR')
+        db.session.add(hr)
+        db.session.flush()
+        db.session.add(JobDescription(title='Python Developer', description_text='Python and SQL',
+                                      created_by=hr.id))
+        db.session.flush()
+    job = JobDescription.query.first()
+    resume = Resume(candidate_id=hr.id, job_id=job.id, filename=filename, file_path=path, parse_status='queued')
+    db.session.add(resume)
+    db.session.commit()
+    return resume.id
+
+def docx_bytes(*paragraphs):
+    document = Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def crash_or_score(source, job_profile, file_type=None):
+    """parse_and_score stand-in whose worker dies on files named crash*"""
+    if os.path.basename(source).startswith('crash'):
+        os._exit(1)
+    time.sleep(0.5)  # Still in flight when the crash takes the pool down
+    return {'parsing_status': 'success', 'skills': ['Python']}, 75.0
+
+def indexed(resume_id):
+    return db.session.execute(text(f"SELECT 1 FROM {SEARCH_TABLE} WHERE rowid = :id"), {'id': resume_id}).first()
+
+def test_unparseable_resume_fails():
+    print("Testing an unreadable upload...")
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        parse_queue = create_queue(app)
+        with app.app_context():
+            good = add_queued_resume(directory, 'good.docx', docx_bytes('Jane Doe', 'Skills', 'Python, SQL'))
+            bad = add_queued_resume(directory, 'bad.pdf', b'%PDF-1.4 truncated')
+
+        for resume_id in (good, bad):
+            parse_queue._slots.acquire()
+            parse_queue._dispatch(resume_id)
+
+        with app.app_context():
+            resume = db.session.get(Resume, good)
+            assert resume.parse_status == 'scored' and resume.match_score > 0
+            assert indexed(good)
+
+            resume = db.session.get(Resume, bad)
+            assert resume.parse_status == 'failed' and resume.match_score == 0
+            assert resume.get_parsed_data()['parsing_status'] == 'failed'
+            assert not indexed(bad)
+        # Every slot was given back
+        assert parse_queue._slots.acquire(blocking=False)
+    print("✓ Unreadable files end up failed, unscored and unindexed")
+
+def test_dispatch_error_after_claim_fails():
+    print("Testing an error after a resume is claimed...")
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        parse_queue = create_queue(app)
+        with app.app_context():
+            resume_id = add_queued_resume(directory, 'good.docx', docx_bytes('Jane Doe', 'Skills', 'Python'))
+
+        # e.g. the job was deleted between upload and dispatch
+        with mock.patch.object(queue_module, 'get_job_profile', side_effect=AttributeError('no job')):
+            parse_queue._slots.acquire()
+            parse_queue._dispatch(resume_id)
+
+        with app.app_context():
+            resume = db.session.get(Resume, resume_id)
+            assert resume.parse_status == 'failed' and resume.match_score == 0
+        assert parse_queue._slots.acquire(blocking=False)
+
+        # Recovery leaves it alone instead of retrying it forever
+        parse_queue._recover()
+        assert parse_queue._queue.empty()
+    print("✓ The claimed row is failed, not left parsing")
+
+def test_worker_crash_fails_only_its_resume():
+    print("Testing a worker crash with other resumes in flight...")
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        parse_queue = create_queue(app, workers=4)
+        # Forked workers see the patched parse_and_score
+        parse_queue._create_executor = lambda workers=None: ProcessPoolExecutor(
+            workers or parse_queue.workers, mp_context=multiprocessing.get_context('fork'))
+        with app.app_context():
+            crash = add_queued_resume(directory, 'crash.docx', b'x')
+            others = [add_queued_resume(directory, f'good{i}.docx', b'x') for i in range(3)]
+
+        with mock.patch.object(queue_module, 'parse_and_score', crash_or_score):
+            first_pool = parse_queue._executor = parse_queue._create_executor()
+            for resume_id in others + [crash]:
+                parse_queue._slots.acquire()
+                parse_queue._dispatch(resume_id)
+            # Every slot comes back once all four are written back
+            for _ in range(4):
+                assert parse_queue._slots.acquire(timeout=30)
+
+        with app.app_context():
+            assert db.session.get(Resume, crash).parse_status == 'failed'
+            for resume_id in others:
+                resume = db.session.get(Resume, resume_id)
+                assert resume.parse_status == 'scored' and resume.match_score == 75.0
+        assert parse_queue._executor is not first_pool and first_pool._shutdown_thread
+        parse_queue._executor.shutdown()
+    print("✓ Only the resume that crashes a fresh pool again fails")
+
+if __name__ == "__main__":
+    test_unparseable_resume_fails()
+    test_dispatch_error_after_claim_fails()
+    test_worker_crash_fails_only_its_resume()
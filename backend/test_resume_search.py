@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Check resume search and skill filters against a plain scan of the same data"""
+
+import sys
+import os
+import random
+import tempfile
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app import create_app
+from config.database import db
+from models.job_model import JobDescription
+from models.resume_model import Resume
+from models.user_model import User
+from services import resume_search
+from services.resume_search import index_resume, reindex_job_title, search_resume_ids, skill_resume_ids
+
+NAMES = ['Priya Nair', 'John O. Doe', 'Alex Smith', 'Mei_Lin', '100% Ana']
+SKILLS = ['Python', 'C++', 'C#', 'SQL', 'PostgreSQL', 'React', 'Node.js', 'Machine Learning', 'Go', 'R']
+DEGREES = ['Bachelor of Science', 'MBA', 'B.Tech in IT', 'Master of Data_Science']
+
+def create_test_app(directory):
+    with mock.patch.dict(os.environ, {'DATABASE_URL': 'sqlite:///' + os.path.join(directory, 'test.db')}):
+        return create_app()
+
+def add_resumes(count, seed=11):
+    """Candidates, jobs and indexed resumes; returns the searchable text per resume id"""
+    rng = random.Random(seed)
+    hr = User(name='Hr Person', email='hr@example.com', password_hash='x', role='HR')
+    db.session.add(hr)
+    db.session.flush()
+    jobs = [JobDescription(title=title, description_text='x', created_by=hr.id)
+            for title in ('Python Developer', 'Data Analyst', 'Frontend Engineer')]
+    db.session.add_all(jobs)
+
+    for i in range(count):
+        candidate = User(name=rng.choice(NAMES), email=f'c{i}@example.com', password_hash='x', role='Candidate')
+        db.session.add(candidate)
+        db.session.flush()
+        resume = Resume(candidate_id=candidate.id, job_id=rng.choice(jobs).id, filename='r.pdf',
+                        file_path='r.pdf', candidate_name=candidate.name)
+        resume.set_parsed_data({
+            'skills': rng.sample(SKILLS, rng.randint(0, 4)),
+            'education': [{'degree': rng.choice(DEGREES), 'institution': 'State College'}][:rng.randint(0, 1)]
+        })
+        db.session.add(resume)
+        db.session.flush()
+        index_resume(resume)
+    db.session.commit()
+
+def reference_search(term):
+    """Resume ids the Python scan that search replaced would return"""
+    term = term.lower()
+    matches = set()
+    for resume in Resume.query.all():
+        parsed_data = resume.get_parsed_data()
+        education = [f"{e.get('degree', '')} {e.get('field', '')} {e.get('institution', '')}".lower()
+                     for e in parsed_data.get('education', [])]
+        if (term in resume.candidate.name.lower() or term in resume.job.title.lower() or
+                any(term in skill.lower() for skill in parsed_data.get('skills', [])) or
+                any(term in edu for edu in education)):
+            matches.add(resume.id)
+    return matches
+
+def reference_skills(skills):
+    wanted = {skill.lower() for skill in skills}
+    return {resume.id for resume in Resume.query.all()
+            if wanted <= {skill.lower() for skill in resume.get_parsed_data().get('skills', [])}}
+
+def found(subquery):
+    return {resume.id for resume in Resume.query.filter(Resume.id.in_(subquery))}
+
+def test_search_and_skill_filters():
+    print("Testing resume search through the index...")
+    terms = ['pri', 'PYTHON', 'c++', 'c#', 'r', 'go', 'o.', '100%', 'mei_', 'i_l', '_', '%', 'data',
+             'state college', 'of science', 'frontend eng', 'n\\a', '"', 'klingon']
+    skill_sets = [['Python'], ['python', 'sql'], ['C++'], ['R'], ['Go', 'React', 'SQL'], ['Klingon']]
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        with app.app_context():
+            add_resumes(80)
+            assert resume_search.search_index_available()
+
+            for term in terms:
+                assert found(search_resume_ids(term)) == reference_search(term), term
+            for skills in skill_sets:
+                assert found(skill_resume_ids(skills)) == reference_skills(skills), skills
+
+            # Terms of three or more characters are looked up in the index, not scanned
+            compiled = search_resume_ids('python').compile()
+            plan = db.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"), compiled.params).fetchall()
+            assert any('INDEX 0:M' in row[-1] for row in plan), plan
+
+            # Retitled jobs are found under their new title
+            job = JobDescription.query.filter_by(title='Data Analyst').first()
+            job.title = 'Quantum Wrangler'
+            reindex_job_title(job)
+            db.session.commit()
+            assert found(search_resume_ids('wrangler')) == {resume.id for resume in job.resumes}
+    print("✓ Search and skill filters match a full scan and use the index")
+
+def test_without_search_table():
+    print("Testing search without the index table...")
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_test_app(directory)
+        with app.app_context():
+            db.session.execute(text(f"DROP TABLE {resume_search.SEARCH_TABLE}"))
+            db.session.commit()
+            resume_search._indexed_engines.clear()
+            assert not resume_search.search_index_available()
+
+            add_resumes(40)  # index_resume must not fail
+            for term in ['pri', 'python', 'college', 'analyst', '100%']:
+                assert reference_search(term) <= found(search_resume_ids(term)), term
+            for skills in [['Python'], ['python', 'sql'], ['C++']]:
+                assert found(skill_resume_ids(skills)) == reference_skills(skills), skills
+    print("✓ Uploads and filters keep working without the index")
+
+def test_without_trigram_tokenizer():
+    print("Testing startup on SQLite without the trigram tokenizer...")
+    def without_trigram(statement):
+        return text(statement.replace("'trigram'", "'no_such_tokenizer'"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        resume_search._indexed_engines.clear()
+        with mock.patch.object(resume_search, 'text', side_effect=without_trigram):
+            app = create_test_app(directory)  # Must not raise
+        with app.app_context():
+            assert not resume_search.search_index_available()
+            add_resumes(20)
+            for skills in [['Python'], ['C++']]:
+                assert found(skill_resume_ids(skills)) == reference_skills(skills), skills
+    print("✓ The app starts and filters fall back to scanning")
+
+if __name__ == "__main__":
+    test_search_and_skill_filters()
+    test_without_search_table()
+    test_without_trigram_tokenizer()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Check that EnhancedJobMatcher.score_batch gives exactly the score_profile results"""
+
+import sys
+import os
+import random
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services import enhanced_job_matcher as matcher_module
+from services.enhanced_job_matcher import enhanced_job_matcher
+
+SKILL_POOL = [
+    'Python', 'python', 'Java', 'JavaScript', 'React', 'ReactJS', 'Node.js', 'SQL', 'PostgreSQL',
+    'Postgres', 'AWS', 'Docker', 'K8s', 'Kubernetes', 'Git', 'C++', 'C#', 'Machine Learning', 'ML',
+    'HTML/CSS', 'css', 'Go', 'Rust', 'TypeScript', 'Flask', 'Django', 'REST', 'Linux', 'Agile'
+]
+
+JOBS = [
+    {'skills_required': ['Python', 'SQL'], 'skills_preferred': ['AWS', 'Docker'],
+     'experience_required': '3-5 years', 'requirements': 'Bachelor degree required'},
+    {'skills_required': ['React', 'JavaScript', 'HTML/CSS'], 'skills_preferred': [],
+     'experience_required': 'Senior', 'requirements': 'Master or PhD preferred'},
+    {'skills_required': [], 'skills_preferred': [], 'extracted_skills': ['Go', 'Kubernetes', 'Linux'],
+     'experience_required': 'minimum 2 years', 'description_text': 'We need a degree holder'},
+    {'skills_required': [], 'skills_preferred': [], 'experience_required': ''},
+]
+
+def random_resumes(count, seed=7):
+    rng = random.Random(seed)
+    resumes = []
+    for _ in range(count):
+        resumes.append({
+            'skills': rng.sample(SKILL_POOL, rng.randint(0, 10)),
+            'total_experience_years': rng.choice([0, 1, 2, 3.5, 4, 6, 9, 15]),
+            'education': rng.choice([[], [{'degree': 'Bachelor of Science'}], [{'degree': 'MBA'}]])
+        })
+    # Shapes only the scalar path handles
+    resumes.append({'skills': ['Python', None], 'total_experience_years': 3})
+    resumes.append({'skills': ['Python'], 'total_experience_years': '5'})
+    resumes.append({})
+    return resumes
+
+def test_score_batch_matches_score_profile():
+    print("Comparing score_batch with score_profile...")
+    resumes = random_resumes(60)
+    for job in JOBS:
+        profile = enhanced_job_matcher.build_job_profile(job)
+        expected = [enhanced_job_matcher.score_profile(resume, profile) for resume in resumes]
+        with mock.patch.object(matcher_module.logging, 'warning') as warning:
+            assert enhanced_job_matcher.score_batch(profile, resumes) == expected
+        assert not warning.called  # The array path ran, not the one-by-one fallback
+
+        # Several chunks give the same results as one
+        with mock.patch.object(matcher_module, 'SCORE_BATCH_CHUNK', 7):
+            assert enhanced_job_matcher.score_batch(profile, resumes) == expected
+    print(f"✓ {len(resumes)} resumes x {len(JOBS)} jobs score identically")
+
+if __name__ == "__main__":
+    test_score_batch_matches_score_profile()
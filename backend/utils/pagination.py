@@ -0,0 +1,85 @@
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import and_, or_
+
+
+def parse_fields(value: Optional[str]) -> Optional[Set[str]]:
+    """Field names from a comma separated ``fields=`` argument; None means all fields"""
+    fields = {field.strip() for field in (value or '').split(',') if field.strip()}
+    return fields or None
+
+
+def wants(fields: Optional[Set[str]], *names: str) -> bool:
+    """Whether a projection needs any of ``names``"""
+    return fields is None or any(name in fields for name in names)
+
+
+def project(record: Dict, fields: Optional[Set[str]]) -> Dict:
+    """Keep only the requested fields of a record (the id is always kept)"""
+    if fields is None:
+        return record
+    return {key: value for key, value in record.items() if key in fields or key == 'id'}
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    """Opaque cursor pointing just past a row"""
+    if isinstance(sort_value, datetime):
+        payload = {'dt': sort_value.isoformat(), 'id': row_id}
+    else:
+        payload = {'v': sort_value, 'id': row_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[object, int]:
+    """Sort value and id from a cursor; raises ValueError if it was tampered with"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if 'dt' in payload:
+            return datetime.fromisoformat(payload['dt']), int(payload['id'])
+        return payload['v'], int(payload['id'])
+    except (TypeError, KeyError, ValueError, AttributeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
+def keyset_paginate(query, sort_key, id_column, cursor: Optional[str] = None,
+                    limit: Optional[int] = None, descending: bool = True) -> Tuple[List, Optional[str]]:
+    """One page of ``query`` ordered by (sort_key, id), and the cursor for the next page.
+
+    Rows after the cursor are selected with a WHERE on the sort key instead
+    of an OFFSET, so fetching a later page costs the same as the first one.
+    Without a limit every remaining row is returned and the next cursor is None.
+    """
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        if descending:
+            query = query.filter(or_(sort_key < value, and_(sort_key == value, id_column < last_id)))
+        else:
+            query = query.filter(or_(sort_key > value, and_(sort_key == value, id_column > last_id)))
+
+    if descending:
+        query = query.order_by(sort_key.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_key.asc(), id_column.asc())
+    query = query.add_columns(sort_key)
+
+    if limit is None:
+        return [row[0] for row in query.all()], None
+    if limit <= 0:
+        return [], None
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row, last_value = rows[-1]
+        next_cursor = encode_cursor(last_value, getattr(last_row, id_column.key))
+    return [row[0] for row in rows], next_cursor
+
+
+def page_items(records: Iterable[Dict], fields: Optional[Set[str]]) -> List[Dict]:
+    """Project every record of a page"""
+    return [project(record, fields) for record in records]
@@ -3,10 +3,22 @@ import { useAuth } from '../../context/AuthContext';
 import apiService from '../../services/api';
 import JobApplicationModal from './JobApplicationModal';
 
+// Fields the job cards, application modal and applications tab render
+const JOB_FIELDS = [
+  'id', 'title', 'company', 'description_text', 'requirements', 'skills_required',
+  'skills_preferred', 'benefits', 'job_type', 'experience_required', 'location',
+  'salary_range', 'created_at'
+];
+const APPLICATION_FIELDS = [
+  'id', 'job_id', 'job_title', 'company', 'filename', 'match_score',
+  'status', 'parse_status', 'uploaded_at'
+];
+
 const CandidateDashboard = () => {
   const { user, logout } = useAuth();
   const [jobs, setJobs] = useState([]);
   const [applications, setApplications] = useState([]);
+  const [recommendations, setRecommendations] = useState([]);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('jobs'); // 'jobs' or 'applications'
   const [selectedJob, setSelectedJob] = useState(null);
@@ -20,12 +32,13 @@ const CandidateDashboard = () => {
     try {
       setLoading(true);
       const [jobsResponse, applicationsResponse] = await Promise.all([
-        apiService.getJobs(),
-        apiService.getMyApplications()
+        apiService.getJobs(false, JOB_FIELDS),
+        apiService.getMyApplications(APPLICATION_FIELDS)
       ]);
       
       setJobs(jobsResponse.jobs || []);
       setApplications(applicationsResponse.applications || []);
+      loadRecommendations(applicationsResponse.applications || []);
     } catch (error) {
       console.error('Failed to load dashboard data:', error);
     } finally {
@@ -33,6 +46,22 @@ const CandidateDashboard = () => {
     }
   };
 
+  const loadRecommendations = async (applicationList) => {
+    // Applications come newest first; recommend from the latest analyzed resume
+    const latestAnalyzed = applicationList.find(app => app.parse_status === 'scored');
+    if (!latestAnalyzed) {
+      setRecommendations([]);
+      return;
+    }
+    try {
+      const response = await apiService.getRecommendedJobs(latestAnalyzed.id, 5);
+      setRecommendations(response.recommendations || []);
+    } catch (error) {
+      console.error('Failed to load job recommendations:', error);
+      setRecommendations([]);
+    }
+  };
+
   const handleApplyToJob = (job) => {
     setSelectedJob(job);
     setShowApplicationModal(true);
@@ -182,6 +211,38 @@ const CandidateDashboard = () => {
           </div>
         </div>
 
+        {/* Jobs the latest resume matches best */}
+        {activeTab === 'jobs' && recommendations.length > 0 && (
+          <div className="bg-white shadow rounded-lg mb-6">
+            <div className="px-4 py-5 sm:p-6">
+              <h3 className="text-lg leading-6 font-medium text-gray-900 mb-4">Jobs You Match Best</h3>
+              <div className="space-y-3">
+                {recommendations.map(({ job, match_score, already_applied }) => (
+                  <div key={job.id} className="flex justify-between items-center border border-gray-200 rounded-lg p-4">
+                    <div>
+                      <h4 className="font-semibold text-gray-900">{job.title}</h4>
+                      <p className="text-sm text-gray-600">{job.company}</p>
+                    </div>
+                    <div className="flex items-center space-x-4">
+                      <span className="text-sm font-medium text-green-700">{match_score}% match</span>
+                      {already_applied ? (
+                        <span className="text-sm text-gray-500">Applied</span>
+                      ) : (
+                        <button
+                          onClick={() => handleApplyToJob(job)}
+                          className="bg-blue-600 text-white px-4 py-1 rounded-md hover:bg-blue-700 text-sm font-medium"
+                        >
+                          Apply Now
+                        </button>
+                      )}
+                    </div>
+                  </div>
+                ))}
+              </div>
+            </div>
+          </div>
+        )}
+
         {/* Content based on active tab */}
         {activeTab === 'jobs' && (
           <div className="bg-white shadow rounded-lg">
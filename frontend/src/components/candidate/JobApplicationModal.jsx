@@ -1,12 +1,19 @@
-import React, { useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import FileUpload from '../common/FileUpload';
 import apiService from '../../services/api';
 
+// Poll the parse status for at most two minutes
+const POLL_INTERVAL_MS = 1500;
+const MAX_POLLS = 80;
+
 const JobApplicationModal = ({ job, onClose, onApplicationSubmitted }) => {
   const [loading, setLoading] = useState(false);
   const [uploadStatus, setUploadStatus] = useState('');
   const [applicationResult, setApplicationResult] = useState(null);
   const [error, setError] = useState('');
+  const unmounted = useRef(false);
+
+  useEffect(() => () => { unmounted.current = true; }, []);
 
   const handleFileSelect = async (file, jobId) => {
     setLoading(true);
@@ -19,12 +26,14 @@ const JobApplicationModal = ({ job, onClose, onApplicationSubmitted }) => {
       formData.append('job_id', job.id);
 
       const response = await apiService.uploadResume(formData);
+      const resume = await waitForAnalysis(response.resume);
+      if (!resume) return; // Modal closed while waiting
       
-      setApplicationResult(response.resume);
+      setApplicationResult(resume);
       setUploadStatus('Application submitted successfully!');
       
       if (onApplicationSubmitted) {
-        onApplicationSubmitted(response.resume);
+        onApplicationSubmitted(resume);
       }
 
       // Auto close after 3 seconds
@@ -41,6 +50,22 @@ const JobApplicationModal = ({ job, onClose, onApplicationSubmitted }) => {
     }
   };
 
+  // Resumes are parsed in the background; poll until scoring finishes,
+  // the modal is closed (returns null) or the poll limit is reached
+  const waitForAnalysis = async (resume) => {
+    let current = resume;
+    for (let polls = 0; current.parse_status === 'queued' || current.parse_status === 'parsing'; polls++) {
+      if (polls >= MAX_POLLS) {
+        throw new Error('Your application was submitted, but analysis is taking longer than expected. Check My Applications later for the result.');
+      }
+      await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+      if (unmounted.current) return null;
+      const status = await apiService.getParseStatus(current.id);
+      current = status.resume || { ...current, parse_status: status.parse_status };
+    }
+    return current;
+  };
+
   const formatSkills = (skills) => {
     if (!skills || skills.length === 0) return 'None specified';
     return skills.slice(0, 5).join(', ') + (skills.length > 5 ? '...' : '');
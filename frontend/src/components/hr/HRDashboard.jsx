@@ -6,6 +6,13 @@ import EditJobModal from './EditJobModal';
 import JobAnalyticsModal from './JobAnalyticsModal';
 import ViewApplicationsModal from './ViewApplicationsModal';
 
+// Job fields the dashboard, edit and analytics views render
+const JOB_FIELDS = [
+  'id', 'title', 'company', 'description_text', 'requirements', 'skills_required',
+  'skills_preferred', 'benefits', 'job_type', 'experience_required', 'location',
+  'salary_range', 'created_at', 'is_active', 'view_count', 'archived_at', 'resumes_count'
+];
+
 const HRDashboard = () => {
   const { user, logout } = useAuth();
   const [stats, setStats] = useState({
@@ -37,19 +44,18 @@ const HRDashboard = () => {
     try {
       setLoading(true);
       const [jobsResponse, resumesResponse] = await Promise.all([
-        apiService.getJobs(true), // Include archived jobs for full stats
-        apiService.getResumes()
+        apiService.getJobs(true, JOB_FIELDS), // Include archived jobs for full stats
+        apiService.getResumes({ limit: 0 }) // Only the total is needed
       ]);
       
       const allJobs = jobsResponse.jobs || [];
-      const resumes = resumesResponse.resumes || [];
       
       setJobs(allJobs);
       setStats({
         totalJobs: allJobs.length,
         activeJobs: jobsResponse.active_count || 0,
         archivedJobs: jobsResponse.archived_count || 0,
-        totalApplications: resumes.length
+        totalApplications: resumesResponse.total || 0
       });
     } catch (error) {
       console.error('Failed to load dashboard data:', error);
@@ -67,7 +67,7 @@ const ViewApplicationsModal = ({ onClose, selectedJob }) => {
       if (sortOrder) filters.sort_order = sortOrder;
       
       const [jobsResponse, applicationsResponse] = await Promise.all([
-        apiService.getJobs(),
+        apiService.getJobs(false, ['id', 'title']),
         apiService.getResumes(filters)
       ]);
       
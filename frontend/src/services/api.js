@@ -116,9 +116,13 @@ class ApiService {
     });
   }
 
-  async getJobs(includeArchived = false) {
-    const params = includeArchived ? '?include_archived=true' : '';
-    return this.request(`/jobs/list${params}`, {
+  async getJobs(includeArchived = false, fields = null) {
+    const params = new URLSearchParams();
+    if (includeArchived) params.append('include_archived', 'true');
+    if (fields) params.append('fields', fields.join(','));
+    
+    const queryString = params.toString();
+    return this.request(queryString ? `/jobs/list?${queryString}` : '/jobs/list', {
       method: 'GET',
     });
   }
@@ -131,8 +135,21 @@ class ApiService {
     });
   }
 
-  async getMyApplications() {
-    return this.request('/resumes/my-applications', {
+  async getParseStatus(resumeId) {
+    return this.request(`/resumes/${resumeId}/parse-status`, {
+      method: 'GET',
+    });
+  }
+
+  async getRecommendedJobs(resumeId, limit = 10) {
+    return this.request(`/resumes/${resumeId}/recommended-jobs?limit=${limit}`, {
+      method: 'GET',
+    });
+  }
+
+  async getMyApplications(fields = null) {
+    const params = fields ? `?fields=${fields.join(',')}` : '';
+    return this.request(`/resumes/my-applications${params}`, {
       method: 'GET',
     });
   }